@@ -13,12 +13,13 @@ Examples:
     python fetch-satellite-sample.py --city hanoi
 """
 import argparse
-import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import uuid4
 
 # Add parent directory to path for imports
@@ -27,11 +28,30 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 try:
     import requests
     import numpy as np
+    import orjson
 except ImportError:
     print("Installing required packages...")
-    os.system("pip install requests numpy")
+    os.system("pip install requests numpy orjson")
     import requests
     import numpy as np
+    import orjson
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; large grids fall back to NumPy
+    njit = None
+    prange = range
+
+
+# Default PCG64 generator for direct calls to the mock generators; every
+# noise term is drawn from it in grid-sized batches.  ``fetch_sample_data``
+# passes each task its own generator spawned from ``--seed``.
+RNG = np.random.default_rng()
+
+
+# Grids with at least this many cells use the compiled numba kernel
+# (when numba is installed); smaller grids are not worth the JIT cost.
+NUMBA_MIN_CELLS = 10_000
 
 
 # City bounding boxes
@@ -71,40 +91,252 @@ CITY_BBOXES = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class BBox:
+    """Geographic bounding box in decimal degrees."""
+    
+    north: float
+    south: float
+    east: float
+    west: float
+    
+    @classmethod
+    def from_city(cls, city_info: Dict) -> "BBox":
+        """Build a bounding box from a ``CITY_BBOXES`` entry."""
+        return cls(
+            north=city_info["north"],
+            south=city_info["south"],
+            east=city_info["east"],
+            west=city_info["west"],
+        )
+    
+    @property
+    def center_lat(self) -> float:
+        return (self.north + self.south) / 2
+    
+    @property
+    def center_lon(self) -> float:
+        return (self.east + self.west) / 2
+
+
+def _grid_axes(bbox: BBox, rows: int, cols: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return evenly spaced grid axes spanning the bounding box.
+    
+    Latitudes are shaped ``(rows, 1)`` and longitudes ``(1, cols)`` so
+    that arithmetic between them broadcasts to the full ``(rows, cols)``
+    grid without an explicit Python loop.
+    """
+    lats = np.linspace(bbox.south, bbox.north, rows).reshape(rows, 1)
+    lons = np.linspace(bbox.west, bbox.east, cols).reshape(1, cols)
+    return lats, lons
+
+
+def _urban_field_kernel(
+    lats: np.ndarray,
+    lons: np.ndarray,
+    center_lat: float,
+    center_lon: float,
+    base: np.ndarray,
+    peak: float,
+    slope: float,
+    floor: float,
+    ceiling: float,
+) -> np.ndarray:
+    """Add the urban-center plume to ``base`` and clamp the result.
+    
+    Computes ``clip(base + max(0, peak - dist * slope), floor, ceiling)``
+    where ``dist`` is the degree distance of each cell to the center.
+    Written as explicit loops so numba can compile and parallelize it.
+    """
+    rows, cols = base.shape
+    values = np.empty_like(base)
+    # Loop invariants: squared longitude offsets are shared by every row,
+    # the latitude offset only changes per row.
+    dlon_sq = (lons - center_lon) ** 2
+    for i in prange(rows):
+        dlat_sq = (lats[i] - center_lat) ** 2
+        for j in range(cols):
+            dist = np.sqrt(dlat_sq + dlon_sq[j])
+            value = base[i, j] + max(0.0, peak - dist * slope)
+            values[i, j] = min(max(value, floor), ceiling)
+    return values
+
+
+if njit is not None:
+    _urban_field_jit = njit(parallel=True, fastmath=True)(_urban_field_kernel)
+
+
+def _urban_field(
+    lats: np.ndarray,
+    lons: np.ndarray,
+    center_lat: float,
+    center_lon: float,
+    base: np.ndarray,
+    peak: float,
+    slope: float,
+    floor: float,
+    ceiling: float = np.inf,
+) -> np.ndarray:
+    """Apply the urban-center effect to a grid of base values.
+    
+    Parameters
+    ----------
+    lats, lons : np.ndarray
+        Grid axes as returned by ``_grid_axes`` (column / row vectors).
+    center_lat, center_lon : float
+        Urban center of the bounding box.
+    base : np.ndarray
+        ``(rows, cols)`` background values including noise.
+    peak, slope : float
+        Urban effect is ``max(0, peak - dist * slope)``.
+    floor, ceiling : float
+        Clamp bounds for the resulting values.
+    """
+    if njit is not None and base.size >= NUMBA_MIN_CELLS:
+        return _urban_field_jit(
+            lats.ravel(), lons.ravel(), center_lat, center_lon,
+            base, peak, slope, floor, ceiling,
+        )
+    
+    dist_from_center = np.sqrt((lats - center_lat)**2 + (lons - center_lon)**2)
+    urban_effect = np.maximum(0, peak - dist_from_center * slope)
+    return np.clip(base + urban_effect, floor, ceiling)
+
+
+@dataclass
+class GridCells:
+    """Columnar (struct-of-arrays) grid cell payload.
+    
+    Each attribute is a flat array with one entry per grid cell.  The
+    per-cell ``{lat, lon, value, uncertainty}`` records are only built
+    when the payload is serialized to JSON.
+    """
+    
+    lats: np.ndarray
+    lons: np.ndarray
+    values: np.ndarray
+    uncertainties: np.ndarray
+    value_digits: int = 4
+    uncertainty_digits: int = 4
+    
+    @classmethod
+    def from_grid(
+        cls,
+        lats: np.ndarray,
+        lons: np.ndarray,
+        values: np.ndarray,
+        uncertainties: np.ndarray,
+        value_digits: int,
+        uncertainty_digits: int,
+    ) -> "GridCells":
+        """Flatten broadcast grid axes and value arrays into columns."""
+        lat_grid, lon_grid = np.broadcast_arrays(lats, lons)
+        return cls(
+            lats=lat_grid.ravel(),
+            lons=lon_grid.ravel(),
+            values=values.ravel(),
+            uncertainties=uncertainties.ravel(),
+            value_digits=value_digits,
+            uncertainty_digits=uncertainty_digits,
+        )
+    
+    def __len__(self) -> int:
+        return self.values.size
+    
+    def to_records(self) -> List[Dict]:
+        """Materialize the JSON grid cell records.
+        
+        Each column is rounded with one ``np.round`` call and converted
+        with ``tolist()``, so the per-cell loop only builds dicts.
+        """
+        return [
+            {"lat": lat, "lon": lon, "value": value, "uncertainty": uncertainty}
+            for lat, lon, value, uncertainty in zip(
+                np.round(self.lats, 4).tolist(),
+                np.round(self.lons, 4).tolist(),
+                np.round(self.values, self.value_digits).tolist(),
+                np.round(self.uncertainties, self.uncertainty_digits).tolist(),
+            )
+        ]
+
+
+def _json_default(obj):
+    """Serialize columnar grid payloads and bounding boxes."""
+    if isinstance(obj, GridCells):
+        return obj.to_records()
+    if isinstance(obj, BBox):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj) -> bytes:
+    """Encode output payloads as indented JSON.
+    
+    orjson serializes NumPy scalars natively, so grid values never need
+    an explicit ``float()`` cast on the way out.
+    """
+    return orjson.dumps(
+        obj,
+        default=_json_default,
+        option=(
+            orjson.OPT_INDENT_2
+            | orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        ),
+    )
+
+
+def _splice_sources(header: Dict, source_payloads: Dict[str, bytes]) -> bytes:
+    """Build the combined JSON document from pre-encoded source payloads.
+    
+    Produces the same bytes as ``_dumps({**header, "sources": {...}})``
+    but reuses each source's already-encoded JSON, re-indented one level
+    deeper, instead of encoding every grid a second time.
+    """
+    if not source_payloads:
+        return _dumps({**header, "sources": {}})
+    
+    parts = [_dumps(header)[:-2], b',\n  "sources": {']
+    for index, (source, payload) in enumerate(source_payloads.items()):
+        if index:
+            parts.append(b",")
+        parts.append(b"\n    " + orjson.dumps(source) + b": ")
+        parts.append(payload.replace(b"\n", b"\n    "))
+    parts.append(b"\n  }\n}")
+    return b"".join(parts)
+
+
 def generate_mock_cams_data(
-    bbox: Dict,
+    bbox: BBox,
     date: str,
     variable: str = "pm2p5",
+    rng: Optional[np.random.Generator] = None,
+    grid_scale: int = 1,
 ) -> Dict:
     """Generate mock CAMS forecast data.
     
     Creates realistic-looking CAMS data for testing without
     requiring actual API access.
     """
-    center_lat = (bbox["north"] + bbox["south"]) / 2
-    center_lon = (bbox["east"] + bbox["west"]) / 2
+    rng = RNG if rng is None else rng
+    center_lat = bbox.center_lat
+    center_lon = bbox.center_lon
     
     # Generate grid cells (simplified 10x10 grid)
-    grid_cells = []
-    for i in range(10):
-        for j in range(10):
-            lat = bbox["south"] + (bbox["north"] - bbox["south"]) * i / 9
-            lon = bbox["west"] + (bbox["east"] - bbox["west"]) * j / 9
-            
-            # Generate realistic PM2.5 values with spatial correlation
-            base_value = 25 + np.random.normal(0, 5)
-            # Add urban center effect
-            dist_from_center = np.sqrt((lat - center_lat)**2 + (lon - center_lon)**2)
-            urban_effect = max(0, 20 - dist_from_center * 5)
-            
-            value = max(5, base_value + urban_effect + np.random.normal(0, 3))
-            
-            grid_cells.append({
-                "lat": round(lat, 4),
-                "lon": round(lon, 4),
-                "value": round(value, 2),
-                "uncertainty": round(np.random.uniform(0.1, 0.3), 3),
-            })
+    n = 10 * grid_scale
+    lats, lons = _grid_axes(bbox, n, n)
+    
+    # Generate realistic PM2.5 values with spatial correlation
+    base_value = 25 + rng.normal(0, 5, (n, n))
+    # Add urban center effect
+    values = _urban_field(
+        lats, lons, center_lat, center_lon,
+        base_value + rng.normal(0, 3, (n, n)),
+        peak=20, slope=5, floor=5,
+    )
+    uncertainties = rng.uniform(0.1, 0.3, (n, n))
+    
+    grid_cells = GridCells.from_grid(lats, lons, values, uncertainties, 2, 3)
     
     return {
         "id": str(uuid4()),
@@ -115,7 +347,7 @@ def generate_mock_cams_data(
         "bbox": bbox,
         "grid_cells": grid_cells,
         "grid_cell_count": len(grid_cells),
-        "average_value": round(np.mean([c["value"] for c in grid_cells]), 2),
+        "average_value": round(float(grid_cells.values.mean()), 2),
         "quality_flag": "good",
         "metadata": {
             "forecast_hours": [0, 6, 12, 18, 24],
@@ -126,32 +358,30 @@ def generate_mock_cams_data(
 
 
 def generate_mock_modis_data(
-    bbox: Dict,
+    bbox: BBox,
     date: str,
+    rng: Optional[np.random.Generator] = None,
+    grid_scale: int = 1,
 ) -> Dict:
     """Generate mock MODIS AOD data."""
-    center_lat = (bbox["north"] + bbox["south"]) / 2
-    center_lon = (bbox["east"] + bbox["west"]) / 2
-    
-    grid_cells = []
-    for i in range(8):
-        for j in range(8):
-            lat = bbox["south"] + (bbox["north"] - bbox["south"]) * i / 7
-            lon = bbox["west"] + (bbox["east"] - bbox["west"]) * j / 7
-            
-            # AOD values typically 0-1, higher near urban areas
-            base_aod = 0.3 + np.random.normal(0, 0.1)
-            dist_from_center = np.sqrt((lat - center_lat)**2 + (lon - center_lon)**2)
-            urban_effect = max(0, 0.3 - dist_from_center * 0.05)
-            
-            aod = max(0.05, min(1.5, base_aod + urban_effect + np.random.normal(0, 0.05)))
-            
-            grid_cells.append({
-                "lat": round(lat, 4),
-                "lon": round(lon, 4),
-                "value": round(aod, 4),
-                "uncertainty": round(np.random.uniform(0.05, 0.15), 4),
-            })
+    rng = RNG if rng is None else rng
+    center_lat = bbox.center_lat
+    center_lon = bbox.center_lon
+    
+    n = 8 * grid_scale
+    lats, lons = _grid_axes(bbox, n, n)
+    
+    # AOD values typically 0-1, higher near urban areas
+    base_aod = 0.3 + rng.normal(0, 0.1, (n, n))
+    values = _urban_field(
+        lats, lons, center_lat, center_lon,
+        base_aod + rng.normal(0, 0.05, (n, n)),
+        peak=0.3, slope=0.05, floor=0.05, ceiling=1.5,
+    )
+    uncertainties = rng.uniform(0.05, 0.15, (n, n))
+    
+    grid_cells = GridCells.from_grid(lats, lons, values, uncertainties, 4, 4)
+    average_aod = float(grid_cells.values.mean())
     
     return {
         "id": str(uuid4()),
@@ -162,45 +392,42 @@ def generate_mock_modis_data(
         "bbox": bbox,
         "grid_cells": grid_cells,
         "grid_cell_count": len(grid_cells),
-        "average_value": round(np.mean([c["value"] for c in grid_cells]), 4),
-        "quality_flag": "good" if np.mean([c["value"] for c in grid_cells]) < 0.5 else "medium",
+        "average_value": round(average_aod, 4),
+        "quality_flag": "good" if average_aod < 0.5 else "medium",
         "metadata": {
             "product": "MOD04_L2",
             "platform": "Terra",
             "resolution": "10km",
-            "cloud_coverage": round(np.random.uniform(5, 30), 1),
+            "cloud_coverage": round(rng.uniform(5, 30), 1),
         },
     }
 
 
 def generate_mock_tropomi_data(
-    bbox: Dict,
+    bbox: BBox,
     date: str,
     pollutant: str = "NO2",
+    rng: Optional[np.random.Generator] = None,
+    grid_scale: int = 1,
 ) -> Dict:
     """Generate mock TROPOMI trace gas data."""
-    center_lat = (bbox["north"] + bbox["south"]) / 2
-    center_lon = (bbox["east"] + bbox["west"]) / 2
-    
-    grid_cells = []
-    for i in range(12):
-        for j in range(12):
-            lat = bbox["south"] + (bbox["north"] - bbox["south"]) * i / 11
-            lon = bbox["west"] + (bbox["east"] - bbox["west"]) * j / 10
-            
-            # NO2 tropospheric column (mol/m²)
-            base_no2 = 0.0001 + np.random.normal(0, 0.00003)
-            dist_from_center = np.sqrt((lat - center_lat)**2 + (lon - center_lon)**2)
-            urban_effect = max(0, 0.00015 - dist_from_center * 0.00002)
-            
-            no2 = max(0.00002, base_no2 + urban_effect + np.random.normal(0, 0.00002))
-            
-            grid_cells.append({
-                "lat": round(lat, 4),
-                "lon": round(lon, 4),
-                "value": round(no2, 8),
-                "uncertainty": round(np.random.uniform(0.00001, 0.00003), 8),
-            })
+    rng = RNG if rng is None else rng
+    center_lat = bbox.center_lat
+    center_lon = bbox.center_lon
+    
+    n = 12 * grid_scale
+    lats, lons = _grid_axes(bbox, n, n)
+    
+    # NO2 tropospheric column (mol/m²)
+    base_no2 = 0.0001 + rng.normal(0, 0.00003, (n, n))
+    values = _urban_field(
+        lats, lons, center_lat, center_lon,
+        base_no2 + rng.normal(0, 0.00002, (n, n)),
+        peak=0.00015, slope=0.00002, floor=0.00002,
+    )
+    uncertainties = rng.uniform(0.00001, 0.00003, (n, n))
+    
+    grid_cells = GridCells.from_grid(lats, lons, values, uncertainties, 8, 8)
     
     return {
         "id": str(uuid4()),
@@ -211,7 +438,7 @@ def generate_mock_tropomi_data(
         "bbox": bbox,
         "grid_cells": grid_cells,
         "grid_cell_count": len(grid_cells),
-        "average_value": round(np.mean([c["value"] for c in grid_cells]), 8),
+        "average_value": round(float(grid_cells.values.mean()), 8),
         "quality_flag": "good",
         "metadata": {
             "product": "L2__NO2___",
@@ -222,23 +449,44 @@ def generate_mock_tropomi_data(
     }
 
 
+MOCK_GENERATORS = {
+    "cams_pm25": generate_mock_cams_data,
+    "modis_terra": generate_mock_modis_data,
+    "tropomi_no2": generate_mock_tropomi_data,
+}
+
+
+def _generate_source_day(
+    source: str,
+    bbox: BBox,
+    date_str: str,
+    seed_seq: np.random.SeedSequence,
+    grid_scale: int,
+) -> Dict:
+    """Generate one source's grid for one day (process pool task)."""
+    rng = np.random.default_rng(seed_seq)
+    return MOCK_GENERATORS[source](bbox, date_str, rng=rng, grid_scale=grid_scale)
+
+
 def fetch_sample_data(
     city: str = "hcmc",
     days: int = 7,
     output_dir: str = None,
+    seed: Optional[int] = None,
+    grid_scale: int = 1,
+    workers: Optional[int] = None,
 ):
-    """Fetch sample satellite data for multiple days and sources."""
+    """Fetch sample satellite data for multiple days and sources.
+    
+    Each (source, day) grid is generated in a ``ProcessPoolExecutor``
+    worker; ``workers`` caps the pool size (default: CPU count).
+    """
     if city not in CITY_BBOXES:
         print(f"Unknown city: {city}. Available: {list(CITY_BBOXES.keys())}")
         sys.exit(1)
     
     city_info = CITY_BBOXES[city]
-    bbox = {
-        "north": city_info["north"],
-        "south": city_info["south"],
-        "east": city_info["east"],
-        "west": city_info["west"],
-    }
+    bbox = BBox.from_city(city_info)
     
     # Set output directory
     if output_dir is None:
@@ -249,7 +497,7 @@ def fetch_sample_data(
     output_dir.mkdir(parents=True, exist_ok=True)
     
     print(f"Fetching sample satellite data for {city_info['name']}")
-    print(f"Bounding box: N{bbox['north']}, S{bbox['south']}, E{bbox['east']}, W{bbox['west']}")
+    print(f"Bounding box: N{bbox.north}, S{bbox.south}, E{bbox.east}, W{bbox.west}")
     print(f"Date range: {days} days")
     print(f"Output directory: {output_dir}")
     print("-" * 60)
@@ -262,43 +510,47 @@ def fetch_sample_data(
         "sources": {},
     }
     
-    # Generate data for each day
-    dates = [datetime.utcnow() - timedelta(days=i) for i in range(days)]
+    # Generate data for each day; every (source, day) pair is independent
+    # and gets its own child seed so worker processes never share streams
+    date_strs = [
+        (datetime.utcnow() - timedelta(days=i)).strftime("%Y-%m-%d")
+        for i in range(days)
+    ]
+    tasks = [(source, date_str) for source in MOCK_GENERATORS for date_str in date_strs]
+    task_seeds = np.random.SeedSequence(seed).spawn(len(tasks))
     
-    for source in ["cams_pm25", "modis_terra", "tropomi_no2"]:
-        print(f"\nGenerating {source} data...")
-        source_data = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_generate_source_day, source, bbox, date_str, task_seed, grid_scale)
+            for (source, date_str), task_seed in zip(tasks, task_seeds)
+        ]
         
-        for date in dates:
-            date_str = date.strftime("%Y-%m-%d")
-            
-            if source == "cams_pm25":
-                data = generate_mock_cams_data(bbox, date_str)
-            elif source == "modis_terra":
-                data = generate_mock_modis_data(bbox, date_str)
-            elif source == "tropomi_no2":
-                data = generate_mock_tropomi_data(bbox, date_str)
-            else:
-                continue
+        for (source, date_str), future in zip(tasks, futures):
+            if source not in all_data["sources"]:
+                print(f"\nGenerating {source} data...")
+                all_data["sources"][source] = []
             
-            source_data.append(data)
+            data = future.result()
+            all_data["sources"][source].append(data)
             print(f"  {date_str}: {data['grid_cell_count']} grid cells, "
                   f"avg={data['average_value']:.4f}")
-        
-        all_data["sources"][source] = source_data
+    
+    # Encode each source once; the combined file splices these payloads
+    source_payloads = {
+        source: _dumps(data) for source, data in all_data["sources"].items()
+    }
     
     # Save combined data
     output_file = output_dir / "satellite_data.json"
-    with open(output_file, "w") as f:
-        json.dump(all_data, f, indent=2)
+    header = {key: value for key, value in all_data.items() if key != "sources"}
+    output_file.write_bytes(_splice_sources(header, source_payloads))
     
     print(f"\n✓ Saved combined data to: {output_file}")
     
     # Save individual source files
-    for source, data in all_data["sources"].items():
+    for source, payload in source_payloads.items():
         source_file = output_dir / f"{source}.json"
-        with open(source_file, "w") as f:
-            json.dump(data, f, indent=2)
+        source_file.write_bytes(payload)
         print(f"✓ Saved {source} data to: {source_file}")
     
     # Print summary
@@ -342,6 +594,24 @@ def main():
         default=None,
         help="Output directory (default: scripts/sample_data/<city>)",
     )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Random seed for reproducible output",
+    )
+    parser.add_argument(
+        "--grid-scale",
+        type=int,
+        default=1,
+        help="Multiply each source's grid resolution (e.g. 20 for a 200x200 CAMS grid)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for grid generation (default: CPU count)",
+    )
     
     args = parser.parse_args()
     
@@ -349,6 +619,9 @@ def main():
         city=args.city,
         days=args.days,
         output_dir=args.output,
+        seed=args.seed,
+        grid_scale=args.grid_scale,
+        workers=args.workers,
     )
     
     print(f"\nTo use this data in tests, copy it to your test fixtures directory.")
@@ -13,18 +13,18 @@ Examples:
 """
 import argparse
 import os
-import random
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 try:
     import pandas as pd
     import numpy as np
+    import xlsxwriter  # noqa: F401  (pandas ExcelWriter engine)
 except ImportError:
     print("Installing required packages...")
-    os.system("pip install pandas openpyxl numpy")
+    os.system("pip install pandas xlsxwriter numpy")
     import pandas as pd
     import numpy as np
 
@@ -74,18 +74,36 @@ POLLUTANT_LEVELS = {
     "electronics": {"pm25": (8, 25), "pm10": (15, 40), "co2": (80, 150), "no2": (3, 10)},
 }
 
-STATUS_OPTIONS = ["active", "active", "active", "active", "warning", "suspended"]
+# Per-pollutant (low, high) ranges as arrays aligned with INDUSTRY_TYPES
+LIMIT_LOW = {
+    pollutant: np.array([POLLUTANT_LEVELS[t][pollutant][0] for t in INDUSTRY_TYPES], dtype=float)
+    for pollutant in ("pm25", "pm10", "co2", "no2")
+}
+LIMIT_HIGH = {
+    pollutant: np.array([POLLUTANT_LEVELS[t][pollutant][1] for t in INDUSTRY_TYPES], dtype=float)
+    for pollutant in ("pm25", "pm10", "co2", "no2")
+}
+
+STATUS_OPTIONS = ["active", "warning", "suspended"]
+STATUS_WEIGHTS = [4 / 6, 1 / 6, 1 / 6]
+
+# Column width used for numeric columns in generated workbooks
+NUMERIC_COLUMN_WIDTH = 12
+
+# Shared generator for vectorized sampling
+RNG = np.random.default_rng()
 
 
 def generate_historical_readings(
     num_rows: int = 100,
     num_sensors: int = 5,
     start_date: datetime = None,
+    interval_hours: Optional[int] = None,
 ) -> pd.DataFrame:
     """Generate historical air quality readings.
     
     Creates realistic sensor data with:
-    - Timestamps at hourly intervals
+    - Timestamps at random 1-6 hour gaps, or a fixed ``interval_hours``
     - Multiple sensors at different locations
     - Correlated pollutant values
     - Realistic diurnal patterns
@@ -99,63 +117,60 @@ def generate_historical_readings(
     base_lon = 106.7009
     
     # Generate sensor locations
-    sensors = []
-    for i in range(num_sensors):
-        sensors.append({
-            "id": f"sensor_{i+1:03d}",
-            "lat": base_lat + random.uniform(-0.3, 0.3),
-            "lon": base_lon + random.uniform(-0.3, 0.3),
-            "base_pm25": random.uniform(25, 50),
-            "base_pm10": random.uniform(50, 100),
-        })
+    sensor_ids = np.array([f"sensor_{i+1:03d}" for i in range(num_sensors)])
+    sensor_lats = base_lat + RNG.uniform(-0.3, 0.3, num_sensors)
+    sensor_lons = base_lon + RNG.uniform(-0.3, 0.3, num_sensors)
+    sensor_base_pm25 = RNG.uniform(25, 50, num_sensors)
     
-    data = []
-    current_time = start_date
+    n = num_rows
+    sensor_idx = RNG.integers(0, num_sensors, n)
     
-    for _ in range(num_rows):
-        sensor = random.choice(sensors)
-        
-        # Add diurnal pattern (higher during rush hours)
-        hour = current_time.hour
-        if 7 <= hour <= 9 or 17 <= hour <= 19:  # Rush hours
-            multiplier = random.uniform(1.3, 1.8)
-        elif 0 <= hour <= 5:  # Night
-            multiplier = random.uniform(0.6, 0.8)
-        else:
-            multiplier = random.uniform(0.9, 1.2)
-        
-        # Add day-of-week pattern (lower on weekends)
-        if current_time.weekday() >= 5:  # Weekend
-            multiplier *= random.uniform(0.7, 0.9)
-        
-        # Generate pollutant values with correlation
-        pm25 = sensor["base_pm25"] * multiplier + random.gauss(0, 5)
-        pm10 = pm25 * random.uniform(1.8, 2.2) + random.gauss(0, 10)
-        co2 = pm25 * random.uniform(8, 12) + random.gauss(0, 50)
-        no2 = pm25 * random.uniform(0.3, 0.5) + random.gauss(0, 3)
-        
-        # Temperature and humidity (inverse correlation)
-        temperature = 28 + random.gauss(0, 3) - (hour - 14) * 0.3
-        humidity = 65 + random.gauss(0, 10) + (hour - 14) * 0.5
-        
-        # Occasionally add anomalies (5% of data)
-        if random.random() < 0.05:
-            pm25 *= random.uniform(2, 4)  # Spike
-        
-        data.append({
-            "timestamp": current_time.strftime("%Y-%m-%d %H:%M:%S"),
-            "location_id": sensor["id"],
-            "latitude": round(sensor["lat"], 4),
-            "longitude": round(sensor["lon"], 4),
-            "pm25": round(max(5, pm25), 1),
-            "pm10": round(max(10, pm10), 1),
-            "co2": round(max(300, co2), 0),
-            "no2": round(max(1, no2), 1),
-            "temperature": round(max(15, min(40, temperature)), 1),
-            "humidity": round(max(30, min(95, humidity)), 1),
-        })
-        
-        current_time += timedelta(hours=random.randint(1, 6))
+    if interval_hours:
+        timestamps = pd.date_range(start_date, periods=n, freq=f"{interval_hours}h")
+    else:
+        # First reading at start_date, then random 1-6 hour gaps
+        offsets = np.concatenate(([0], np.cumsum(RNG.integers(1, 7, max(n - 1, 0)))))[:n]
+        timestamps = pd.Timestamp(start_date) + pd.to_timedelta(offsets, unit="h")
+    hours = timestamps.hour.to_numpy()
+    
+    # Add diurnal pattern (higher during rush hours)
+    rush_hour = ((hours >= 7) & (hours <= 9)) | ((hours >= 17) & (hours <= 19))
+    multiplier = np.select(
+        [rush_hour, hours <= 5],
+        [RNG.uniform(1.3, 1.8, n), RNG.uniform(0.6, 0.8, n)],
+        default=RNG.uniform(0.9, 1.2, n),
+    )
+    
+    # Add day-of-week pattern (lower on weekends)
+    weekend = timestamps.dayofweek.to_numpy() >= 5
+    multiplier = np.where(weekend, multiplier * RNG.uniform(0.7, 0.9, n), multiplier)
+    
+    # Generate pollutant values with correlation
+    pm25 = sensor_base_pm25[sensor_idx] * multiplier + RNG.normal(0, 5, n)
+    pm10 = pm25 * RNG.uniform(1.8, 2.2, n) + RNG.normal(0, 10, n)
+    co2 = pm25 * RNG.uniform(8, 12, n) + RNG.normal(0, 50, n)
+    no2 = pm25 * RNG.uniform(0.3, 0.5, n) + RNG.normal(0, 3, n)
+    
+    # Temperature and humidity (inverse correlation)
+    temperature = 28 + RNG.normal(0, 3, n) - (hours - 14) * 0.3
+    humidity = 65 + RNG.normal(0, 10, n) + (hours - 14) * 0.5
+    
+    # Occasionally add anomalies (5% of data)
+    spike_mask = RNG.random(n) < 0.05
+    pm25[spike_mask] *= RNG.uniform(2, 4, spike_mask.sum())  # Spike
+    
+    data = {
+        "timestamp": timestamps.strftime("%Y-%m-%d %H:%M:%S"),
+        "location_id": sensor_ids[sensor_idx],
+        "latitude": np.round(sensor_lats[sensor_idx], 4),
+        "longitude": np.round(sensor_lons[sensor_idx], 4),
+        "pm25": np.round(np.clip(pm25, 5, None), 1),
+        "pm10": np.round(np.clip(pm10, 10, None), 1),
+        "co2": np.round(np.clip(co2, 300, None), 0),
+        "no2": np.round(np.clip(no2, 1, None), 1),
+        "temperature": np.round(np.clip(temperature, 15, 40), 1),
+        "humidity": np.round(np.clip(humidity, 30, 95), 1),
+    }
     
     return pd.DataFrame(data)
 
@@ -174,40 +189,40 @@ def generate_factory_records(
     base_lat = 10.7769
     base_lon = 106.7009
     
-    data = []
-    used_names = set()
-    
-    for i in range(num_factories):
-        # Generate unique factory name
-        while True:
-            name = random.choice(SAMPLE_FACTORY_NAMES)
-            suffix = f" #{i+1}" if i >= len(SAMPLE_FACTORY_NAMES) else ""
-            full_name = f"{name}{suffix}"
-            if full_name not in used_names:
-                used_names.add(full_name)
-                break
-        
-        industry_type = random.choice(INDUSTRY_TYPES)
-        limits = POLLUTANT_LEVELS.get(industry_type, POLLUTANT_LEVELS["manufacturing"])
-        
-        # Generate location (spread around the city)
-        lat = base_lat + random.uniform(-0.4, 0.4)
-        lon = base_lon + random.uniform(-0.4, 0.4)
-        
-        # Emission limits based on industry
-        pm25_limit = random.uniform(*limits["pm25"])
-        pm10_limit = random.uniform(*limits["pm10"])
-        
-        data.append({
-            "factory_name": full_name,
-            "registration_number": f"REG-{2024001 + i:06d}",
-            "latitude": round(lat, 4),
-            "longitude": round(lon, 4),
-            "industry_type": industry_type,
-            "pm25_limit": round(pm25_limit, 1),
-            "pm10_limit": round(pm10_limit, 1),
-            "status": random.choice(STATUS_OPTIONS),
-        })
+    n = num_factories
+    
+    # Generate unique factory names: the first len(SAMPLE_FACTORY_NAMES)
+    # factories get distinct base names, later ones are made unique by suffix
+    num_unsuffixed = min(n, len(SAMPLE_FACTORY_NAMES))
+    names = list(RNG.permutation(SAMPLE_FACTORY_NAMES)[:num_unsuffixed])
+    names += [
+        f"{name} #{i+1}"
+        for i, name in enumerate(
+            RNG.choice(SAMPLE_FACTORY_NAMES, n - num_unsuffixed),
+            start=num_unsuffixed,
+        )
+    ]
+    
+    industry_idx = RNG.integers(0, len(INDUSTRY_TYPES), n)
+    
+    # Generate location (spread around the city)
+    lats = base_lat + RNG.uniform(-0.4, 0.4, n)
+    lons = base_lon + RNG.uniform(-0.4, 0.4, n)
+    
+    # Emission limits based on industry
+    pm25_limits = RNG.uniform(LIMIT_LOW["pm25"][industry_idx], LIMIT_HIGH["pm25"][industry_idx])
+    pm10_limits = RNG.uniform(LIMIT_LOW["pm10"][industry_idx], LIMIT_HIGH["pm10"][industry_idx])
+    
+    data = {
+        "factory_name": names,
+        "registration_number": [f"REG-{2024001 + i:06d}" for i in range(n)],
+        "latitude": np.round(lats, 4),
+        "longitude": np.round(lons, 4),
+        "industry_type": np.asarray(INDUSTRY_TYPES)[industry_idx],
+        "pm25_limit": np.round(pm25_limits, 1),
+        "pm10_limit": np.round(pm10_limits, 1),
+        "status": RNG.choice(STATUS_OPTIONS, n, p=STATUS_WEIGHTS),
+    }
     
     return pd.DataFrame(data)
 
@@ -218,88 +233,99 @@ def create_excel_with_formatting(
     sheet_name: str = "Data",
     include_instructions: bool = True,
 ):
-    """Create Excel file with professional formatting."""
-    # Create Excel writer with openpyxl engine
-    with pd.ExcelWriter(filename, engine="openpyxl") as writer:
-        df.to_excel(writer, index=False, sheet_name=sheet_name)
+    """Create Excel file with professional formatting.
+    
+    Uses the streaming xlsxwriter engine.  Each style is registered once
+    as a workbook format and applied per column or per range, so the
+    cost of formatting does not grow with the number of rows.
+    """
+    # xlsxwriter rows/columns are zero-indexed
+    header_row = 1 if include_instructions else 0
+    first_data_row = header_row + 1
+    last_data_row = header_row + len(df)
+    last_col = len(df.columns) - 1
+    
+    with pd.ExcelWriter(filename, engine="xlsxwriter") as writer:
+        df.to_excel(writer, index=False, sheet_name=sheet_name, startrow=header_row)
         
         workbook = writer.book
         worksheet = writer.sheets[sheet_name]
         
+        header_format = workbook.add_format({
+            "bold": True,
+            "font_color": "#FFFFFF",
+            "bg_color": "#4472C4",
+            "align": "center",
+            "valign": "vcenter",
+            "border": 1,
+        })
+        alt_row_format = workbook.add_format({"bg_color": "#F2F2F2"})
+        border_format = workbook.add_format({"border": 1})
+        decimal_format = workbook.add_format({"num_format": "0.00"})
+        integer_format = workbook.add_format({"num_format": "0"})
+        
         # Add instructions row if requested
         if include_instructions:
-            # Insert row at top for instructions
-            worksheet.insert_rows(1)
-            
-            # Merge cells for instruction header
-            max_col = chr(64 + len(df.columns))
-            worksheet.merge_cells(f"A1:{max_col}1")
-            
-            # Format instruction cell
-            instruction_cell = worksheet["A1"]
-            instruction_cell.value = (
+            instruction_format = workbook.add_format({
+                "bold": True,
+                "font_color": "#0066CC",
+                "font_size": 11,
+                "align": "center",
+            })
+            worksheet.merge_range(
+                0, 0, 0, last_col,
                 f"Template: {sheet_name.replace('_', ' ').title()} - "
                 f"Fill in your data below. Keep column names unchanged. "
-                f"Generated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')}"
-            )
-            instruction_cell.font = instruction_cell.font.copy(
-                bold=True,
-                color="FF0066CC",
-                size=11,
-            )
-            instruction_cell.alignment = instruction_cell.alignment.copy(
-                horizontal="center"
+                f"Generated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')}",
+                instruction_format,
             )
-            worksheet.row_dimensions[1].height = 25
+            worksheet.set_row(0, 25)
         
         # Format header row
-        header_row = 2 if include_instructions else 1
-        for cell in worksheet[header_row]:
-            cell.font = cell.font.copy(bold=True, color="FFFFFF")
-            cell.fill = cell.fill.__class__(start_color="4472C4", fill_type="solid")
-            cell.alignment = cell.alignment.copy(horizontal="center", vertical="center")
-            worksheet.row_dimensions[header_row].height = 20
+        for col_idx, col_name in enumerate(df.columns):
+            worksheet.write(header_row, col_idx, col_name, header_format)
+        worksheet.set_row(header_row, 20)
         
         # Format data columns
-        for col_idx, col_name in enumerate(df.columns, 1):
-            col_letter = chr(64 + col_idx)
-            
-            # Set column widths based on content
-            max_length = max(
-                len(str(col_name)),
-                df[col_name].astype(str).max().__len__() + 2
-            )
-            worksheet.column_dimensions[col_letter].width = min(max_length, 25)
+        for col_idx, col_name in enumerate(df.columns):
+            # Set column widths based on content; numeric columns get a
+            # fixed width so they skip the string conversion entirely
+            is_numeric = pd.api.types.is_numeric_dtype(df[col_name])
+            if is_numeric:
+                content_length = NUMERIC_COLUMN_WIDTH
+            elif len(df):
+                content_length = int(df[col_name].astype(str).str.len().max()) + 2
+            else:
+                content_length = 0
+            max_length = max(len(str(col_name)), content_length)
             
             # Apply number formatting for numeric columns
-            if df[col_name].dtype in ["float64", "int64"]:
-                for row_idx in range(header_row + 1, header_row + 1 + len(df)):
-                    cell = worksheet[f"{col_letter}{row_idx}"]
-                    cell.number_format = "0.00" if "lat" in col_name.lower() or "limit" in col_name.lower() else "0"
-        
-        # Add alternating row colors
-        for row_idx in range(header_row + 1, header_row + 1 + len(df), 2):
-            for col_idx in range(1, len(df.columns) + 1):
-                cell = worksheet[f"{chr(64 + col_idx)}{row_idx}"]
-                cell.fill = cell.fill.__class__(start_color="F2F2F2", fill_type="solid")
-        
-        # Add borders
-        from openpyxl.styles import Border, Side
-        thin_border = Border(
-            left=Side(style="thin"),
-            right=Side(style="thin"),
-            top=Side(style="thin"),
-            bottom=Side(style="thin"),
-        )
+            column_format = None
+            if is_numeric:
+                column_format = (
+                    decimal_format
+                    if "lat" in col_name.lower() or "limit" in col_name.lower()
+                    else integer_format
+                )
+            
+            worksheet.set_column(col_idx, col_idx, min(max_length, 25), column_format)
         
-        for row in worksheet.iter_rows(
-            min_row=header_row,
-            max_row=header_row + len(df),
-            min_col=1,
-            max_col=len(df.columns),
-        ):
-            for cell in row:
-                cell.border = thin_border
+        if len(df):
+            # Add alternating row colors (first data row is shaded)
+            worksheet.conditional_format(
+                first_data_row, 0, last_data_row, last_col,
+                {
+                    "type": "formula",
+                    "criteria": f"=MOD(ROW(),2)={(first_data_row + 1) % 2}",
+                    "format": alt_row_format,
+                },
+            )
+            
+            # Add borders
+            worksheet.conditional_format(
+                first_data_row, 0, last_data_row, last_col,
+                {"type": "formula", "criteria": "=TRUE", "format": border_format},
+            )
     
     print(f"✓ Created: {filename}")
 
@@ -332,6 +358,12 @@ def main():
         default=5,
         help="Number of sensors for readings",
     )
+    parser.add_argument(
+        "--interval-hours",
+        type=int,
+        default=None,
+        help="Fixed hours between readings (default: random 1-6 hour gaps)",
+    )
     
     args = parser.parse_args()
     
@@ -352,6 +384,7 @@ def main():
     readings_df = generate_historical_readings(
         num_rows=args.readings_rows,
         num_sensors=args.sensors,
+        interval_hours=args.interval_hours,
     )
     
     readings_file = output_dir / "historical_readings_sample.xlsx"
@@ -1,29 +1,150 @@
-"""Simulate sensor data for development and testing."""
+"""Simulate sensor data for development and testing.
+
+Every tick generates one reading per simulated sensor in a single NumPy
+batch.  When sensor IDs are given, the readings are submitted
+concurrently to the Sensor Service over one keep-alive HTTP client;
+otherwise they are only printed.
+
+Usage:
+    python simulate-sensors.py [--interval SECONDS] [--sensor-id ID ...]
+
+Examples:
+    python simulate-sensors.py --sensors 50
+    python simulate-sensors.py --interval 10 --sensor-id <uuid> --sensor-id <uuid>
+"""
+import argparse
 import asyncio
-import random
-
-
-async def generate_reading():
-    """Generate a random sensor reading."""
-    return {
-        "pm25": round(random.uniform(5, 200), 2),
-        "pm10": round(random.uniform(10, 300), 2),
-        "co": round(random.uniform(0.1, 10), 2),
-        "no2": round(random.uniform(5, 150), 2),
-        "so2": round(random.uniform(2, 100), 2),
-        "o3": round(random.uniform(10, 200), 2),
+import os
+from typing import Dict, List, Optional
+
+try:
+    import httpx
+    import numpy as np
+except ImportError:
+    print("Installing required packages...")
+    os.system("pip install httpx numpy")
+    import httpx
+    import numpy as np
+
+
+# Uniform (low, high) ranges for each simulated pollutant
+POLLUTANT_RANGES = {
+    "pm25": (5, 200),
+    "pm10": (10, 300),
+    "co": (0.1, 10),
+    "no2": (5, 150),
+    "so2": (2, 100),
+    "o3": (10, 200),
+}
+
+RNG = np.random.default_rng()
+
+
+def generate_readings(count: int, rng: Optional[np.random.Generator] = None) -> List[Dict]:
+    """Generate ``count`` random sensor readings in one batch."""
+    rng = RNG if rng is None else rng
+    columns = {
+        pollutant: np.round(rng.uniform(low, high, count), 2).tolist()
+        for pollutant, (low, high) in POLLUTANT_RANGES.items()
     }
+    return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
 
+async def submit_readings(
+    client: "httpx.AsyncClient",
+    sensor_ids: List[str],
+    readings: List[Dict],
+    max_concurrency: int = 20,
+) -> int:
+    """Submit one reading per sensor concurrently.
 
-async def simulate(interval_seconds: int = 30):
+    Returns the number of readings accepted by the Sensor Service.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def submit(sensor_id: str, reading: Dict) -> bool:
+        async with semaphore:
+            try:
+                response = await client.post(f"/sensors/{sensor_id}/readings", json=reading)
+                response.raise_for_status()
+                return True
+            except httpx.HTTPError as e:
+                print(f"  ✗ {sensor_id}: {e}")
+                return False
+
+    results = await asyncio.gather(
+        *(submit(sensor_id, reading) for sensor_id, reading in zip(sensor_ids, readings))
+    )
+    return sum(results)
+
+
+async def simulate(
+    interval_seconds: int = 30,
+    sensor_ids: Optional[List[str]] = None,
+    num_sensors: int = 1,
+    api_url: str = "http://localhost:8002",
+    max_concurrency: int = 20,
+):
     """Simulate sensor readings at regular intervals."""
-    print(f"Starting sensor simulation (interval: {interval_seconds}s)...")
-    while True:
-        reading = await generate_reading()
-        print(f"Generated reading: {reading}")
-        # TODO: Submit reading to sensor service API
-        await asyncio.sleep(interval_seconds)
+    count = len(sensor_ids) if sensor_ids else num_sensors
+    print(f"Starting sensor simulation ({count} sensors, interval: {interval_seconds}s)...")
+
+    async with httpx.AsyncClient(base_url=api_url, timeout=10.0) as client:
+        while True:
+            readings = generate_readings(count)
+            if sensor_ids:
+                accepted = await submit_readings(client, sensor_ids, readings, max_concurrency)
+                print(f"Submitted {accepted}/{count} readings to {api_url}")
+            else:
+                for reading in readings:
+                    print(f"Generated reading: {reading}")
+            await asyncio.sleep(interval_seconds)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate sensor readings")
+    parser.add_argument(
+        "--interval",
+        type=int,
+        default=30,
+        help="Seconds between ticks",
+    )
+    parser.add_argument(
+        "--sensor-id",
+        action="append",
+        dest="sensor_ids",
+        default=None,
+        help="Sensor UUID to submit readings for (repeatable); omit to only print",
+    )
+    parser.add_argument(
+        "--sensors",
+        type=int,
+        default=1,
+        help="Number of readings per tick when no --sensor-id is given",
+    )
+    parser.add_argument(
+        "--api-url",
+        type=str,
+        default="http://localhost:8002",
+        help="Sensor Service base URL",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=20,
+        help="Maximum in-flight submissions per tick",
+    )
+
+    args = parser.parse_args()
+
+    asyncio.run(simulate(
+        interval_seconds=args.interval,
+        sensor_ids=args.sensor_ids,
+        num_sensors=args.sensors,
+        api_url=args.api_url,
+        max_concurrency=args.concurrency,
+    ))
 
 
 if __name__ == "__main__":
-    asyncio.run(simulate())
+    main()
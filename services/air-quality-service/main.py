@@ -10,7 +10,8 @@ Usage::
     python main.py
 
     # Production (via Docker CMD)
-    uvicorn src.interfaces.api.routes:app --host 0.0.0.0 --port 8004
+    uvicorn src.interfaces.api.routes:app --host 0.0.0.0 --port 8004 \
+        --loop uvloop --http httptools
 """
 from __future__ import annotations
 
@@ -46,10 +47,13 @@ def main() -> None:
         settings.LOG_LEVEL,
     )
 
+    # uvloop / httptools ship with uvicorn[standard]; uvloop is POSIX-only.
     uvicorn.run(
         "src.interfaces.api.routes:app",
         host="0.0.0.0",
         port=settings.SERVICE_PORT,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
         reload=settings.DEBUG,
         log_level=settings.LOG_LEVEL.lower(),
     )
@@ -1,11 +1,22 @@
-"""Air quality data transfer objects."""
+"""Air quality data transfer objects.
+
+``AirQualityDTO`` is a slotted dataclass, which ``orjson.dumps`` (used by
+the API's JSON responses) serializes natively without
+``dataclasses.asdict``.
+"""
+from __future__ import annotations
+
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict
 
+from ...domain.entities.air_quality_index import AirQualityIndex
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class AirQualityDTO:
+    """Flat, serialisation-friendly representation of an AQI entity."""
+
     aqi_value: int
     level: str
     pollutants: Dict
@@ -14,5 +25,13 @@ class AirQualityDTO:
     timestamp: datetime
 
     @classmethod
-    def from_entity(cls, entity) -> "AirQualityDTO":
-        pass
+    def from_entity(cls, entity: AirQualityIndex) -> AirQualityDTO:
+        """Map a domain ``AirQualityIndex`` entity to a DTO."""
+        return cls(
+            aqi_value=entity.aqi_value,
+            level=entity.level,
+            pollutants=dict(entity.pollutants),
+            latitude=entity.location_lat,
+            longitude=entity.location_lng,
+            timestamp=entity.timestamp,
+        )
@@ -1,10 +1,11 @@
 """Query to get current AQI for a location."""
 from dataclasses import dataclass, field
-from typing import Dict, Optional
-from uuid import UUID
+from typing import Dict
 
+__all__ = ["GetCurrentAQIQuery", "GetCurrentAQIResult"]
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class GetCurrentAQIQuery:
     """Query to get current AQI for a specific location.
 
@@ -26,7 +27,7 @@ class GetCurrentAQIQuery:
     include_pollutants: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GetCurrentAQIResult:
     """Result of current AQI query.
 
@@ -1,11 +1,12 @@
 """Query to get AQI forecast."""
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List
 from datetime import datetime
-from uuid import UUID
 
+__all__ = ["GetForecastQuery", "ForecastDataPoint", "GetForecastResult"]
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class GetForecastQuery:
     """Query to get AQI forecast for a location.
 
@@ -27,7 +28,7 @@ class GetForecastQuery:
     interval_hours: int = 1
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ForecastDataPoint:
     """A single forecast data point.
 
@@ -58,7 +59,7 @@ class ForecastDataPoint:
     level: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GetForecastResult:
     """Result of forecast query.
 
@@ -1,10 +1,11 @@
 """Query to get aggregated AQI data for map visualization."""
 from dataclasses import dataclass, field
 from typing import List, Optional
-from uuid import UUID
 
+__all__ = ["GetMapDataQuery", "MapGridCell", "GetMapDataResult"]
 
-@dataclass
+
+@dataclass(slots=True)
 class GetMapDataQuery:
     """Query to get AQI data for map visualization.
 
@@ -36,7 +37,7 @@ class GetMapDataQuery:
             self.grid_size = 360.0 / (2 ** (self.zoom_level + 4))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MapGridCell:
     """A single grid cell for map visualization.
 
@@ -56,6 +57,8 @@ class MapGridCell:
         Number of sensors contributing data
     last_updated:
         Timestamp of most recent reading
+    geohash:
+        Geohash identifying the cell
     """
 
     lat: float
@@ -66,9 +69,10 @@ class MapGridCell:
     sensor_count: int = 0
     last_updated: str = ""
     forecast_aqi: Optional[int] = None
+    geohash: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GetMapDataResult:
     """Result of map data query.
 
@@ -13,25 +13,118 @@ and infrastructure. Contains no business rules.
 """
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import logging
 import os
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, AsyncGenerator
+import struct
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from operator import attrgetter
+from statistics import fmean
+from typing import Any, Dict, List, Optional, AsyncGenerator, Set, Tuple
 from uuid import UUID
 
+import numpy as np
+import orjson
+from fastapi import Request
+
 from ...config import settings
 from ...domain.services.aqi_calculator import AQICalculator, AQIResult
 from ...domain.services.calibration_model import CalibrationModel
 from ...domain.services.cross_validator import CrossValidationService
-from ...domain.services.data_fusion import DataFusionService
+from ...domain.services import geohash
+from ...domain.services.data_fusion import (
+    FUSION_CACHE_RADIUS_KM,
+    DataFusionService,
+    FusedDataPoint,
+    FusionInput,
+    fused_aqi_entries,
+)
 from ...domain.services.prediction_service import PredictionService, SensorDataPoint
-from ...domain.value_objects.aqi_category import get_category_for_aqi
+from ...domain.services.sensor_index import SensorSpatialIndex
+from ...domain.value_objects.aqi_category import (
+    get_category_for_aqi,
+    get_levels_and_colors,
+)
+from ...domain.value_objects.bounding_box import BoundingBox
 from ..queries.get_current_aqi_query import GetCurrentAQIQuery, GetCurrentAQIResult
 from ..queries.get_forecast_query import GetForecastQuery, GetForecastResult, ForecastDataPoint
 from ..queries.get_map_data_query import GetMapDataQuery, GetMapDataResult, MapGridCell
 
 logger = logging.getLogger(__name__)
 
+# Kilometres per degree of latitude (and of longitude at the equator)
+_KM_PER_DEGREE = 111.0
+
+# Pollutant columns used when aggregating sensor readings
+_POLLUTANTS = ("pm25", "pm10", "co", "no2", "so2", "o3")
+_reading_values = attrgetter(*_POLLUTANTS)
+
+# Upper bound on concurrent per-sensor validations
+_VALIDATION_CONCURRENCY = 20
+
+# Weight of the latest lookup in the current-AQI cache hit rate average
+_HIT_RATE_SMOOTHING = 0.05
+
+# How long a calibration model file stat is reused (seconds)
+_CALIBRATION_STAT_TTL = 60.0
+_NO_CALIBRATION_STAT = (-_CALIBRATION_STAT_TTL, "", None)
+
+# Upper bound on concurrent background map prefetches
+_MAX_PREFETCH_TASKS = 4
+
+# Naive UTC epoch for forecast timestamps cached as integer microseconds
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Development forecast history without a sensor client: (age, PM2.5, AQI)
+# for the last 12 hours, oldest first; only the timestamps vary per call
+_SAMPLE_HISTORY = tuple(
+    (timedelta(hours=i), 30 + i * 2, 50 + i * 3) for i in range(12, 0, -1)
+)
+
+# Cached map cell record: AQI, sensor count, last update (epoch seconds)
+_CELL_STRUCT = struct.Struct("<HIq")
+_CELL_DTYPE = np.dtype([("aqi", "<u2"), ("sensor_count", "<u4"), ("updated", "<i8")])
+
+
+@lru_cache(maxsize=256)
+def _iso_at(epoch_second: int) -> str:
+    """Naive UTC ISO-8601 string for a whole epoch second.
+
+    Formatted from ``time.gmtime`` without building a datetime; the
+    cache covers "now" and the few distinct update times in a map read.
+    """
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(epoch_second))
+
+
+def _iso_now() -> str:
+    """Current UTC time as an ISO-8601 string, formatted once per second."""
+    return _iso_at(int(time.time()))
+
+
+@lru_cache(maxsize=4096)
+def _parse_uuid(value: str) -> UUID:
+    """Parse a sensor id, memoized since the same ids recur every poll."""
+    return UUID(value)
+
+
+# Template for locations without data; copied with location and timestamp
+_EMPTY_RESULT = GetCurrentAQIResult(
+    location_lat=0.0,
+    location_lng=0.0,
+    aqi_value=0,
+    level="GOOD",
+    category="Good",
+    color="#00E400",
+    dominant_pollutant="none",
+    health_message="No air quality data available for this location.",
+    caution_message="None",
+    data_source="none",
+)
+
 
 class AirQualityApplicationService:
     """Application service for air quality operations.
@@ -47,6 +140,9 @@ class AirQualityApplicationService:
     - Sensor Service client (infrastructure)
     """
 
+    # Background map prefetches in flight, shared by all instances
+    _prefetch_tasks: Set[asyncio.Task] = set()
+
     def __init__(
         self,
         aqi_calculator: AQICalculator,
@@ -83,6 +179,19 @@ class AirQualityApplicationService:
         self.sensor_client = sensor_client
         self.calibration_model = calibration_model or CalibrationModel()
         self.cross_validator = cross_validator or CrossValidationService()
+        # Moving average of current-AQI cache hits (gates speculation)
+        self._aqi_hit_rate = 0.0
+        # Current-AQI computations in progress, keyed like the AQI cache,
+        # so concurrent misses for one location share a single computation
+        self._inflight_aqi: Dict[Tuple, asyncio.Task] = {}
+        # Shared by every map request so concurrent viewports together stay
+        # within the per-cell fallback's Sensor Service query budget
+        self._grid_semaphore = asyncio.Semaphore(settings.MAP_FALLBACK_CONCURRENCY)
+        # Reads the calibration model on every call, so retraining the
+        # shared model in place needs no rebuild
+        self.fusion_service = DataFusionService(self.calibration_model)
+        # (checked at, model path, last-trained ISO time) of the last stat
+        self._calibration_stat: Tuple[float, str, Optional[str]] = _NO_CALIBRATION_STAT
 
     async def get_current_aqi(
         self,
@@ -107,22 +216,150 @@ class AirQualityApplicationService:
         GetCurrentAQIResult
             Current AQI data with category and health messages
         """
+        speculative = self._speculative_pollutants(query)
+
         # Try cache first
         cached = await self.cache.get_aqi(
             query.latitude,
             query.longitude,
             query.radius_km,
         )
-        if cached:
+        # Entries without a category (partial writes) are not results
+        hit = bool(cached) and "level" in cached
+        self._settle_speculation(speculative, hit=hit)
+        if hit:
             logger.debug("Cache hit for AQI at (%.3f, %.3f)", query.latitude, query.longitude)
             return self._result_from_cache(cached)
 
-        # Fetch sensor data from repository
-        pollutants = await self._get_pollutants_for_location(
+        return await self._coalesced_current_aqi(query, speculative)
+
+    async def get_current_aqi_raw(
+        self,
+        query: GetCurrentAQIQuery,
+    ) -> bytes:
+        """Get current AQI for a location as a serialized JSON payload.
+
+        Same as :meth:`get_current_aqi`, for callers that only send the
+        result on: a cache hit returns the stored payload unchanged
+        instead of rebuilding and re-serializing the result.
+
+        Parameters
+        ----------
+        query:
+            Query with location and options
+
+        Returns
+        -------
+        bytes
+            JSON-encoded ``GetCurrentAQIResult``
+        """
+        speculative = self._speculative_pollutants(query)
+
+        cached = await self.cache.get_aqi_raw(
             query.latitude,
             query.longitude,
             query.radius_km,
         )
+        # Same shape check as get_current_aqi(), without decoding
+        hit = bool(cached) and b'"level":' in cached
+        self._settle_speculation(speculative, hit=hit)
+        if hit:
+            logger.debug("Cache hit for AQI at (%.3f, %.3f)", query.latitude, query.longitude)
+            return cached
+
+        return orjson.dumps(await self._coalesced_current_aqi(query, speculative))
+
+    def _speculative_pollutants(
+        self,
+        query: GetCurrentAQIQuery,
+    ) -> Optional[asyncio.Task]:
+        """Start the sensor query for a current-AQI miss before the cache
+        lookup completes.
+
+        Only with ``SPECULATIVE_SENSOR_FETCH``, and only while the recent
+        cache hit rate is at most ``SPECULATIVE_SENSOR_FETCH_MAX_HIT_RATE``:
+        with mostly hits the speculative queries are nearly all wasted.
+        """
+        if (
+            not settings.SPECULATIVE_SENSOR_FETCH
+            or self._aqi_hit_rate > settings.SPECULATIVE_SENSOR_FETCH_MAX_HIT_RATE
+        ):
+            return None
+        return asyncio.create_task(
+            self._get_pollutants_for_location(
+                query.latitude,
+                query.longitude,
+                query.radius_km,
+            )
+        )
+
+    def _settle_speculation(
+        self,
+        speculative: Optional[asyncio.Task],
+        hit: bool,
+    ) -> None:
+        """Record a current-AQI cache lookup; cancel the speculative sensor
+        query if the cache answered."""
+        self._aqi_hit_rate += _HIT_RATE_SMOOTHING * (hit - self._aqi_hit_rate)
+        if hit and speculative:
+            speculative.cancel()
+
+    async def _coalesced_current_aqi(
+        self,
+        query: GetCurrentAQIQuery,
+        pollutants_task: Optional[asyncio.Task] = None,
+    ) -> GetCurrentAQIResult:
+        """Compute current AQI after a cache miss, once per cache key.
+
+        A miss for a location already being computed waits for that
+        computation (dropping its own speculative sensor query) instead
+        of querying sensors again; the shared result is reported at the
+        caller's own location.  The computation is shielded, so a caller
+        that goes away does not cancel it for the others.
+        """
+        key = (
+            round(query.latitude, 3),
+            round(query.longitude, 3),
+            query.radius_km,
+            query.include_pollutants,
+        )
+        task = self._inflight_aqi.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._compute_current_aqi(query, pollutants_task)
+            )
+            self._inflight_aqi[key] = task
+            task.add_done_callback(lambda _: self._inflight_aqi.pop(key, None))
+            return await asyncio.shield(task)
+
+        if pollutants_task:
+            pollutants_task.cancel()
+        result = await asyncio.shield(task)
+        return dataclasses.replace(
+            result,
+            location_lat=query.latitude,
+            location_lng=query.longitude,
+        )
+
+    async def _compute_current_aqi(
+        self,
+        query: GetCurrentAQIQuery,
+        pollutants_task: Optional[asyncio.Task] = None,
+    ) -> GetCurrentAQIResult:
+        """Calculate current AQI from sensor data and cache the result.
+
+        ``pollutants_task`` is an already started sensor query to use
+        instead of issuing a new one.
+        """
+        # Fetch sensor data from repository
+        pollutants = await (
+            pollutants_task
+            or self._get_pollutants_for_location(
+                query.latitude,
+                query.longitude,
+                query.radius_km,
+            )
+        )
 
         if not pollutants:
             # Return default/empty result
@@ -143,16 +380,16 @@ class AirQualityApplicationService:
             pollutants=self._format_pollutants(pollutants, query.include_pollutants),
             health_message=aqi_result.health_message,
             caution_message=aqi_result.caution_message,
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=_iso_now(),
             data_source="sensor",
         )
 
-        # Cache the result
+        # Cache the result (serialized straight from the dataclass)
         await self.cache.set_aqi(
             query.latitude,
             query.longitude,
             query.radius_km,
-            self._result_to_dict(result),
+            result,
         )
 
         return result
@@ -164,11 +401,13 @@ class AirQualityApplicationService:
         """Get aggregated AQI data for map visualization.
 
         Flow:
-        1. Check cache for map data
-        2. If not cached, query sensors in bounding box
-        3. Aggregate into grid cells
-        4. Cache the result
-        5. Return grid data
+        1. Split the bounding box into geohash cells for the zoom level
+        2. Look up every cell in the cache in one batch
+        3. Generate the cells that were not cached
+        4. Cache the new cells (empty ones too)
+        5. On a full cache hit, prefetch the surrounding cells in the
+           background
+        6. Return grid data
 
         Parameters
         ----------
@@ -180,43 +419,110 @@ class AirQualityApplicationService:
         GetMapDataResult
             Grid cells with AQI data for rendering
         """
-        # Try cache first
-        cached = await self.cache.get_map_data(
+        precision = geohash.precision_for_zoom(query.zoom_level)
+        geohashes = geohash.covering(
             query.min_lat,
             query.min_lng,
             query.max_lat,
             query.max_lng,
+            precision,
+        )
+
+        # Try cache first; panned viewports share most of their cells
+        hits: List[Tuple[str, bytes]] = []
+        missing: List[str] = []
+        for gh, packed in zip(geohashes, await self.cache.get_map_cells(geohashes)):
+            if packed is None or len(packed) not in (0, _CELL_DTYPE.itemsize):
+                missing.append(gh)
+            elif packed:
+                hits.append((gh, packed))
+        cells_by_hash = self._unpack_cells(hits)
+
+        logger.debug(
+            "Map data at zoom %d: %d/%d cells cached",
             query.zoom_level,
+            len(geohashes) - len(missing),
+            len(geohashes),
         )
-        if cached:
-            logger.debug("Cache hit for map data at zoom %d", query.zoom_level)
-            return self._map_result_from_cache(cached, query)
 
-        # Generate grid cells
-        grid_cells = await self._generate_grid_cells(query)
+        if missing:
+            fresh = await self._generate_and_cache_cells(query, missing)
+            cells_by_hash.update(fresh)
+        elif geohashes and settings.MAP_PREFETCH_NEIGHBORS:
+            # Fully cached viewport: warm the surrounding area for panning
+            self._schedule_prefetch(query, precision, set(geohashes))
 
-        # Build result
-        result = GetMapDataResult(
-            grid_cells=grid_cells,
+        return GetMapDataResult(
+            grid_cells=[cells_by_hash[gh] for gh in geohashes if gh in cells_by_hash],
             min_lat=query.min_lat,
             min_lng=query.min_lng,
             max_lat=query.max_lat,
             max_lng=query.max_lng,
             zoom_level=query.zoom_level,
-            generated_at=datetime.utcnow().isoformat(),
+            generated_at=_iso_now(),
         )
 
-        # Cache the result
-        await self.cache.set_map_data(
-            query.min_lat,
-            query.min_lng,
-            query.max_lat,
-            query.max_lng,
-            query.zoom_level,
-            [self._grid_cell_to_dict(cell) for cell in grid_cells],
+    async def _generate_and_cache_cells(
+        self,
+        query: GetMapDataQuery,
+        geohashes: List[str],
+    ) -> Dict[str, MapGridCell]:
+        """Generate the given cells and cache them, marking empty cells."""
+        fresh = {
+            cell.geohash: cell
+            for cell in await self._generate_grid_cells(query, geohashes)
+        }
+        await self.cache.set_map_cells(
+            {
+                gh: self._pack_cell(fresh[gh]) if gh in fresh else b""
+                for gh in geohashes
+            }
         )
+        return fresh
 
-        return result
+    def _schedule_prefetch(
+        self,
+        query: GetMapDataQuery,
+        precision: int,
+        viewport: Set[str],
+    ) -> None:
+        """Start a background prefetch of the cells around a viewport."""
+        if len(self._prefetch_tasks) >= _MAX_PREFETCH_TASKS:
+            return
+        task = asyncio.create_task(self._prefetch_neighbors(query, precision, viewport))
+        self._prefetch_tasks.add(task)
+        task.add_done_callback(self._prefetch_tasks.discard)
+
+    async def _prefetch_neighbors(
+        self,
+        query: GetMapDataQuery,
+        precision: int,
+        viewport: Set[str],
+    ) -> None:
+        """Cache the cells of the eight viewport-sized tiles around ``query``.
+
+        Only cells without a cache entry are generated, in one batch.
+        """
+        try:
+            dy = query.max_lat - query.min_lat
+            dx = query.max_lng - query.min_lng
+            ring = [
+                gh
+                for gh in geohash.covering(
+                    query.min_lat - dy,
+                    query.min_lng - dx,
+                    query.max_lat + dy,
+                    query.max_lng + dx,
+                    precision,
+                )
+                if gh not in viewport
+            ]
+            missing = await self.cache.map_cells_missing(ring)
+            if missing:
+                await self._generate_and_cache_cells(query, missing)
+                logger.debug("Prefetched %d map cells at zoom %d", len(missing), query.zoom_level)
+        except Exception as e:
+            logger.warning("Error prefetching map cells: %s", e)
 
     async def get_forecast(
         self,
@@ -247,9 +553,16 @@ class AirQualityApplicationService:
             query.longitude,
             query.hours,
         )
-        if cached:
+        # Entries without point columns predate the columnar layout
+        if cached and "points" in cached:
             logger.debug("Cache hit for forecast at (%.3f, %.3f)", query.latitude, query.longitude)
-            return self._forecast_result_from_cache(cached)
+            # The entry is shared by its whole geohash cell; report the
+            # caller's own location
+            return dataclasses.replace(
+                self._forecast_result_from_cache(cached),
+                location_lat=query.latitude,
+                location_lng=query.longitude,
+            )
 
         # Get historical sensor data
         sensor_data = await self._get_historical_sensor_data(
@@ -269,21 +582,26 @@ class AirQualityApplicationService:
         if sensor_data:
             current_aqi = sensor_data[-1].aqi
 
-        # Build forecast data points
-        forecast_points = []
-        for dp in forecast.data_points:
-            category = get_category_for_aqi(dp.predicted_aqi)
-            forecast_points.append(
-                ForecastDataPoint(
-                    timestamp=dp.timestamp,
-                    predicted_aqi=dp.predicted_aqi,
-                    min_aqi=dp.min_aqi,
-                    max_aqi=dp.max_aqi,
-                    confidence=dp.confidence,
-                    trend=dp.trend,
-                    level=category.level.value,
-                )
+        # Build forecast data points (levels looked up in one batch)
+        levels, _ = get_levels_and_colors(
+            np.fromiter(
+                (dp.predicted_aqi for dp in forecast.data_points),
+                dtype=np.int64,
+                count=len(forecast.data_points),
             )
+        )
+        forecast_points = [
+            ForecastDataPoint(
+                timestamp=dp.timestamp,
+                predicted_aqi=dp.predicted_aqi,
+                min_aqi=dp.min_aqi,
+                max_aqi=dp.max_aqi,
+                confidence=dp.confidence,
+                trend=dp.trend,
+                level=level,
+            )
+            for dp, level in zip(forecast.data_points, levels)
+        ]
 
         # Build result
         summary = self.prediction_service.get_forecast_summary(forecast)
@@ -300,12 +618,11 @@ class AirQualityApplicationService:
             health_recommendation=summary.get("recommendation", ""),
         )
 
-        # Cache the result
         await self.cache.set_forecast(
             query.latitude,
             query.longitude,
             query.hours,
-            self._forecast_to_dict(result),
+            self._forecast_to_cache(result),
         )
 
         return result
@@ -316,7 +633,7 @@ class AirQualityApplicationService:
 
     async def get_fused_data(
         self,
-        bbox: Dict[str, float],
+        bbox: BoundingBox,
         timestamp: Optional[datetime] = None,
     ) -> List[Dict]:
         """Get fused air quality data for a bounding box.
@@ -327,7 +644,7 @@ class AirQualityApplicationService:
         Parameters
         ----------
         bbox:
-            Bounding box with keys: north, south, east, west
+            Bounding box (north, south, east, west)
         timestamp:
             Observation timestamp (defaults to now)
 
@@ -337,47 +654,61 @@ class AirQualityApplicationService:
             Fused data points with calibrated values and confidence.
         """
         ts = timestamp or datetime.utcnow()
-        center_lat = (bbox["north"] + bbox["south"]) / 2
-        center_lon = (bbox["east"] + bbox["west"]) / 2
+        ts_iso = ts.isoformat()
+        return [
+            {
+                "latitude": point.location.latitude,
+                "longitude": point.location.longitude,
+                "timestamp": ts_iso,
+                "sensor_pm25": point.sensor_pm25,
+                "sensor_pm10": point.sensor_pm10,
+                "satellite_aod": point.satellite_aod,
+                "fused_pm25": point.fused_pm25,
+                "fused_pm10": point.fused_pm10,
+                "fused_aqi": point.fused_aqi,
+                "confidence": point.confidence,
+                "data_sources": point.data_sources,
+            }
+            for point in await self._fused_points_in_bbox(bbox, ts)
+        ]
 
-        # Fetch sensor readings
-        sensor_readings = await self._fetch_sensor_readings(
-            center_lat, center_lon, radius_km=50.0
+    async def _fused_points_in_bbox(
+        self, bbox: BoundingBox, ts: datetime
+    ) -> List[FusedDataPoint]:
+        """Run fusion around ``bbox`` and keep the points inside it."""
+        center_lat = (bbox.north + bbox.south) / 2
+        center_lon = (bbox.east + bbox.west) / 2
+
+        # Fetch sensor readings and cached satellite data concurrently
+        sensor_readings, satellite_data = await asyncio.gather(
+            self._fetch_sensor_readings(center_lat, center_lon, radius_km=50.0),
+            self._fetch_satellite_cache(center_lat, center_lon),
         )
 
-        # Fetch cached satellite data
-        satellite_data = await self._fetch_satellite_cache(center_lat, center_lon)
-
         # Run fusion
-        fusion_service = DataFusionService(self.calibration_model)
-        fused_points = fusion_service.fuse_data(
+        fused_points = self.fusion_service.fuse_data(
             sensor_readings=sensor_readings,
             satellite_data=satellite_data,
             timestamp=ts,
         )
 
-        # Filter to bounding box
-        results = []
-        for point in fused_points:
-            if (
-                bbox["south"] <= point.location.latitude <= bbox["north"]
-                and bbox["west"] <= point.location.longitude <= bbox["east"]
-            ):
-                results.append({
-                    "latitude": point.location.latitude,
-                    "longitude": point.location.longitude,
-                    "timestamp": ts.isoformat(),
-                    "sensor_pm25": point.sensor_pm25,
-                    "sensor_pm10": point.sensor_pm10,
-                    "satellite_aod": point.satellite_aod,
-                    "fused_pm25": point.fused_pm25,
-                    "fused_pm10": point.fused_pm10,
-                    "fused_aqi": point.fused_aqi,
-                    "confidence": point.confidence,
-                    "data_sources": point.data_sources,
-                })
-
-        return results
+        # Filter to bounding box with one vectorized mask
+        lats = np.fromiter(
+            (p.location.latitude for p in fused_points),
+            dtype=np.float64,
+            count=len(fused_points),
+        )
+        lngs = np.fromiter(
+            (p.location.longitude for p in fused_points),
+            dtype=np.float64,
+            count=len(fused_points),
+        )
+        inside = np.flatnonzero(
+            (lats >= bbox.south) & (lats <= bbox.north)
+            & (lngs >= bbox.west) & (lngs <= bbox.east)
+        )
+
+        return list(map(fused_points.__getitem__, inside.tolist()))
 
     async def trigger_fusion(self) -> int:
         """Manually trigger data fusion for the current time.
@@ -389,82 +720,73 @@ class AirQualityApplicationService:
         """
         ts = datetime.utcnow()
 
-        # Get all active sensors
-        sensor_readings = await self._fetch_sensor_readings(
-            latitude=0, longitude=0, radius_km=1000.0
+        # Get all active sensors and satellite data from cache
+        sensor_readings, satellite_data = await asyncio.gather(
+            self._fetch_sensor_readings(latitude=0, longitude=0, radius_km=1000.0),
+            self._fetch_satellite_cache(0, 0),
         )
 
         if not sensor_readings:
             return 0
 
-        # Get satellite data from cache
-        satellite_data = await self._fetch_satellite_cache(0, 0)
-
         # Run fusion
-        fusion_service = DataFusionService(self.calibration_model)
-        fused_points = fusion_service.fuse_data(
+        fused_points = self.fusion_service.fuse_data(
             sensor_readings=sensor_readings,
             satellite_data=satellite_data,
             timestamp=ts,
         )
 
-        # Cache fused results
-        for point in fused_points:
-            if point.fused_aqi is not None and self.cache:
-                aqi_data = {
-                    "location_lat": point.location.latitude,
-                    "location_lng": point.location.longitude,
-                    "aqi_value": point.fused_aqi,
-                    "fused_pm25": point.fused_pm25,
-                    "fused_pm10": point.fused_pm10,
-                    "confidence": point.confidence,
-                    "data_sources": point.data_sources,
-                    "timestamp": ts.isoformat(),
-                }
-                await self.cache.set_aqi(
-                    point.location.latitude,
-                    point.location.longitude,
-                    10.0,
-                    aqi_data,
-                )
+        # Cache fused results in one pipelined write
+        if self.cache:
+            await self.cache.set_aqi_many(
+                fused_aqi_entries(fused_points, ts.isoformat()),
+                FUSION_CACHE_RADIUS_KM,
+            )
 
         return len(fused_points)
 
-    async def get_fused_map_data(self, bbox: Dict[str, float]) -> Dict:
+    async def get_fused_map_data(self, bbox: BoundingBox) -> Dict:
         """Get fused data formatted for map visualization.
 
         Parameters
         ----------
         bbox:
-            Bounding box with keys: north, south, east, west
+            Bounding box (north, south, east, west)
 
         Returns
         -------
         dict
             Map visualization data with grid cells.
         """
-        fused_data = await self.get_fused_data(bbox)
-
-        grid_cells = []
-        for point in fused_data:
-            if point.get("fused_aqi") is not None:
-                category = get_category_for_aqi(point["fused_aqi"])
-                grid_cells.append({
-                    "lat": point["latitude"],
-                    "lng": point["longitude"],
-                    "aqi_value": point["fused_aqi"],
-                    "level": category.level.value,
-                    "color": category.color_hex,
-                    "confidence": point["confidence"],
-                    "data_sources": point["data_sources"],
-                    "fused_pm25": point.get("fused_pm25"),
-                })
+        points = [
+            p
+            for p in await self._fused_points_in_bbox(bbox, datetime.utcnow())
+            if p.fused_aqi is not None
+        ]
+        levels, colors = get_levels_and_colors(
+            np.fromiter(
+                (p.fused_aqi for p in points), dtype=np.int64, count=len(points)
+            )
+        )
+        grid_cells = [
+            {
+                "lat": point.location.latitude,
+                "lng": point.location.longitude,
+                "aqi_value": point.fused_aqi,
+                "level": level,
+                "color": color,
+                "confidence": point.confidence,
+                "data_sources": point.data_sources,
+                "fused_pm25": point.fused_pm25,
+            }
+            for point, level, color in zip(points, levels, colors)
+        ]
 
         return {
             "grid_cells": grid_cells,
             "total": len(grid_cells),
-            "bbox": bbox,
-            "generated_at": datetime.utcnow().isoformat(),
+            "bbox": bbox._asdict(),
+            "generated_at": _iso_now(),
         }
 
     # =====================================================================
@@ -482,12 +804,11 @@ class AirQualityApplicationService:
         # Get active sensors
         sensors = await self._get_active_sensors()
 
-        sensor_results = []
-        for sensor in sensors:
-            sensor_id = sensor.get("sensor_id", sensor.get("id", ""))
-            result = await self.get_sensor_validation(UUID(sensor_id) if sensor_id else None)
-            if result:
-                sensor_results.append(result)
+        sensor_results = [
+            result
+            for _, result in await self._validate_sensors(sensors)
+            if result and not isinstance(result, Exception)
+        ]
 
         valid = [s for s in sensor_results if s.get("is_valid", False)]
         correlations = [s["correlation"] for s in sensor_results if "correlation" in s]
@@ -497,14 +818,10 @@ class AirQualityApplicationService:
             "total_sensors": len(sensor_results),
             "valid_sensors": len(valid),
             "invalid_sensors": len(sensor_results) - len(valid),
-            "average_correlation": (
-                sum(correlations) / len(correlations) if correlations else 0.0
-            ),
-            "average_bias": (
-                sum(biases) / len(biases) if biases else 0.0
-            ),
+            "average_correlation": fmean(correlations) if correlations else 0.0,
+            "average_bias": fmean(biases) if biases else 0.0,
             "sensors": sensor_results,
-            "generated_at": datetime.utcnow().isoformat(),
+            "generated_at": _iso_now(),
         }
 
     async def get_sensor_validation(
@@ -537,18 +854,16 @@ class AirQualityApplicationService:
                     str(sensor_id), start, end, limit=100
                 )
 
-                for reading in readings:
-                    if reading.pm25 > 0:
-                        sensor_values.append(reading.pm25)
-                        # Look up satellite value from cache
-                        cached = await self.cache.get_aqi(
-                            reading.latitude, reading.longitude, 10.0
-                        )
-                        if cached and cached.get("fused_pm25") is not None:
-                            satellite_values.append(cached["fused_pm25"])
-                        else:
-                            # Remove the sensor value too to keep arrays aligned
-                            sensor_values.pop()
+                readings = [r for r in readings if r.pm25 > 0]
+                references = await self._reference_pm25(readings)
+                # Keep only readings with a satellite value so arrays align
+                pairs = [
+                    (reading.pm25, reference)
+                    for reading, reference in zip(readings, references)
+                    if reference is not None
+                ]
+                if pairs:
+                    sensor_values, satellite_values = map(list, zip(*pairs))
             except Exception as e:
                 logger.warning("Error fetching sensor data for validation: %s", e)
 
@@ -590,18 +905,41 @@ class AirQualityApplicationService:
             Number of sensors validated.
         """
         sensors = await self._get_active_sensors()
-        count = 0
+        results = await self._validate_sensors(sensors)
+        return sum(not isinstance(result, Exception) for _, result in results)
+
+    async def _validate_sensors(self, sensors: List[Dict]) -> List[Tuple[str, Any]]:
+        """Validate many sensors concurrently.
+
+        At most ``_VALIDATION_CONCURRENCY`` validations run at once.
+        Sensors without an id are skipped; failures are logged and
+        returned in place of the result.
 
-        for sensor in sensors:
-            sensor_id = sensor.get("sensor_id", sensor.get("id", ""))
-            if sensor_id:
-                try:
-                    await self.get_sensor_validation(UUID(sensor_id))
-                    count += 1
-                except Exception as e:
-                    logger.warning("Validation failed for sensor %s: %s", sensor_id, e)
+        Returns
+        -------
+        list
+            (sensor_id, result) pairs, one per sensor with an id; the
+            result is the validation dict, None, or the raised exception
+        """
+        sensor_ids = [
+            sensor_id
+            for sensor_id in (s.get("sensor_id", s.get("id", "")) for s in sensors)
+            if sensor_id
+        ]
+        semaphore = asyncio.Semaphore(_VALIDATION_CONCURRENCY)
 
-        return count
+        async def validate(sensor_id: str) -> Optional[Dict]:
+            async with semaphore:
+                return await self.get_sensor_validation(_parse_uuid(sensor_id))
+
+        results = await asyncio.gather(
+            *(validate(sensor_id) for sensor_id in sensor_ids),
+            return_exceptions=True,
+        )
+        for sensor_id, result in zip(sensor_ids, results):
+            if isinstance(result, Exception):
+                logger.warning("Validation failed for sensor %s: %s", sensor_id, result)
+        return list(zip(sensor_ids, results))
 
     # =====================================================================
     # Calibration Use Cases
@@ -615,23 +953,32 @@ class AirQualityApplicationService:
         dict
             Model status including training state and feature names.
         """
-        model_exists = os.path.exists(self.calibration_model.model_path)
-        last_trained = None
-
-        if model_exists:
-            try:
-                mtime = os.path.getmtime(self.calibration_model.model_path)
-                last_trained = datetime.fromtimestamp(mtime).isoformat()
-            except OSError:
-                pass
-
         return {
             "is_trained": self.calibration_model.is_trained,
             "model_path": self.calibration_model.model_path,
             "feature_names": CalibrationModel.FEATURE_NAMES,
-            "last_trained": last_trained,
+            "last_trained": self._calibration_last_trained(),
         }
 
+    def _calibration_last_trained(self) -> Optional[str]:
+        """Modification time of the model file as ISO time (None if missing).
+
+        The stat is reused for ``_CALIBRATION_STAT_TTL`` seconds; retraining
+        invalidates it.
+        """
+        path = self.calibration_model.model_path
+        now = time.monotonic()
+        checked_at, checked_path, last_trained = self._calibration_stat
+        if checked_path == path and now - checked_at < _CALIBRATION_STAT_TTL:
+            return last_trained
+
+        try:
+            last_trained = datetime.fromtimestamp(os.path.getmtime(path)).isoformat()
+        except OSError:
+            last_trained = None
+        self._calibration_stat = (now, path, last_trained)
+        return last_trained
+
     async def get_calibration_metrics(self) -> Dict:
         """Get calibration model performance metrics.
 
@@ -652,8 +999,8 @@ class AirQualityApplicationService:
             }
 
         # Get evaluation data
-        test_data = await self._get_training_pairs(days=7)
-        if len(test_data) < 3:
+        X, y = await self._get_training_pairs(days=7)
+        if len(y) < 3:
             return {
                 "r_squared": 0.0,
                 "rmse": 0.0,
@@ -662,7 +1009,7 @@ class AirQualityApplicationService:
                 "feature_importance": {},
             }
 
-        metrics = self.calibration_model.evaluate(test_data)
+        metrics = self.calibration_model.evaluate_array(X, y)
 
         # Get feature importance from the model
         importance = {}
@@ -706,18 +1053,19 @@ class AirQualityApplicationService:
         """
         from fastapi import HTTPException
 
-        training_data = await self._get_training_pairs(days=days)
+        X, y = await self._get_training_pairs(days=days)
 
-        if len(training_data) < min_samples:
+        if len(y) < min_samples:
             raise HTTPException(
                 status_code=400,
                 detail=(
-                    f"Insufficient training data: {len(training_data)} samples "
+                    f"Insufficient training data: {len(y)} samples "
                     f"(need at least {min_samples})"
                 ),
             )
 
-        result = self.calibration_model.train(training_data)
+        result = self.calibration_model.train_array(X, y)
+        self._calibration_stat = _NO_CALIBRATION_STAT
 
         return {
             "model_version": result.model_version,
@@ -739,8 +1087,8 @@ class AirQualityApplicationService:
         latitude: float,
         longitude: float,
         radius_km: float = 50.0,
-    ) -> List[Dict]:
-        """Fetch sensor readings from Sensor Service as fusion-ready dicts."""
+    ) -> List[FusionInput]:
+        """Fetch sensor readings from Sensor Service as fusion inputs."""
         if not self.sensor_client:
             return []
 
@@ -749,14 +1097,7 @@ class AirQualityApplicationService:
                 latitude, longitude, radius_km, limit=100
             )
             return [
-                {
-                    "latitude": r.latitude,
-                    "longitude": r.longitude,
-                    "pm25": r.pm25,
-                    "pm10": r.pm10,
-                    "temperature": 25.0,
-                    "humidity": 50.0,
-                }
+                FusionInput(r.latitude, r.longitude, r.pm25, r.pm10)
                 for r in readings
             ]
         except Exception as e:
@@ -796,55 +1137,95 @@ class AirQualityApplicationService:
 
     async def _get_training_pairs(
         self, days: int = 30
-    ) -> List[tuple]:
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """Get matched sensor-satellite pairs for training/evaluation.
 
-        Returns list of (feature_dict, satellite_reference_value) tuples.
+        Returns
+        -------
+        tuple of np.ndarray
+            ``(X, y)``: an ``(n, len(FEATURE_NAMES))`` float32 feature
+            matrix and the ``(n,)`` satellite reference values.
         """
-        pairs = []
+        n_features = len(CalibrationModel.FEATURE_NAMES)
+        X = np.empty((0, n_features), dtype=np.float32)
+        y = np.empty(0, dtype=np.float64)
 
         if not self.sensor_client:
-            return pairs
+            return X, y
 
         try:
             sensors = await self.sensor_client.get_all_active_sensors()
             end = datetime.utcnow()
             start = end - timedelta(days=days)
 
-            for sensor in sensors[:20]:  # Limit to 20 sensors for performance
-                sensor_id = sensor.get("sensor_id", sensor.get("id", ""))
-                if not sensor_id:
-                    continue
-
-                readings = await self.sensor_client.get_sensor_readings(
-                    sensor_id, start, end, limit=100
+            sensor_ids = [
+                sensor_id
+                for sensor_id in (
+                    s.get("sensor_id", s.get("id", ""))
+                    for s in sensors[:20]  # Limit to 20 sensors for performance
                 )
+                if sensor_id
+            ]
+            reading_lists = await asyncio.gather(
+                *(
+                    self.sensor_client.get_sensor_readings(
+                        sensor_id, start, end, limit=100
+                    )
+                    for sensor_id in sensor_ids
+                ),
+                return_exceptions=True,
+            )
+            readings = [
+                r
+                for rs in reading_lists
+                if not isinstance(rs, BaseException)
+                for r in rs
+                if r.pm25 > 0
+            ]
 
-                for reading in readings:
-                    if reading.pm25 <= 0:
-                        continue
+            references = await self._reference_pm25(readings)
 
-                    # Look up satellite reference from cache
-                    cached = await self.cache.get_aqi(
-                        reading.latitude, reading.longitude, 10.0
-                    )
-                    if not cached or cached.get("fused_pm25") is None:
-                        continue
-
-                    features = {
-                        "raw_pm25": reading.pm25,
-                        "temperature": 25.0,
-                        "humidity": 50.0,
-                        "satellite_aod": 0.5,
-                        "hour": reading.timestamp.hour,
-                        "day_of_week": reading.timestamp.weekday(),
-                    }
-                    pairs.append((features, cached["fused_pm25"]))
+            # Fill the feature matrix in place (columns in FEATURE_NAMES
+            # order; covariates without a data source use their defaults).
+            X = np.empty((len(readings), n_features), dtype=np.float32)
+            y = np.empty(len(readings), dtype=np.float64)
+            n = 0
+            for reading, reference in zip(readings, references):
+                if reference is None:
+                    continue
+                ts = reading.timestamp
+                X[n] = (reading.pm25, 25.0, 50.0, 0.5, ts.hour, ts.weekday())
+                y[n] = reference
+                n += 1
+            X, y = X[:n], y[:n]
 
         except Exception as e:
             logger.warning("Error collecting training pairs: %s", e)
 
-        return pairs
+        return X, y
+
+    async def _reference_pm25(self, readings: List[Any]) -> List[Optional[float]]:
+        """Fused PM2.5 cached at each reading's location (None if absent).
+
+        Sensors report from fixed spots, so each distinct cache location
+        is looked up once, all in a single batch.
+        """
+        locations = list(
+            dict.fromkeys(
+                (round(r.latitude, 3), round(r.longitude, 3)) for r in readings
+            )
+        )
+        if not locations:
+            return []
+        cached_values = await self.cache.get_aqi_many(locations, 10.0)
+        references = {
+            location: cached.get("fused_pm25") if cached else None
+            for location, cached in zip(locations, cached_values)
+        }
+        return [
+            references[(round(r.latitude, 3), round(r.longitude, 3))]
+            for r in readings
+        ]
 
     async def _get_pollutants_for_location(
         self,
@@ -874,23 +1255,17 @@ class AirQualityApplicationService:
             if not readings:
                 return {}
 
-            # Aggregate readings (average)
-            pollutants: Dict[str, List[float]] = {}
-            for reading in readings:
-                for pollutant, value in [
-                    ("pm25", reading.pm25),
-                    ("pm10", reading.pm10),
-                    ("co", reading.co),
-                    ("no2", reading.no2),
-                    ("so2", reading.so2),
-                    ("o3", reading.o3),
-                ]:
-                    if value > 0:
-                        if pollutant not in pollutants:
-                            pollutants[pollutant] = []
-                        pollutants[pollutant].append(value)
-
-            return {k: sum(v) / len(v) for k, v in pollutants.items() if v}
+            # Aggregate readings (average of positive values per pollutant)
+            values = np.array([_reading_values(r) for r in readings], dtype=np.float64)
+            valid = values > 0
+            counts = np.count_nonzero(valid, axis=0)
+            sums = values.sum(axis=0, where=valid)
+
+            return {
+                pollutant: float(total / count)
+                for pollutant, total, count in zip(_POLLUTANTS, sums, counts)
+                if count
+            }
 
         except Exception as e:
             logger.warning(f"Error fetching sensor data: {e}")
@@ -899,43 +1274,176 @@ class AirQualityApplicationService:
     async def _generate_grid_cells(
         self,
         query: GetMapDataQuery,
+        geohashes: Optional[List[str]] = None,
     ) -> List[MapGridCell]:
-        """Generate grid cells for map visualization."""
-        cells = []
-
-        # Calculate grid dimensions
-        lat_step = query.grid_size or 0.1
-        lng_step = query.grid_size or 0.1
-
-        lat = query.min_lat
-        while lat <= query.max_lat:
-            lng = query.min_lng
-            while lng <= query.max_lng:
-                # Get AQI for grid center
-                pollutants = await self._get_pollutants_for_location(
-                    lat, lng, lat_step * 50  # Approximate radius
+        """Generate grid cells for map visualization.
+
+        Cells are the geohash cells for the query's zoom level (or just
+        ``geohashes`` when given).  Fetches every reading around the
+        viewport with one bulk sensor query, indexes the sensor locations
+        in a ball tree and averages the readings within the search radius
+        of every cell center.  If the Sensor Service cannot answer bbox
+        queries, falls back to concurrent per-cell radius queries.
+        """
+        precision = geohash.precision_for_zoom(query.zoom_level)
+        if geohashes is None:
+            geohashes = geohash.covering(
+                query.min_lat,
+                query.min_lng,
+                query.max_lat,
+                query.max_lng,
+                precision,
+            )
+        if not geohashes:
+            return []
+
+        centers = np.array([geohash.decode(gh) for gh in geohashes])
+        node_lats, node_lngs = centers[:, 0], centers[:, 1]
+        timestamp = _iso_now()
+
+        if not self.sensor_client:
+            # Development fallback: same sample pollutants for every node
+            pollutants = await self._get_pollutants_for_location(
+                query.min_lat, query.min_lng, 0.0
+            )
+            aqi_result = self.aqi_calculator.calculate_composite_aqi(pollutants)
+            category = get_category_for_aqi(aqi_result.aqi_value)
+            return [
+                MapGridCell(
+                    lat=lat,
+                    lng=lng,
+                    aqi_value=aqi_result.aqi_value,
+                    level=category.level.value,
+                    color=category.color_hex,
+                    sensor_count=1,
+                    last_updated=timestamp,
+                    geohash=gh,
                 )
+                for gh, (lat, lng) in zip(geohashes, centers.tolist())
+            ]
 
-                if pollutants:
-                    aqi_result = self.aqi_calculator.calculate_composite_aqi(pollutants)
-                    category = get_category_for_aqi(aqi_result.aqi_value)
-
-                    cells.append(
-                        MapGridCell(
-                            lat=lat,
-                            lng=lng,
-                            aqi_value=aqi_result.aqi_value,
-                            level=category.level.value,
-                            color=category.color_hex,
-                            sensor_count=1,  # Would be calculated from actual data
-                            last_updated=datetime.utcnow().isoformat(),
-                        )
-                    )
+        # Each node searches the circle around its cell; cells narrow in
+        # longitude away from the equator, so the radius follows latitude.
+        lat_span, lng_span = geohash.cell_size(precision)
+        radii_km = 0.5 * _KM_PER_DEGREE * np.hypot(
+            lat_span, lng_span * np.cos(np.radians(node_lats))
+        )
 
-                lng += lng_step
-            lat += lat_step
+        # Widen the bulk fetch by the search radius so nodes on the edge
+        # still see every sensor in range.
+        lat_margin = float(radii_km.max()) / _KM_PER_DEGREE
+        widest_lat = min(float(np.abs(node_lats).max()), 89.0)
+        lng_margin = lat_margin / np.cos(np.radians(widest_lat))
+        readings = await self.sensor_client.get_readings_in_bbox(
+            float(node_lats.min()) - lat_margin,
+            float(node_lngs.min()) - lng_margin,
+            float(node_lats.max()) + lat_margin,
+            float(node_lngs.max()) + lng_margin,
+        )
+        if readings is None:
+            # Sensor Service without bbox support: one radius query per cell
+            means, sensors = await self._aggregate_per_cell(
+                node_lats, node_lngs, radii_km
+            )
+        elif readings:
+            means, sensors = self._aggregate_with_index(
+                readings, node_lats, node_lngs, radii_km
+            )
+        else:
+            return []
 
-        return cells
+        occupied = np.flatnonzero(~np.isnan(means).all(axis=1))
+        aqi_array = self.aqi_calculator.calculate_composite_aqi_batch(
+            means[occupied], _POLLUTANTS
+        )
+        levels, colors = get_levels_and_colors(aqi_array)
+
+        return [
+            MapGridCell(
+                lat=lat,
+                lng=lng,
+                aqi_value=aqi,
+                level=level,
+                color=color,
+                sensor_count=sensor_count,
+                last_updated=timestamp,
+                geohash=geohashes[n],
+            )
+            for n, lat, lng, aqi, level, color, sensor_count in zip(
+                occupied.tolist(),
+                node_lats[occupied].tolist(),
+                node_lngs[occupied].tolist(),
+                aqi_array.tolist(),
+                levels,
+                colors,
+                sensors[occupied].tolist(),
+            )
+        ]
+
+    def _aggregate_with_index(
+        self,
+        readings: List[Any],
+        node_lats: np.ndarray,
+        node_lngs: np.ndarray,
+        radii_km: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Average the readings within each grid node's search radius.
+
+        Returns per-node pollutant means (NaN where no sensor reported the
+        pollutant) and per-node reading counts.
+        """
+        coords = np.array(
+            [(r.latitude, r.longitude) for r in readings], dtype=np.float64
+        )
+        values = np.array([_reading_values(r) for r in readings], dtype=np.float64)
+        index = SensorSpatialIndex(coords[:, 0], coords[:, 1])
+
+        hits = index.query_radius(node_lats, node_lngs, radii_km)
+        sensors = np.fromiter(map(len, hits), dtype=np.intp, count=len(hits))
+        nodes = np.repeat(np.arange(len(hits)), sensors)
+        members = values[np.concatenate(hits)] if len(hits) else values[:0]
+
+        valid = members > 0
+        sums = np.zeros((len(hits), len(_POLLUTANTS)))
+        counts = np.zeros((len(hits), len(_POLLUTANTS)), dtype=np.int32)
+        np.add.at(sums, nodes, np.where(valid, members, 0.0))
+        np.add.at(counts, nodes, valid)
+
+        means = np.divide(sums, counts, out=np.full_like(sums, np.nan), where=counts > 0)
+        return means, sensors
+
+    async def _aggregate_per_cell(
+        self,
+        node_lats: np.ndarray,
+        node_lngs: np.ndarray,
+        radii_km: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-node radius queries, fanned out concurrently.
+
+        Same return shape as :meth:`_aggregate_with_index`; nodes with data
+        count as one sensor since the radius query only returns averages.
+        At most ``MAP_FALLBACK_CONCURRENCY`` queries are in flight across
+        all map requests.
+        """
+
+        async def fetch(lat: float, lng: float, radius_km: float) -> Dict[str, float]:
+            async with self._grid_semaphore:
+                return await self._get_pollutants_for_location(lat, lng, radius_km)
+
+        results = await asyncio.gather(
+            *(
+                fetch(lat, lng, radius_km)
+                for lat, lng, radius_km in zip(
+                    node_lats.tolist(), node_lngs.tolist(), radii_km.tolist()
+                )
+            )
+        )
+        means = np.array(
+            [[pollutants.get(p, np.nan) for p in _POLLUTANTS] for pollutants in results],
+            dtype=np.float64,
+        ).reshape(len(results), len(_POLLUTANTS))
+        sensors = np.array([1 if pollutants else 0 for pollutants in results], dtype=np.intp)
+        return means, sensors
 
     async def _get_historical_sensor_data(
         self,
@@ -948,11 +1456,11 @@ class AirQualityApplicationService:
             now = datetime.utcnow()
             return [
                 SensorDataPoint(
-                    timestamp=now - timedelta(hours=i),
-                    pollutants={"pm25": 30 + i * 2, "pm10": 50},
-                    aqi=50 + i * 3,
+                    timestamp=now - age,
+                    pollutants={"pm25": pm25, "pm10": 50},
+                    aqi=aqi,
                 )
-                for i in range(12, 0, -1)
+                for age, pm25, aqi in _SAMPLE_HISTORY
             ]
 
         # Query repository for historical data
@@ -960,19 +1468,12 @@ class AirQualityApplicationService:
 
     def _empty_result(self, lat: float, lng: float) -> GetCurrentAQIResult:
         """Create an empty result when no data is available."""
-        return GetCurrentAQIResult(
+        return dataclasses.replace(
+            _EMPTY_RESULT,
             location_lat=lat,
             location_lng=lng,
-            aqi_value=0,
-            level="GOOD",
-            category="Good",
-            color="#00E400",
-            dominant_pollutant="none",
             pollutants={},
-            health_message="No air quality data available for this location.",
-            caution_message="None",
-            timestamp=datetime.utcnow().isoformat(),
-            data_source="none",
+            timestamp=_iso_now(),
         )
 
     def _format_pollutants(
@@ -986,23 +1487,6 @@ class AirQualityApplicationService:
             result["individual_aqis"] = self.aqi_calculator.get_all_pollutant_aqis(pollutants)
         return result
 
-    def _result_to_dict(self, result: GetCurrentAQIResult) -> Dict:
-        """Convert result to dictionary for caching."""
-        return {
-            "location_lat": result.location_lat,
-            "location_lng": result.location_lng,
-            "aqi_value": result.aqi_value,
-            "level": result.level,
-            "category": result.category,
-            "color": result.color,
-            "dominant_pollutant": result.dominant_pollutant,
-            "pollutants": result.pollutants,
-            "health_message": result.health_message,
-            "caution_message": result.caution_message,
-            "timestamp": result.timestamp,
-            "data_source": result.data_source,
-        }
-
     def _result_from_cache(self, cached: Dict) -> GetCurrentAQIResult:
         """Create result from cached data."""
         return GetCurrentAQIResult(
@@ -1020,76 +1504,82 @@ class AirQualityApplicationService:
             data_source=cached.get("data_source", "cache"),
         )
 
-    def _map_result_from_cache(
-        self,
-        cached: List[Dict],
-        query: GetMapDataQuery,
-    ) -> GetMapDataResult:
-        """Create map result from cached data."""
-        cells = [
-            MapGridCell(
-                lat=cell["lat"],
-                lng=cell["lng"],
-                aqi_value=cell["aqi_value"],
-                level=cell["level"],
-                color=cell["color"],
-                sensor_count=cell.get("sensor_count", 0),
-                last_updated=cell.get("last_updated", ""),
+    def _pack_cell(self, cell: MapGridCell) -> bytes:
+        """Pack a grid cell into its fixed-size cache record.
+
+        Only AQI, sensor count and update time are stored: the location
+        comes from the geohash key and level/color follow from the AQI.
+        """
+        updated = (
+            int(
+                datetime.fromisoformat(cell.last_updated)
+                .replace(tzinfo=timezone.utc)
+                .timestamp()
             )
-            for cell in cached
-        ]
-        return GetMapDataResult(
-            grid_cells=cells,
-            min_lat=query.min_lat,
-            min_lng=query.min_lng,
-            max_lat=query.max_lat,
-            max_lng=query.max_lng,
-            zoom_level=query.zoom_level,
-            generated_at=datetime.utcnow().isoformat(),
+            if cell.last_updated
+            else 0
         )
+        return _CELL_STRUCT.pack(cell.aqi_value, cell.sensor_count, updated)
 
-    def _grid_cell_to_dict(self, cell: MapGridCell) -> Dict:
-        """Convert grid cell to dictionary for caching."""
-        return {
-            "lat": cell.lat,
-            "lng": cell.lng,
-            "aqi_value": cell.aqi_value,
-            "level": cell.level,
-            "color": cell.color,
-            "sensor_count": cell.sensor_count,
-            "last_updated": cell.last_updated,
-        }
+    def _unpack_cells(self, packed: List[Tuple[str, bytes]]) -> Dict[str, MapGridCell]:
+        """Rebuild grid cells from cached (geohash, record) pairs."""
+        if not packed:
+            return {}
+        records = np.frombuffer(b"".join(blob for _, blob in packed), dtype=_CELL_DTYPE)
+
+        cells = {}
+        for (gh, _), aqi, sensor_count, updated in zip(
+            packed,
+            records["aqi"].tolist(),
+            records["sensor_count"].tolist(),
+            records["updated"].tolist(),
+        ):
+            lat, lng = geohash.decode(gh)
+            category = get_category_for_aqi(aqi)
+            cells[gh] = MapGridCell(
+                lat=lat,
+                lng=lng,
+                aqi_value=aqi,
+                level=category.level.value,
+                color=category.color_hex,
+                sensor_count=sensor_count,
+                last_updated=_iso_at(updated) if updated else "",
+                geohash=gh,
+            )
+        return cells
+
+    def _forecast_to_cache(self, result: GetForecastResult) -> Dict:
+        """Create the cache entry for a forecast result.
 
-    def _forecast_to_dict(self, result: GetForecastResult) -> Dict:
-        """Convert forecast to dictionary for caching."""
+        Data points are stored column by column, with timestamps as epoch
+        microseconds, so reading an entry back needs no per-point dicts
+        or ISO date parsing.
+        """
+        points = result.data_points
         return {
             "location_lat": result.location_lat,
             "location_lng": result.location_lng,
-            "generated_at": result.generated_at.isoformat(),
+            "generated_at": result.generated_at,
             "forecast_hours": result.forecast_hours,
             "current_aqi": result.current_aqi,
             "average_aqi": result.average_aqi,
             "max_aqi": result.max_aqi,
             "overall_trend": result.overall_trend,
             "health_recommendation": result.health_recommendation,
-            "data_points": [
-                {
-                    "timestamp": dp.timestamp.isoformat(),
-                    "predicted_aqi": dp.predicted_aqi,
-                    "min_aqi": dp.min_aqi,
-                    "max_aqi": dp.max_aqi,
-                    "confidence": dp.confidence,
-                    "trend": dp.trend,
-                    "level": dp.level,
-                }
-                for dp in result.data_points
-            ],
+            "points": {
+                "ts": [(dp.timestamp - _EPOCH) // _MICROSECOND for dp in points],
+                "pred": [dp.predicted_aqi for dp in points],
+                "min": [dp.min_aqi for dp in points],
+                "max": [dp.max_aqi for dp in points],
+                "conf": [dp.confidence for dp in points],
+                "trend": [dp.trend for dp in points],
+                "level": [dp.level for dp in points],
+            },
         }
 
     def _forecast_result_from_cache(self, cached: Dict) -> GetForecastResult:
         """Create forecast result from cached data."""
-        from datetime import datetime
-
+        points = cached["points"]
         return GetForecastResult(
             location_lat=cached["location_lat"],
             location_lng=cached["location_lng"],
@@ -1102,15 +1592,23 @@ class AirQualityApplicationService:
             health_recommendation=cached.get("health_recommendation", ""),
             data_points=[
                 ForecastDataPoint(
-                    timestamp=datetime.fromisoformat(dp["timestamp"]),
-                    predicted_aqi=dp["predicted_aqi"],
-                    min_aqi=dp["min_aqi"],
-                    max_aqi=dp["max_aqi"],
-                    confidence=dp["confidence"],
-                    trend=dp["trend"],
-                    level=dp["level"],
+                    timestamp=_EPOCH + timedelta(microseconds=ts),
+                    predicted_aqi=pred,
+                    min_aqi=min_aqi,
+                    max_aqi=max_aqi,
+                    confidence=conf,
+                    trend=trend,
+                    level=level,
+                )
+                for ts, pred, min_aqi, max_aqi, conf, trend, level in zip(
+                    points["ts"],
+                    points["pred"],
+                    points["min"],
+                    points["max"],
+                    points["conf"],
+                    points["trend"],
+                    points["level"],
                 )
-                for dp in cached.get("data_points", [])
             ],
         )
 
@@ -1120,13 +1618,18 @@ class AirQualityApplicationService:
 # =============================================================================
 
 
-def get_air_quality_service() -> AsyncGenerator[AirQualityApplicationService, None]:
+async def get_air_quality_service(
+    request: Request,
+) -> AsyncGenerator[AirQualityApplicationService, None]:
     """FastAPI dependency that yields an AirQualityApplicationService instance.
 
+    Reuses the Redis cache and API clients the application lifespan keeps
+    on ``app.state``; only those missing (e.g. an app without the
+    lifespan) are connected for the request and closed afterwards.
+
     .. deprecated::
         Prefer ``src.interfaces.api.dependencies.get_air_quality_service``
-        which reuses lifespan-managed singletons instead of creating new
-        connections per request.
+        which also reuses one service instance across requests.
 
     Usage::
 
@@ -1140,33 +1643,28 @@ def get_air_quality_service() -> AsyncGenerator[AirQualityApplicationService, No
     from ...infrastructure.external.google_maps_client import GoogleMapsClient
     from ...infrastructure.external.sensor_service_client import SensorServiceClient
 
-    async def _generate():
-        cache = RedisCache()
-        await cache.connect()
-
-        google_client = GoogleMapsClient()
-        await google_client.connect()
+    state = request.app.state
+    owned = []
 
-        sensor_client = SensorServiceClient()
-        await sensor_client.connect()
-
-        aqi_calculator = AQICalculator()
-        prediction_service = PredictionService()
+    async def _shared_or_connect(name: str, factory: Any) -> Any:
+        client = getattr(state, name, None)
+        if client is None:
+            client = factory()
+            await client.connect()
+            owned.append(client)
+        return client
 
+    try:
         service = AirQualityApplicationService(
-            aqi_calculator=aqi_calculator,
-            prediction_service=prediction_service,
-            cache=cache,
-            google_client=google_client,
-            sensor_client=sensor_client,
+            aqi_calculator=AQICalculator(),
+            prediction_service=PredictionService(),
+            cache=await _shared_or_connect("cache", RedisCache),
+            google_client=await _shared_or_connect("google_client", GoogleMapsClient),
+            sensor_client=await _shared_or_connect("sensor_client", SensorServiceClient),
             calibration_model=CalibrationModel(),
             cross_validator=CrossValidationService(),
         )
-        try:
-            yield service
-        finally:
-            await cache.close()
-            await google_client.close()
-            await sensor_client.close()
-
-    return _generate()
+        yield service
+    finally:
+        for client in owned:
+            await client.close()
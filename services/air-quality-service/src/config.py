@@ -40,6 +40,20 @@ class Settings(BaseSettings):
     CACHE_TTL_DEFAULT: int = 300  # 5 minutes
     CACHE_TTL_MAP_DATA: int = 600  # 10 minutes
     CACHE_TTL_FORECAST: int = 1800  # 30 minutes
+    MAP_PREFETCH_NEIGHBORS: bool = True  # warm cells around cached viewports
+    MAP_FALLBACK_CONCURRENCY: int = 32  # per-cell sensor queries in flight
+    FORECAST_GEOHASH_PRECISION: int = 5  # ~5 km forecast cache cells
+    # Start the sensor query for current AQI alongside the cache lookup
+    # (cancelled on a hit); trades extra sensor load for miss latency
+    SPECULATIVE_SENSOR_FETCH: bool = False
+    SPECULATIVE_SENSOR_FETCH_MAX_HIT_RATE: float = 0.5
+    # Per-worker copy of current-AQI payloads in front of Redis; kept
+    # short so fusion writes from other workers show up quickly (0 = off)
+    AQI_LOCAL_CACHE_SIZE: int = 10_000
+    AQI_LOCAL_CACHE_TTL: float = 30.0
+    # Memoized single-reading calibrations keyed by rounded features;
+    # trades exactness for speed on chatty sensors (0 = off, exact)
+    CALIBRATION_PREDICTION_CACHE_SIZE: int = 0
 
     # ------------------------------------------------------------------
     # RabbitMQ
@@ -5,7 +5,7 @@ from typing import Dict
 from uuid import UUID, uuid4
 
 
-@dataclass
+@dataclass(slots=True)
 class AirQualityIndex:
     """AQI Entity."""
 
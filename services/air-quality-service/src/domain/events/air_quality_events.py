@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class AQICalculated:
     location_lat: float = 0.0
     location_lng: float = 0.0
@@ -11,7 +11,7 @@ class AQICalculated:
     level: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class AQIThresholdExceeded:
     factory_id: UUID = None
     aqi_value: int = 0
@@ -19,11 +19,21 @@ infrastructure, or interface layers.
 """
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
 
 from ..value_objects.aqi_level import AQILevel
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; batches fall back to NumPy
+    njit = None
+    prange = range
+
 
 # =============================================================================
 # US EPA AQI Breakpoints (40 CFR Part 58, Appendix G)
@@ -89,6 +99,84 @@ AQI_BREAKPOINTS: Dict[str, list] = {
     ],
 }
 
+# Per pollutant: upper concentration bounds (ascending, for bisection) and
+# (C_low, I_low, slope) per breakpoint row, slopes divided out once
+_SCALAR_BREAKPOINTS: Dict[str, Tuple[list, list]] = {
+    pollutant: (
+        [c_high for _, c_high, _, _ in rows],
+        [
+            (c_low, i_low, (i_high - i_low) / (c_high - c_low))
+            for c_low, c_high, i_low, i_high in rows
+        ],
+    )
+    for pollutant, rows in AQI_BREAKPOINTS.items()
+}
+
+
+@lru_cache(maxsize=32)
+def _breakpoint_table(pollutants: Tuple[str, ...]) -> np.ndarray:
+    """(P, K, 4) float breakpoint table for lower-case pollutant codes."""
+    table = np.array([AQI_BREAKPOINTS[p] for p in pollutants], dtype=np.float64)
+    table.flags.writeable = False
+    return table
+
+
+# Batches with at least this many rows use the compiled numba kernel
+# (when numba is installed); smaller batches are not worth the dispatch.
+NUMBA_MIN_ROWS = 2_048
+
+
+def _composite_aqi_kernel(conc: np.ndarray, table: np.ndarray) -> np.ndarray:
+    """Composite AQI per row of ``conc`` against a (P, K, 4) breakpoint table.
+
+    Same rules as ``AQICalculator.calculate_aqi``: first matching
+    breakpoint row wins, 500 when no row matches, NaN/negative entries are
+    skipped.  Written as explicit loops so numba can compile and
+    parallelize it.
+    """
+    rows, pollutants = conc.shape
+    ranges = table.shape[1]
+    out = np.zeros(rows, dtype=np.int64)
+    for j in prange(rows):
+        best = -1.0
+        for p in range(pollutants):
+            c = conc[j, p]
+            if not c >= 0:
+                continue
+            aqi = 500.0
+            for k in range(ranges):
+                c_low, c_high = table[p, k, 0], table[p, k, 1]
+                if c_low <= c and c <= c_high:
+                    i_low, i_high = table[p, k, 2], table[p, k, 3]
+                    aqi = np.rint(((i_high - i_low) / (c_high - c_low)) * (c - c_low) + i_low)
+                    break
+            best = max(best, aqi)
+        out[j] = max(best, 0.0)
+    return out
+
+
+if njit is not None:
+    # No fastmath: the kernel relies on NaN comparisons and exact rounding
+    _composite_aqi_jit = njit(parallel=True, cache=True)(_composite_aqi_kernel)
+
+
+def warm_up_batch_kernel() -> bool:
+    """Compile (or load from the numba cache) the batch AQI kernel.
+
+    Call once at service start so the first large batch does not pay
+    the JIT cost inside a request.
+
+    Returns
+    -------
+    bool
+        True if the compiled kernel is available, False without numba
+    """
+    if njit is None:
+        return False
+    _composite_aqi_jit(np.full((1, 1), 10.0), _breakpoint_table(("pm25",)))
+    return True
+
+
 # AQI Category definitions
 AQI_CATEGORIES = {
     (0, 50): {
@@ -136,7 +224,40 @@ AQI_CATEGORIES = {
 }
 
 
-@dataclass
+# Category info for every AQI 0-500, so lookups are one list index
+_CATEGORY_BY_AQI = [
+    next(info for (low, high), info in AQI_CATEGORIES.items() if low <= aqi <= high)
+    for aqi in range(501)
+]
+
+# Display name per level ("UNHEALTHY_SENSITIVE" -> "UNHEALTHY SENSITIVE")
+_CATEGORY_NAMES: Dict[AQILevel, str] = {
+    info["level"]: info["level"].value.replace("_", " ")
+    for info in AQI_CATEGORIES.values()
+}
+
+
+@lru_cache(maxsize=4096)
+def _pollutant_aqi(pollutant: str, concentration: float) -> int:
+    """AQI for a known, lower-case pollutant code and a non-negative value.
+
+    Memoized: sensors repeat the same readings across polls and cells.
+    """
+    c_highs, rows = _SCALAR_BREAKPOINTS[pollutant]
+    # Ranges are ascending and disjoint: the first range ending at or
+    # above the concentration is the only one that can contain it
+    k = bisect_left(c_highs, concentration)
+    if k < len(rows):
+        c_low, i_low, slope = rows[k]
+        if c_low <= concentration:
+            # Linear interpolation formula
+            return round(slope * (concentration - c_low) + i_low)
+
+    # Concentration between ranges or above the highest breakpoint
+    return 500
+
+
+@dataclass(slots=True, frozen=True)
 class AQIResult:
     """Result of AQI calculation."""
 
@@ -149,6 +270,39 @@ class AQIResult:
     dominant_pollutant: str
 
 
+def _no_data_result(health_message: str) -> AQIResult:
+    """Zero AQI result for calls without usable pollutant data."""
+    return AQIResult(
+        aqi_value=0,
+        level=AQILevel.GOOD,
+        category="Good",
+        color="#00E400",
+        health_message=health_message,
+        caution_message="None",
+        dominant_pollutant="none",
+    )
+
+
+# Results are immutable, so every caller can share these
+_NO_DATA_RESULT = _no_data_result("No data available.")
+_NO_VALID_DATA_RESULT = _no_data_result("No valid pollutant data available.")
+
+
+@lru_cache(maxsize=4096)
+def _composite_result(aqi_value: int, dominant_pollutant: str) -> AQIResult:
+    """Shared result for a composite AQI (0-500) and its dominant pollutant."""
+    category_info = _CATEGORY_BY_AQI[aqi_value]
+    return AQIResult(
+        aqi_value=aqi_value,
+        level=category_info["level"],
+        category=_CATEGORY_NAMES[category_info["level"]],
+        color=category_info["color"],
+        health_message=category_info["health_message"],
+        caution_message=category_info["caution_message"],
+        dominant_pollutant=dominant_pollutant,
+    )
+
+
 class AQICalculator:
     """US EPA AQI Calculator domain service.
 
@@ -190,17 +344,7 @@ class AQICalculator:
         if pollutant_lower not in self.breakpoints:
             raise ValueError(f"Unknown pollutant: {pollutant}")
 
-        breakpoint_table = self.breakpoints[pollutant_lower]
-
-        # Find the appropriate breakpoint range
-        for c_low, c_high, i_low, i_high in breakpoint_table:
-            if c_low <= concentration <= c_high:
-                # Linear interpolation formula
-                aqi = ((i_high - i_low) / (c_high - c_low)) * (concentration - c_low) + i_low
-                return round(aqi)
-
-        # Concentration exceeds highest breakpoint (capped at 500)
-        return 500
+        return _pollutant_aqi(pollutant_lower, concentration)
 
     def calculate_composite_aqi(self, pollutants: Dict[str, float]) -> AQIResult:
         """Calculate composite AQI from multiple pollutant concentrations.
@@ -219,15 +363,7 @@ class AQICalculator:
             Complete AQI result with category, color, and health messages
         """
         if not pollutants:
-            return AQIResult(
-                aqi_value=0,
-                level=AQILevel.GOOD,
-                category="Good",
-                color="#00E400",
-                health_message="No data available.",
-                caution_message="None",
-                dominant_pollutant="none",
-            )
+            return _NO_DATA_RESULT
 
         # Calculate individual AQI for each pollutant
         individual_aqis: Dict[str, int] = {}
@@ -239,32 +375,72 @@ class AQICalculator:
                 continue  # Skip unknown pollutants
 
         if not individual_aqis:
-            return AQIResult(
-                aqi_value=0,
-                level=AQILevel.GOOD,
-                category="Good",
-                color="#00E400",
-                health_message="No valid pollutant data available.",
-                caution_message="None",
-                dominant_pollutant="none",
-            )
+            return _NO_VALID_DATA_RESULT
 
         # Find the dominant pollutant (highest AQI)
         dominant_pollutant = max(individual_aqis, key=individual_aqis.get)
-        aqi_value = individual_aqis[dominant_pollutant]
 
-        # Get category information
-        category_info = self._get_category(aqi_value)
+        # Category details come from the per-AQI table, built once per value
+        return _composite_result(individual_aqis[dominant_pollutant], dominant_pollutant)
+
+    def calculate_composite_aqi_batch(
+        self,
+        concentrations: np.ndarray,
+        pollutants: Sequence[str],
+    ) -> np.ndarray:
+        """Calculate composite AQI values for many locations at once.
 
-        return AQIResult(
-            aqi_value=aqi_value,
-            level=category_info["level"],
-            category=category_info["level"].value.replace("_", " "),
-            color=category_info["color"],
-            health_message=category_info["health_message"],
-            caution_message=category_info["caution_message"],
-            dominant_pollutant=dominant_pollutant,
-        )
+        Vectorized equivalent of ``calculate_composite_aqi(...).aqi_value``
+        for an N x P concentration matrix.  Each value is matched against
+        the breakpoint rows exactly like :meth:`calculate_aqi` (including
+        the 500 fallback for concentrations that fall between or above
+        the breakpoint ranges).  Large batches run in a compiled numba
+        kernel when numba is installed.
+
+        Parameters
+        ----------
+        concentrations:
+            Array of shape (N, P); NaN or negative entries mean "no data"
+        pollutants:
+            Pollutant codes for the P columns
+
+        Returns
+        -------
+        np.ndarray
+            Integer AQI per row (0 for rows without any valid data)
+
+        Raises
+        ------
+        ValueError
+            If a pollutant code is not recognized
+        """
+        conc = np.asarray(concentrations, dtype=np.float64).reshape(-1, len(pollutants))
+        try:
+            table = _breakpoint_table(tuple(p.lower() for p in pollutants))
+        except KeyError as e:
+            raise ValueError(f"Unknown pollutant: {e.args[0]}") from None
+
+        if njit is not None and len(conc) >= NUMBA_MIN_ROWS:
+            return _composite_aqi_jit(np.ascontiguousarray(conc), table)
+
+        # table: (P, K, 4) -> four (P, K) arrays
+        c_low, c_high, i_low, i_high = np.moveaxis(table, -1, 0)
+
+        with np.errstate(invalid="ignore"):
+            c = conc[:, :, None]
+            in_range = (c_low <= c) & (c <= c_high)
+            row = in_range.argmax(axis=2)
+            found = in_range.any(axis=2)
+
+            cols = np.arange(len(pollutants))[None, :]
+            cl, ch = c_low[cols, row], c_high[cols, row]
+            il, ih = i_low[cols, row], i_high[cols, row]
+            aqi = np.rint(((ih - il) / (ch - cl)) * (conc - cl) + il)
+            aqi = np.where(found, aqi, 500.0)
+            aqi = np.where(conc >= 0, aqi, -1.0)  # NaN compares False
+
+        composite = aqi.max(axis=1, initial=-1.0)
+        return np.maximum(composite, 0).astype(np.int64)
 
     def get_aqi_category(self, aqi: int) -> str:
         """Get the AQI category name for an AQI value.
@@ -279,8 +455,7 @@ class AQICalculator:
         str
             Category name (e.g., "Good", "Moderate", "Unhealthy")
         """
-        category_info = self._get_category(aqi)
-        return category_info["level"].value.replace("_", " ")
+        return _CATEGORY_NAMES[self._get_category(aqi)["level"]]
 
     def get_aqi_color(self, aqi: int) -> str:
         """Get the color code for an AQI value.
@@ -345,12 +520,16 @@ class AQICalculator:
         """
         # Cap at 500
         aqi = min(aqi, 500)
+        if isinstance(aqi, int) and aqi >= 0:
+            return _CATEGORY_BY_AQI[aqi]
 
+        # Non-integer (float, NumPy scalar) or negative values keep the
+        # band-scan semantics
         for (low, high), info in self.categories.items():
             if low <= aqi <= high:
                 return info
 
-        # Default to Hazardous for anything above 500
+        # Default to Hazardous for anything outside the bands
         return self.categories[(301, 500)]
 
     def get_all_pollutant_aqis(self, pollutants: Dict[str, float]) -> Dict[str, int]:
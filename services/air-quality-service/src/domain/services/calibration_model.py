@@ -1,7 +1,7 @@
 """Calibration model domain service.
 
 ML-based sensor calibration using satellite reference data.  Uses
-gradient boosting to learn the mapping from raw sensor readings
+histogram-based gradient boosting to learn the mapping from raw sensor readings
 (with environmental covariates) to satellite-validated values.
 
 **Domain layer rule**: this module must NOT import from the application,
@@ -9,13 +9,22 @@ infrastructure, or interface layers.
 """
 from __future__ import annotations
 
+import json
 import os
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import joblib
 import numpy as np
-from sklearn.ensemble import GradientBoostingRegressor
+from sklearn.base import clone
+from sklearn.ensemble import GradientBoostingRegressor, HistGradientBoostingRegressor
+from sklearn.inspection import permutation_importance
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; rows fall back to NumPy
+    njit = None
 
 
 @dataclass
@@ -40,6 +49,362 @@ class EvaluationMetrics:
     bias: float
 
 
+def _ensemble_kernel(
+    X: np.ndarray,
+    roots: np.ndarray,
+    feature: np.ndarray,
+    threshold: np.ndarray,
+    missing_left: np.ndarray,
+    left: np.ndarray,
+    right: np.ndarray,
+    value: np.ndarray,
+) -> np.ndarray:
+    """Sum of the leaf values each row of ``X`` reaches in the flattened trees.
+
+    Walks each tree only as deep as the row goes (leaves point to
+    themselves); written as plain loops so numba can compile it.
+    """
+    out = np.zeros(X.shape[0])
+    for i in range(X.shape[0]):
+        total = 0.0
+        for t in range(roots.shape[0]):
+            node = roots[t]
+            while left[node] != node:
+                v = X[i, feature[node]]
+                if v <= threshold[node] or (v != v and missing_left[node]):
+                    node = left[node]
+                else:
+                    node = right[node]
+            total += value[node]
+        out[i] = total
+    return out
+
+
+if njit is not None:
+    _ensemble_jit = njit(cache=True)(_ensemble_kernel)
+
+
+def _regression_metrics_kernel(
+    y_true: np.ndarray, y_pred: np.ndarray
+) -> Tuple[float, float, float, float]:
+    """``(r_squared, rmse, mae, bias)`` of ``y_pred`` in one pass.
+
+    The spread of ``y_true`` is accumulated incrementally (Welford), so no
+    separate pass for its mean is needed.  Plain loop so numba can compile it.
+    """
+    n = y_true.shape[0]
+    mean = ss_tot = ss_res = abs_sum = err_sum = 0.0
+    for i in range(n):
+        y = y_true[i]
+        delta = y - mean
+        mean += delta / (i + 1)
+        ss_tot += delta * (y - mean)
+        err = y_pred[i] - y
+        ss_res += err * err
+        abs_sum += abs(err)
+        err_sum += err
+
+    r_squared = 1 - ss_res / ss_tot if ss_tot > 0 else 0.0
+    return r_squared, np.sqrt(ss_res / n), abs_sum / n, err_sum / n
+
+
+def _regression_metrics_numpy(
+    y_true: np.ndarray, y_pred: np.ndarray
+) -> Tuple[float, float, float, float]:
+    """NumPy version of ``_regression_metrics_kernel``."""
+    err = y_pred - y_true
+    ss_res = float(np.dot(err, err))
+    centered = y_true - np.mean(y_true)
+    ss_tot = float(np.dot(centered, centered))
+    r_squared = 1 - ss_res / ss_tot if ss_tot > 0 else 0.0
+    return (
+        r_squared,
+        np.sqrt(ss_res / len(err)),
+        np.mean(np.abs(err)),
+        np.mean(err),
+    )
+
+
+if njit is not None:
+    _regression_metrics = njit(cache=True)(_regression_metrics_kernel)
+else:
+    _regression_metrics = _regression_metrics_numpy
+
+
+class _TreeEnsemble:
+    """Flattened gradient-boosted trees for fast single-row prediction.
+
+    The nodes of all trees are concatenated into flat arrays (children
+    as indices into them), so one row descends every tree at once: one
+    vectorized step per tree level instead of sklearn's per-call input
+    validation and per-tree dispatch.  Leaves point to themselves, so
+    trees that reach a leaf early stay there for the remaining levels.
+    """
+
+    def __init__(self, model, trees: List[Tuple], input_dtype: type) -> None:
+        """``trees``: per tree (is_leaf, feature, threshold, missing_left,
+        left, right, value, depth) node arrays with tree-local children."""
+        offsets = np.cumsum([0] + [len(tree[0]) for tree in trees])
+
+        columns: List[List[np.ndarray]] = [[] for _ in range(6)]
+        depth = 0
+        for offset, tree in zip(offsets, trees):
+            is_leaf, feature, threshold, missing_left, left, right, value, depths = tree
+            own = np.arange(len(is_leaf)) + offset
+            for column, array in zip(
+                columns,
+                (
+                    np.where(is_leaf, 0, feature),
+                    threshold,
+                    missing_left,
+                    np.where(is_leaf, own, left + offset),
+                    np.where(is_leaf, own, right + offset),
+                    value,
+                ),
+            ):
+                column.append(array)
+            depth = max(depth, int(depths.max()))
+
+        feature, threshold, missing_left, left, right, value = (
+            np.concatenate(column) for column in columns
+        )
+        self.feature = feature.astype(np.intp)
+        self.threshold = threshold.astype(np.float64)
+        self.missing_left = missing_left.astype(bool)
+        self.left = left.astype(np.intp)
+        self.right = right.astype(np.intp)
+        self.value = value.astype(np.float64)
+        self.roots = offsets[:-1].astype(np.intp)
+        self.depth = depth
+        # sklearn trees compare float32 inputs, histogram trees float64
+        self.input_dtype = input_dtype
+
+        # Initial (pre-boosting) prediction, recovered from one sklearn call
+        probe = np.zeros((1, model.n_features_in_))
+        self.base = float(model.predict(probe)[0] - self._boost(probe)[0])
+
+    @classmethod
+    def from_model(cls, model) -> Optional["_TreeEnsemble"]:
+        """Flatten a fitted (histogram) gradient boosting regressor.
+
+        Returns None for any other or unfitted model.
+        """
+        if isinstance(model, HistGradientBoostingRegressor) and hasattr(
+            model, "_predictors"
+        ):
+            trees = []
+            for (predictor,) in model._predictors:
+                nodes = predictor.nodes
+                trees.append((
+                    nodes["is_leaf"].astype(bool),
+                    nodes["feature_idx"],
+                    nodes["num_threshold"],
+                    nodes["missing_go_to_left"],
+                    nodes["left"],
+                    nodes["right"],
+                    nodes["value"],  # shrinkage already applied
+                    nodes["depth"],
+                ))
+            return cls(model, trees, np.float64)
+
+        if isinstance(model, GradientBoostingRegressor) and hasattr(
+            model, "estimators_"
+        ):
+            trees = []
+            for (estimator,) in model.estimators_:
+                tree = estimator.tree_
+                is_leaf = tree.children_left < 0
+                depths = np.zeros(tree.node_count, dtype=np.intp)
+                for node in np.flatnonzero(~is_leaf):  # children follow parents
+                    depths[tree.children_left[node]] = depths[node] + 1
+                    depths[tree.children_right[node]] = depths[node] + 1
+                trees.append((
+                    is_leaf,
+                    tree.feature,
+                    tree.threshold,
+                    getattr(tree, "missing_go_to_left", np.zeros(tree.node_count)),
+                    tree.children_left,
+                    tree.children_right,
+                    tree.value.reshape(tree.node_count) * model.learning_rate,
+                    depths,
+                ))
+            return cls(model, trees, np.float32)
+
+        return None
+
+    def _boost(self, X: np.ndarray) -> np.ndarray:
+        """Sum of the (shrunk) tree outputs per row of ``X``."""
+        X = np.ascontiguousarray(X, dtype=self.input_dtype)
+        if njit is not None:
+            return _ensemble_jit(
+                X,
+                self.roots,
+                self.feature,
+                self.threshold,
+                self.missing_left,
+                self.left,
+                self.right,
+                self.value,
+            )
+
+        rows = np.arange(len(X))[:, None]
+        node = np.broadcast_to(self.roots, (len(X), len(self.roots)))
+        for _ in range(self.depth):
+            value = X[rows, self.feature[node]]
+            goes_left = (value <= self.threshold[node]) | (
+                np.isnan(value) & self.missing_left[node]
+            )
+            node = np.where(goes_left, self.left[node], self.right[node])
+        return self.value[node].sum(axis=1)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Predictions for an ``(n_rows, n_features)`` matrix."""
+        return self.base + self._boost(X)
+
+    def save(self, directory: str, model_stamp: Tuple[int, int]) -> None:
+        """Write the node arrays as ``.npy`` files under ``directory``.
+
+        ``model_stamp`` is the ``(mtime_ns, size)`` of the model file these
+        trees came from; ``load`` ignores the arrays once it changes.  Each
+        file is replaced atomically, so processes that have the previous
+        arrays mapped keep reading them.
+        """
+        os.makedirs(directory, exist_ok=True)
+        for name in _TREE_ARRAYS:
+            _replace_file(
+                os.path.join(directory, f"{name}.npy"),
+                lambda f, name=name: np.save(f, getattr(self, name)),
+            )
+        meta = {
+            "base": self.base,
+            "depth": self.depth,
+            "input_dtype": np.dtype(self.input_dtype).name,
+            "model_stamp": list(model_stamp),
+        }
+        _replace_file(
+            os.path.join(directory, "meta.json"),
+            lambda f: f.write(json.dumps(meta).encode()),
+        )
+
+    @classmethod
+    def load(
+        cls, directory: str, model_stamp: Tuple[int, int]
+    ) -> Optional["_TreeEnsemble"]:
+        """Memory-map trees written by ``save`` for the given model file.
+
+        Returns None when there are no saved arrays or they belong to a
+        different version of the model file.
+        """
+        try:
+            with open(os.path.join(directory, "meta.json"), "rb") as f:
+                meta = json.loads(f.read())
+            if tuple(meta["model_stamp"]) != tuple(model_stamp):
+                return None
+            ensemble = cls.__new__(cls)
+            for name in _TREE_ARRAYS:
+                setattr(
+                    ensemble,
+                    name,
+                    np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r"),
+                )
+        except (OSError, ValueError, KeyError):
+            return None
+        ensemble.base = float(meta["base"])
+        ensemble.depth = int(meta["depth"])
+        ensemble.input_dtype = np.dtype(meta["input_dtype"]).type
+        return ensemble
+
+
+# Node arrays persisted by _TreeEnsemble.save
+_TREE_ARRAYS = ("roots", "feature", "threshold", "missing_left", "left", "right", "value")
+
+
+def _replace_file(path: str, write) -> None:
+    """Write ``path`` through a temporary file and rename it into place."""
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+
+def _tree_dir(model_path: str) -> str:
+    """Directory holding the flattened trees saved next to a model file."""
+    return f"{model_path}.trees"
+
+
+@lru_cache(maxsize=8)
+def _load_model(path: str, mtime_ns: int, size: int):
+    """Deserialize a saved model, once per file version.
+
+    Every ``CalibrationModel`` in the process (API dependencies, event
+    consumers, ...) shares the result; ``mtime_ns`` and ``size`` make a
+    rewritten file load again.  Callers must not mutate the model in place.
+    """
+    return joblib.load(path)
+
+
+@lru_cache(maxsize=8)
+def _load_predictor(path: str, mtime_ns: int, size: int) -> Optional[_TreeEnsemble]:
+    """Flattened trees for a saved model, once per file version.
+
+    Maps the arrays saved alongside the model when they match it, so a
+    cold start skips unpickling the estimator; otherwise flattens the
+    deserialized model.
+    """
+    predictor = _TreeEnsemble.load(_tree_dir(path), (mtime_ns, size))
+    if predictor is None:
+        predictor = _TreeEnsemble.from_model(_load_model(path, mtime_ns, size))
+    return predictor
+
+
+# (feature, default when missing) in FEATURE_NAMES order
+_FEATURE_DEFAULTS = (
+    ("raw_pm25", 0),
+    ("temperature", 25),
+    ("humidity", 50),
+    ("satellite_aod", 0.5),
+    ("hour", 12),
+    ("day_of_week", 0),
+)
+
+
+def _feature_columns(features_list: Sequence[Dict], dtype: type) -> np.ndarray:
+    """Fill an ``(n, 6)`` feature matrix one column at a time.
+
+    Avoids building a Python list per row and converting the nested lists
+    afterwards; each column is written straight into the preallocated array.
+    """
+    n = len(features_list)
+    X = np.empty((n, len(_FEATURE_DEFAULTS)), dtype=dtype)
+    for column, (name, default) in enumerate(_FEATURE_DEFAULTS):
+        X[:, column] = np.fromiter(
+            (features.get(name, default) for features in features_list),
+            dtype=np.float64,
+            count=n,
+        )
+    return X
+
+
+# Rounding step per feature (FEATURE_NAMES order) for memoized calibrate()
+# calls: 0.1 ug/m3 PM2.5, 1 degree, 5 % humidity, 0.01 AOD, whole hours and
+# days.  Readings in the same step share one prediction, which is exact for
+# the rounded features; a reading close to a tree split may land on the
+# other side of it, so results can differ from the unrounded prediction.
+_QUANTIZATION_STEPS = (0.1, 1.0, 5.0, 0.01, 1.0, 1.0)
+
+
+def _quantized_features(features: Dict) -> Tuple[Optional[float], ...]:
+    """Feature tuple rounded to ``_QUANTIZATION_STEPS``; missing is None."""
+    key = []
+    for (name, default), step in zip(_FEATURE_DEFAULTS, _QUANTIZATION_STEPS):
+        value = features.get(name, default)
+        if value is None or value != value:
+            key.append(None)
+        else:
+            key.append(round(value / step) * step)
+    return tuple(key)
+
+
 class CalibrationModel:
     """ML model for sensor calibration using satellite reference.
 
@@ -61,20 +426,66 @@ class CalibrationModel:
         "day_of_week",
     ]
 
-    def __init__(self, model_path: Optional[str] = None):
+    def __init__(
+        self,
+        model_path: Optional[str] = None,
+        prediction_cache_size: int = 0,
+    ):
+        """Initialize the calibration model.
+
+        Parameters
+        ----------
+        model_path:
+            Where the trained model is loaded from and saved to.
+        prediction_cache_size:
+            Memoize up to this many ``calibrate()`` predictions keyed by
+            quantized features (see ``_QUANTIZATION_STEPS``); 0 disables it
+            and keeps predictions exact.
+        """
         self.model_path = model_path or "/app/models/calibration_model.joblib"
-        self.model = self._load_or_create_model()
+        # _fast_predictor is the inference path for calibrate(); rebuilt on
+        # training.  A saved model is only unpickled when first needed.
+        self._model, self._fast_predictor = self._load_or_create_model()
         self.is_trained = os.path.exists(self.model_path)
+        self._cached_predict = (
+            lru_cache(maxsize=prediction_cache_size)(self._predict_quantized)
+            if prediction_cache_size > 0
+            else None
+        )
 
-    def _load_or_create_model(self):
-        """Load existing model or create a new untrained one."""
-        if os.path.exists(self.model_path):
-            return joblib.load(self.model_path)
-        return GradientBoostingRegressor(
-            n_estimators=100,
+    @property
+    def model(self):
+        """The sklearn estimator (deserialized on first access)."""
+        if self._model is None:
+            stat = os.stat(self.model_path)
+            self._model = _load_model(self.model_path, stat.st_mtime_ns, stat.st_size)
+        return self._model
+
+    @model.setter
+    def model(self, model) -> None:
+        self._model = model
+
+    def _load_or_create_model(self) -> Tuple[object, Optional[_TreeEnsemble]]:
+        """Load existing model or create a new untrained one.
+
+        Returns the model (None until needed for a saved model) with its
+        flattened predictor (None when untrained).
+        """
+        try:
+            stat = os.stat(self.model_path)
+        except OSError:
+            return self._new_model(), None
+        return None, _load_predictor(self.model_path, stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    def _new_model() -> HistGradientBoostingRegressor:
+        """Untrained calibration model with the default hyperparameters."""
+        return HistGradientBoostingRegressor(
+            max_iter=100,
             max_depth=5,
             learning_rate=0.1,
             random_state=42,
+            early_stopping=False,
         )
 
     # ------------------------------------------------------------------
@@ -93,43 +504,127 @@ class CalibrationModel:
         dict
             ``{'pm25': calibrated_value, 'pm10': calibrated_value | None}``
         """
+        if self._cached_predict is None or not self.is_trained:
+            return self.calibrate_batch([features])[0]
+
+        calibrated_pm25 = self._cached_predict(_quantized_features(features))
+        raw_pm25 = features.get("raw_pm25")
+        raw_pm10 = features.get("raw_pm10")
+        calibrated_pm10 = (
+            raw_pm10 * (calibrated_pm25 / raw_pm25) if raw_pm25 and raw_pm10 else None
+        )
+        return {"pm25": calibrated_pm25, "pm10": calibrated_pm10}
+
+    def calibrate_batch(self, features_list: Sequence[Dict]) -> List[Dict]:
+        """Apply calibration to many raw sensor readings with one prediction.
+
+        Parameters
+        ----------
+        features_list:
+            Dicts with keys matching ``FEATURE_NAMES``.
+
+        Returns
+        -------
+        list[dict]
+            One ``calibrate()`` result per input, in order.
+        """
         if not self.is_trained:
-            return {
-                "pm25": features.get("raw_pm25"),
-                "pm10": features.get("raw_pm10"),
-            }
-
-        X = np.array(
-            [
-                [
-                    features.get("raw_pm25", 0),
-                    features.get("temperature", 25),
-                    features.get("humidity", 50),
-                    features.get("satellite_aod", 0.5),
-                    features.get("hour", 12),
-                    features.get("day_of_week", 0),
-                ]
+            return [
+                {"pm25": features.get("raw_pm25"), "pm10": features.get("raw_pm10")}
+                for features in features_list
             ]
+
+        X = _feature_columns(features_list, np.float64)
+        raw_pm10 = np.fromiter(
+            (features.get("raw_pm10") for features in features_list),
+            dtype=np.float64,
+            count=len(features_list),
         )
+        calibrated_pm25, calibrated_pm10 = self._calibrate_matrix(X, raw_pm10)
 
-        calibrated_pm25 = float(self.model.predict(X)[0])
+        return [
+            {"pm25": pm25, "pm10": None if pm10 != pm10 else pm10}
+            for pm25, pm10 in zip(calibrated_pm25.tolist(), calibrated_pm10.tolist())
+        ]
 
-        # Apply same calibration ratio to PM10 if available.
-        calibrated_pm10 = None
-        raw_pm25 = features.get("raw_pm25")
-        raw_pm10 = features.get("raw_pm10")
-        if raw_pm10 and raw_pm25 and raw_pm25 != 0:
-            ratio = calibrated_pm25 / raw_pm25
-            calibrated_pm10 = float(raw_pm10 * ratio)
+    def calibrate_columns(
+        self,
+        raw_pm25,
+        raw_pm10,
+        temperature,
+        humidity,
+        satellite_aod,
+        hour,
+        day_of_week=0,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Calibrate readings given as feature columns rather than dicts.
 
-        return {
-            "pm25": calibrated_pm25,
-            "pm10": calibrated_pm10,
-        }
+        Parameters
+        ----------
+        raw_pm25, raw_pm10, temperature, humidity, satellite_aod, hour, day_of_week:
+            Scalars or equal-length sequences; scalars apply to every
+            reading.  ``None`` entries are treated as missing (NaN).
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Calibrated PM2.5 and PM10 per reading; PM10 is NaN where it
+            cannot be derived.  Untrained models return the raw values.
+        """
+        columns = [
+            np.asarray(column, dtype=np.float64)
+            for column in (raw_pm25, temperature, humidity, satellite_aod, hour, day_of_week)
+        ]
+        n = np.broadcast(*columns).size
+        X = np.empty((n, len(self.FEATURE_NAMES)), dtype=np.float64)
+        for index, column in enumerate(columns):
+            X[:, index] = column
+        raw_pm10 = np.broadcast_to(np.asarray(raw_pm10, dtype=np.float64), (n,))
+
+        if not self.is_trained:
+            return X[:, 0].copy(), raw_pm10.copy()
+        return self._calibrate_matrix(X, raw_pm10)
+
+    def _predict(self, X: np.ndarray) -> np.ndarray:
+        """Calibrated PM2.5 for each row of feature matrix ``X``."""
+        if self._fast_predictor is not None:
+            return self._fast_predictor.predict(X)
+        return self.model.predict(X)
+
+    def _predict_quantized(self, key: Tuple[Optional[float], ...]) -> float:
+        """Calibrated PM2.5 for one quantized feature tuple (memoized)."""
+        return float(self._predict(np.array([key], dtype=np.float64))[0])
+
+    def _calibrate_matrix(
+        self, X: np.ndarray, raw_pm10: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Predict PM2.5 for feature matrix ``X`` and scale PM10 to match."""
+        calibrated_pm25 = self._predict(X)
+
+        # Apply same calibration ratio to PM10 if available (zero readings
+        # carry no ratio, like missing ones).
+        raw_pm25 = np.where(X[:, 0] == 0, np.nan, X[:, 0])
+        raw_pm10 = np.where(raw_pm10 == 0, np.nan, raw_pm10)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            calibrated_pm10 = raw_pm10 * (calibrated_pm25 / raw_pm25)
+        return calibrated_pm25, calibrated_pm10
 
     # ------------------------------------------------------------------
     # Training
     # ------------------------------------------------------------------
+    @classmethod
+    def feature_matrix(
+        cls, samples: List[Tuple[Dict, float]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Convert ``(feature_dict, reference)`` pairs to ``(X, y)`` arrays."""
+        X = _feature_columns([features for features, _ in samples], np.float32)
+        y = np.fromiter(
+            (reference for _, reference in samples),
+            dtype=np.float64,
+            count=len(samples),
+        )
+        return X, y
+
     def train(
         self,
         training_data: List[Tuple[Dict, float]],
@@ -151,54 +646,73 @@ class CalibrationModel:
         ValueError
             If fewer than 50 training samples are provided.
         """
-        if len(training_data) < 50:
-            raise ValueError("Need at least 50 samples for training")
+        X, y = self.feature_matrix(training_data)
+        return self.train_array(X, y)
 
-        X: List[List[float]] = []
-        y: List[float] = []
-
-        for features, reference in training_data:
-            X.append(
-                [
-                    features.get("raw_pm25", 0),
-                    features.get("temperature", 25),
-                    features.get("humidity", 50),
-                    features.get("satellite_aod", 0.5),
-                    features.get("hour", 12),
-                    features.get("day_of_week", 0),
-                ]
-            )
-            y.append(reference)
+    def train_array(self, X: np.ndarray, y: np.ndarray) -> TrainingResult:
+        """Train on a prebuilt feature matrix.
+
+        Parameters
+        ----------
+        X:
+            ``(n_samples, len(FEATURE_NAMES))`` feature matrix, columns in
+            ``FEATURE_NAMES`` order.
+        y:
+            ``(n_samples,)`` satellite reference values.
+
+        Returns
+        -------
+        TrainingResult
+            Model performance metrics and feature importance.
+
+        Raises
+        ------
+        ValueError
+            If fewer than 50 training samples are provided.
+        """
+        if len(y) < 50:
+            raise ValueError("Need at least 50 samples for training")
 
-        X_arr = np.array(X)
-        y_arr = np.array(y)
+        X_arr = np.asarray(X)
+        y_arr = np.asarray(y, dtype=np.float64)
 
-        # Fit model.
+        # Fit a fresh copy: the loaded model may be shared with other
+        # instances through the _load_model cache.
+        self.model = clone(self.model)
         self.model.fit(X_arr, y_arr)
 
         # Evaluate on training set.
-        y_pred = self.model.predict(X_arr)
-        ss_res = float(np.sum((y_arr - y_pred) ** 2))
-        ss_tot = float(np.sum((y_arr - np.mean(y_arr)) ** 2))
-        r_squared = 1 - ss_res / ss_tot if ss_tot > 0 else 0.0
-        rmse = float(np.sqrt(np.mean((y_arr - y_pred) ** 2)))
-        mae = float(np.mean(np.abs(y_arr - y_pred)))
+        y_pred = np.asarray(self.model.predict(X_arr), dtype=np.float64)
+        r_squared, rmse, mae, _ = map(float, _regression_metrics(y_arr, y_pred))
 
         # Persist model.
         os.makedirs(os.path.dirname(self.model_path), exist_ok=True)
         joblib.dump(self.model, self.model_path)
         self.is_trained = True
-
-        importance = dict(
-            zip(self.FEATURE_NAMES, self.model.feature_importances_)
-        )
+        self._fast_predictor = _TreeEnsemble.from_model(self.model)
+        if self._fast_predictor is not None:
+            stat = os.stat(self.model_path)
+            self._fast_predictor.save(
+                _tree_dir(self.model_path), (stat.st_mtime_ns, stat.st_size)
+            )
+        if self._cached_predict is not None:
+            self._cached_predict.cache_clear()
+
+        importances = getattr(self.model, "feature_importances_", None)
+        if importances is None:
+            # Histogram boosting has no impurity importances; measure how
+            # much shuffling each feature degrades the training fit instead
+            importances = permutation_importance(
+                self.model, X_arr, y_arr, n_repeats=5, random_state=42
+            ).importances_mean
+        importance = dict(zip(self.FEATURE_NAMES, importances))
 
         return TrainingResult(
-            model_version=f"v{len(training_data)}_{int(r_squared * 100)}",
+            model_version=f"v{len(y_arr)}_{int(r_squared * 100)}",
             r_squared=r_squared,
             rmse=rmse,
             mae=mae,
-            training_samples=len(training_data),
+            training_samples=len(y_arr),
             feature_importance=importance,
         )
 
@@ -220,32 +734,18 @@ class CalibrationModel:
         EvaluationMetrics
             R², RMSE, MAE, and bias on the test set.
         """
-        X: List[List[float]] = []
-        y_true: List[float] = []
-
-        for features, reference in test_data:
-            X.append(
-                [
-                    features.get("raw_pm25", 0),
-                    features.get("temperature", 25),
-                    features.get("humidity", 50),
-                    features.get("satellite_aod", 0.5),
-                    features.get("hour", 12),
-                    features.get("day_of_week", 0),
-                ]
-            )
-            y_true.append(reference)
-
-        X_arr = np.array(X)
-        y_true_arr = np.array(y_true)
-        y_pred = self.model.predict(X_arr)
-
-        ss_res = float(np.sum((y_true_arr - y_pred) ** 2))
-        ss_tot = float(np.sum((y_true_arr - np.mean(y_true_arr)) ** 2))
-        r_squared = 1 - ss_res / ss_tot if ss_tot > 0 else 0.0
-        rmse = float(np.sqrt(np.mean((y_true_arr - y_pred) ** 2)))
-        mae = float(np.mean(np.abs(y_true_arr - y_pred)))
-        bias = float(np.mean(y_pred - y_true_arr))
+        X, y = self.feature_matrix(test_data)
+        return self.evaluate_array(X, y)
+
+    def evaluate_array(self, X: np.ndarray, y: np.ndarray) -> EvaluationMetrics:
+        """Evaluate on a prebuilt feature matrix (see ``train_array``)."""
+        X_arr = np.asarray(X)
+        y_true_arr = np.asarray(y, dtype=np.float64)
+        y_pred = np.asarray(self.model.predict(X_arr), dtype=np.float64)
+
+        r_squared, rmse, mae, bias = map(
+            float, _regression_metrics(y_true_arr, y_pred)
+        )
 
         return EvaluationMetrics(
             r_squared=r_squared,
@@ -14,6 +14,11 @@ from uuid import UUID
 
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; statistics fall back to NumPy
+    njit = None
+
 
 @dataclass
 class ValidationResult:
@@ -39,6 +44,61 @@ class ValidationResult:
         return "poor"
 
 
+def _validation_stats_kernel(
+    sensor: np.ndarray, satellite: np.ndarray
+) -> Tuple[float, float, float, float, float]:
+    """``(correlation, bias, rmse, mae, satellite_mean)`` in one pass.
+
+    Means and co-moments are updated incrementally (Welford) rather than
+    from raw power sums, which keeps the correlation accurate for large
+    values.  Written as a plain loop so numba can compile it.
+    """
+    n = sensor.shape[0]
+    mean_x = mean_y = m2_x = m2_y = c_xy = 0.0
+    sum_diff = sum_abs = sum_sq = 0.0
+    for i in range(n):
+        x = sensor[i]
+        y = satellite[i]
+        dx = x - mean_x
+        dy = y - mean_y
+        mean_x += dx / (i + 1)
+        mean_y += dy / (i + 1)
+        m2_x += dx * (x - mean_x)
+        m2_y += dy * (y - mean_y)
+        c_xy += dx * (y - mean_y)
+        diff = x - y
+        sum_diff += diff
+        sum_abs += abs(diff)
+        sum_sq += diff * diff
+
+    denom = np.sqrt(m2_x * m2_y)
+    # Constant input has no defined correlation (np.corrcoef gives NaN too)
+    correlation = c_xy / denom if denom > 0 else np.nan
+    return correlation, sum_diff / n, np.sqrt(sum_sq / n), sum_abs / n, mean_y
+
+
+def _validation_stats_numpy(
+    sensor: np.ndarray, satellite: np.ndarray
+) -> Tuple[float, float, float, float, float]:
+    """NumPy version of ``_validation_stats_kernel``."""
+    diff = sensor - satellite
+    with np.errstate(invalid="ignore", divide="ignore"):
+        correlation = np.corrcoef(sensor, satellite)[0, 1]
+    return (
+        correlation,
+        np.mean(diff),
+        np.sqrt(np.mean(diff * diff)),
+        np.mean(np.abs(diff)),
+        np.mean(satellite),
+    )
+
+
+if njit is not None:
+    _validation_stats = njit(cache=True)(_validation_stats_kernel)
+else:
+    _validation_stats = _validation_stats_numpy
+
+
 class CrossValidationService:
     """Domain service for sensor vs satellite cross-validation."""
 
@@ -81,17 +141,15 @@ class CrossValidationService:
                 is_valid=False,
             )
 
-        sensor_arr = np.array(sensor_values)
-        satellite_arr = np.array(satellite_values)
+        sensor_arr = np.asarray(sensor_values, dtype=np.float64)
+        satellite_arr = np.asarray(satellite_values, dtype=np.float64)
 
-        # Calculate statistical metrics.
-        correlation = float(np.corrcoef(sensor_arr, satellite_arr)[0, 1])
-        bias = float(np.mean(sensor_arr - satellite_arr))
-        rmse = float(np.sqrt(np.mean((sensor_arr - satellite_arr) ** 2)))
-        mae = float(np.mean(np.abs(sensor_arr - satellite_arr)))
+        # Calculate statistical metrics in a single pass over both arrays.
+        correlation, bias, rmse, mae, sat_mean = map(
+            float, _validation_stats(sensor_arr, satellite_arr)
+        )
 
         # Determine validity.
-        sat_mean = float(np.mean(satellite_arr))
         relative_bias = abs(bias) / sat_mean if sat_mean > 0 else 1.0
         is_valid = correlation > 0.5 and relative_bias < self.deviation_threshold
 
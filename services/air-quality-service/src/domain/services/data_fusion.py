@@ -10,12 +10,60 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
+from scipy.spatial import cKDTree
+
+from ..value_objects.aqi_category import get_category_for_aqi
 from ..value_objects.location import Location
 
+# Simplified EPA PM2.5 segments: values up to _AQI_PM25_UPPER[i] (the last
+# segment is open-ended) map linearly from _AQI_PM25_LOW[i] onto
+# _AQI_BASE[i] + _AQI_SPAN[i] per _AQI_PM25_WIDTH[i].
+_AQI_PM25_UPPER = np.array([12.0, 35.4, 55.4, 150.4])
+_AQI_PM25_LOW = np.array([0.0, 12.0, 35.4, 55.4, 150.4])
+_AQI_PM25_WIDTH = np.array([12.0, 23.4, 20.0, 95.0, 100.0])
+_AQI_BASE = np.array([0.0, 50.0, 100.0, 150.0, 200.0])
+_AQI_SPAN = np.array([50.0, 50.0, 50.0, 50.0, 100.0])
+
+# Fused points are cached under the default current-AQI query radius so
+# /aqi/current lookups hit them.
+FUSION_CACHE_RADIUS_KM = 10.0
+
+# Below this many reading x cell pairs a direct distance scan beats
+# building a KD-tree.
+_BRUTE_FORCE_PAIRS = 65_536
+
+
+@dataclass(slots=True)
+class FusionInput:
+    """A sensor reading prepared for fusion.
+
+    Lighter than a per-reading dict; ``fuse_data`` accepts either.
+    """
+
+    latitude: float
+    longitude: float
+    pm25: Optional[float] = None
+    pm10: Optional[float] = None
+    temperature: Optional[float] = 25.0
+    humidity: Optional[float] = 50.0
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "FusionInput":
+        """Build from a reading dict (missing values become None)."""
+        return cls(
+            latitude=data["latitude"],
+            longitude=data["longitude"],
+            pm25=data.get("pm25"),
+            pm10=data.get("pm10"),
+            temperature=data.get("temperature"),
+            humidity=data.get("humidity"),
+        )
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FusedDataPoint:
     """Result of fusing multiple data sources."""
 
@@ -38,6 +86,72 @@ class FusedDataPoint:
     data_sources: List[str] = field(default_factory=list)
 
 
+def fused_point_to_dict(point: FusedDataPoint, timestamp: str) -> Dict:
+    """Convert a fused point to a current-AQI cache entry.
+
+    Fused entries share keys with the current-AQI lookup, so they carry
+    every current-AQI result field (plus the fusion details) and can be
+    served from the cache as-is.  Every writer of fused points must use
+    this builder.
+
+    Parameters
+    ----------
+    point:
+        Fused point with a non-null ``fused_aqi``
+    timestamp:
+        The fusion run's ISO time, formatted once for all points
+
+    Returns
+    -------
+    dict
+        JSON-ready cache entry.
+    """
+    category = get_category_for_aqi(point.fused_aqi)
+    return {
+        "location_lat": point.location.latitude,
+        "location_lng": point.location.longitude,
+        "aqi_value": point.fused_aqi,
+        "level": category.level.value,
+        "category": category.level.value.replace("_", " "),
+        "color": category.color_hex,
+        "dominant_pollutant": "pm25",
+        "pollutants": {
+            "concentrations": {
+                k: v
+                for k, v in (("pm25", point.fused_pm25), ("pm10", point.fused_pm10))
+                if v is not None
+            }
+        },
+        "health_message": category.health_message,
+        "caution_message": category.caution_message,
+        "timestamp": timestamp,
+        "data_source": "fusion",
+        "fused_pm25": point.fused_pm25,
+        "fused_pm10": point.fused_pm10,
+        "confidence": point.confidence,
+        "data_sources": point.data_sources,
+    }
+
+
+def fused_aqi_entries(
+    points: Sequence[FusedDataPoint], timestamp: str
+) -> List[Tuple[float, float, Dict]]:
+    """Build ``(latitude, longitude, entry)`` cache rows for fused points.
+
+    Points without a fused AQI are skipped.  Cache the rows under
+    :data:`FUSION_CACHE_RADIUS_KM`.
+    """
+    return [
+        (
+            point.location.latitude,
+            point.location.longitude,
+            fused_point_to_dict(point, timestamp),
+        )
+        for point in points
+        if point.fused_aqi is not None
+    ]
+
+
 class DataFusionService:
     """Domain service for multi-source data fusion.
 
@@ -53,7 +167,7 @@ class DataFusionService:
 
     def fuse_data(
         self,
-        sensor_readings: List[Dict],
+        sensor_readings: Sequence[Union[FusionInput, Dict]],
         satellite_data: Dict,
         timestamp: datetime,
     ) -> List[FusedDataPoint]:
@@ -62,8 +176,8 @@ class DataFusionService:
         Parameters
         ----------
         sensor_readings:
-            List of dicts with keys: latitude, longitude, pm25, pm10,
-            temperature, humidity.
+            ``FusionInput`` records, or dicts with keys: latitude,
+            longitude, pm25, pm10, temperature, humidity.
         satellite_data:
             Dict with ``grid_cells`` key containing satellite observations.
         timestamp:
@@ -74,50 +188,73 @@ class DataFusionService:
         list[FusedDataPoint]
             Fused data points with calibrated values and confidence.
         """
-        fused_points: List[FusedDataPoint] = []
+        readings = [
+            FusionInput.from_dict(reading) if isinstance(reading, dict) else reading
+            for reading in sensor_readings
+        ]
+        # Satellite value at every sensor location, in one lookup.
+        sat_values = self._get_satellite_values(satellite_data, readings)
 
-        for reading in sensor_readings:
-            lat = reading["latitude"]
-            lon = reading["longitude"]
-
-            # Get satellite value at sensor location.
-            sat_value = self._get_satellite_value(satellite_data, lat, lon)
-
-            # Prepare features for calibration.
-            features = {
-                "raw_pm25": reading.get("pm25"),
-                "raw_pm10": reading.get("pm10"),
-                "temperature": reading.get("temperature"),
-                "humidity": reading.get("humidity"),
-                "satellite_aod": sat_value,
-                "hour": timestamp.hour,
-            }
+        # Readings with any data; those with both sources are calibrated.
+        inputs: List[Tuple[FusionInput, Optional[float]]] = []
+        dual: List[Tuple[FusionInput, float]] = []
+        for reading, sat_value in zip(readings, sat_values):
+            if not (reading.pm25 or sat_value):
+                continue
+            inputs.append((reading, sat_value))
+            if reading.pm25 and sat_value:
+                dual.append((reading, sat_value))
 
+        # Calibrate every dual-source reading with one model prediction,
+        # straight from feature columns.
+        calibrated_batch = iter(())
+        if dual:
+            pm25_column, pm10_column = self.calibration_model.calibrate_columns(
+                raw_pm25=[reading.pm25 for reading, _ in dual],
+                raw_pm10=[reading.pm10 for reading, _ in dual],
+                temperature=[reading.temperature for reading, _ in dual],
+                humidity=[reading.humidity for reading, _ in dual],
+                satellite_aod=[sat_value for _, sat_value in dual],
+                hour=timestamp.hour,
+            )
+            calibrated_batch = zip(pm25_column.tolist(), pm10_column.tolist())
+
+        scored: List[Tuple[Dict, float]] = []
+        for reading, sat_value in inputs:
             # Apply calibration with confidence scoring.
-            if reading.get("pm25") and sat_value:
-                calibrated = self.calibration_model.calibrate(features)
+            if reading.pm25 and sat_value:
+                pm25, pm10 = next(calibrated_batch)
+                calibrated = {"pm25": pm25, "pm10": None if pm10 != pm10 else pm10}
                 confidence = 0.9  # High: both sources available
-            elif reading.get("pm25"):
+            elif reading.pm25:
                 calibrated = {
-                    "pm25": reading["pm25"],
-                    "pm10": reading.get("pm10"),
+                    "pm25": reading.pm25,
+                    "pm10": reading.pm10,
                 }
                 confidence = 0.6  # Medium: sensor only
-            elif sat_value:
+            else:
                 calibrated = {"pm25": self._aod_to_pm25(sat_value)}
                 confidence = 0.5  # Lower: satellite only
-            else:
-                continue
+            scored.append((calibrated, confidence))
 
+        # AQI for every fused PM2.5 value at once.
+        fused_aqis = self._calculate_aqi_batch(
+            [calibrated.get("pm25") for calibrated, _ in scored]
+        )
+
+        fused_points: List[FusedDataPoint] = []
+        for (reading, sat_value), (calibrated, confidence), fused_aqi in zip(
+            inputs, scored, fused_aqis
+        ):
             fused_point = FusedDataPoint(
-                location=Location(latitude=lat, longitude=lon),
+                location=Location(latitude=reading.latitude, longitude=reading.longitude),
                 timestamp=timestamp,
-                sensor_pm25=reading.get("pm25"),
-                sensor_pm10=reading.get("pm10"),
+                sensor_pm25=reading.pm25,
+                sensor_pm10=reading.pm10,
                 satellite_aod=sat_value,
                 fused_pm25=calibrated.get("pm25"),
                 fused_pm10=calibrated.get("pm10"),
-                fused_aqi=self._calculate_aqi(calibrated.get("pm25")),
+                fused_aqi=fused_aqi,
                 confidence=confidence,
                 data_sources=self._determine_sources(reading, sat_value),
             )
@@ -128,19 +265,35 @@ class DataFusionService:
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
-    def _get_satellite_value(
-        self, satellite_data: Dict, lat: float, lon: float
-    ) -> Optional[float]:
-        """Get interpolated satellite value at location (nearest cell)."""
+    def _get_satellite_values(
+        self, satellite_data: Dict, readings: Sequence[FusionInput]
+    ) -> List[Optional[float]]:
+        """Get the nearest satellite cell value at each reading location.
+
+        The grid is indexed once in a KD-tree and every reading is queried
+        in a single call, instead of scanning all cells per reading. Small
+        batches compare squared distances directly (no sqrt; the ordering
+        is the same).
+        """
         grid_cells = satellite_data.get("grid_cells", [])
         if not grid_cells:
-            return None
+            return [None] * len(readings)
+        if not readings:
+            return []
 
-        nearest = min(
-            grid_cells,
-            key=lambda c: ((c["lat"] - lat) ** 2 + (c["lon"] - lon) ** 2) ** 0.5,
+        grid = np.array(
+            [(cell["lat"], cell["lon"]) for cell in grid_cells], dtype=np.float64
         )
-        return nearest.get("value")
+        points = np.array(
+            [(r.latitude, r.longitude) for r in readings], dtype=np.float64
+        )
+        if len(points) * len(grid) <= _BRUTE_FORCE_PAIRS:
+            dlat = points[:, 0:1] - grid[:, 0]
+            dlon = points[:, 1:2] - grid[:, 1]
+            nearest = np.argmin(dlat * dlat + dlon * dlon, axis=1)
+        else:
+            _, nearest = cKDTree(grid).query(points)
+        return [grid_cells[i].get("value") for i in nearest.tolist()]
 
     def _aod_to_pm25(self, aod: float) -> float:
         """Convert Aerosol Optical Depth to PM2.5 estimate.
@@ -151,24 +304,34 @@ class DataFusionService:
 
     def _calculate_aqi(self, pm25: Optional[float]) -> Optional[int]:
         """Calculate AQI from PM2.5 using EPA breakpoints (simplified)."""
-        if pm25 is None:
-            return None
-        if pm25 <= 12:
-            return int(pm25 * 50 / 12)
-        if pm25 <= 35.4:
-            return int(50 + (pm25 - 12) * 50 / 23.4)
-        if pm25 <= 55.4:
-            return int(100 + (pm25 - 35.4) * 50 / 20)
-        if pm25 <= 150.4:
-            return int(150 + (pm25 - 55.4) * 50 / 95)
-        return int(200 + (pm25 - 150.4) * 100 / 100)
+        return self._calculate_aqi_batch([pm25])[0]
+
+    def _calculate_aqi_batch(
+        self, pm25_values: Sequence[Optional[float]]
+    ) -> List[Optional[int]]:
+        """``_calculate_aqi`` for many PM2.5 values with one breakpoint lookup.
+
+        Missing (None or NaN) values give None.
+        """
+        pm25 = np.array(pm25_values, dtype=np.float64)
+        segment = np.searchsorted(_AQI_PM25_UPPER, pm25)
+        aqi = (
+            _AQI_BASE[segment]
+            + (pm25 - _AQI_PM25_LOW[segment]) * _AQI_SPAN[segment] / _AQI_PM25_WIDTH[segment]
+        )
+        missing = np.isnan(aqi)
+        truncated = np.trunc(np.where(missing, 0.0, aqi)).astype(np.int64)
+        return [
+            None if is_missing else value
+            for value, is_missing in zip(truncated.tolist(), missing.tolist())
+        ]
 
     def _determine_sources(
-        self, reading: Dict, sat_value: Optional[float]
+        self, reading: FusionInput, sat_value: Optional[float]
     ) -> List[str]:
         """List which data sources contributed to this fused point."""
         sources: List[str] = []
-        if reading.get("pm25"):
+        if reading.pm25:
             sources.append("sensor")
         if sat_value:
             sources.append("satellite")
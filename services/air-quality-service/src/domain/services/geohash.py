@@ -0,0 +1,124 @@
+"""Geohash encoding for map grid cells.
+
+Map cells are identified by geohash strings so that overlapping or
+panned viewports at the same zoom level resolve to the same cells (and
+the same cache keys).  Encoding works on the integer row/column of the
+cell, which makes enumerating every cell in a bounding box a matter of
+counting rather than repeated float stepping.
+
+**Domain layer rule**: this module must NOT import from the application,
+infrastructure, or interface layers.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import List, Tuple
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+_DECODE = {ch: i for i, ch in enumerate(_BASE32)}
+
+MIN_PRECISION = 1
+MAX_PRECISION = 12
+
+
+def _bit_split(precision: int) -> Tuple[int, int]:
+    """Number of (latitude, longitude) bits in a geohash of ``precision``."""
+    total = 5 * precision
+    return total // 2, (total + 1) // 2
+
+
+def precision_for_zoom(zoom_level: int) -> int:
+    """Geohash length used for map cells at a given zoom level.
+
+    Cell width roughly halves per zoom step, which is 2/5 of a geohash
+    character (zoom 10 -> 5 characters, ~4.9 km cells).
+    """
+    return max(MIN_PRECISION, min(MAX_PRECISION, (zoom_level + 4) * 2 // 5))
+
+
+def cell_size(precision: int) -> Tuple[float, float]:
+    """Size of a geohash cell as (latitude span, longitude span) in degrees."""
+    lat_bits, lng_bits = _bit_split(precision)
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lng_bits)
+
+
+def _cell_index(lat: float, lng: float, precision: int) -> Tuple[int, int]:
+    """Integer (row, column) of the cell containing a point."""
+    lat_bits, lng_bits = _bit_split(precision)
+    rows, cols = 1 << lat_bits, 1 << lng_bits
+    row = int((lat + 90.0) / 180.0 * rows)
+    col = int((lng + 180.0) / 360.0 * cols)
+    return min(max(row, 0), rows - 1), min(max(col, 0), cols - 1)
+
+
+def _encode_index(row: int, col: int, precision: int) -> str:
+    """Interleave row/column bits (longitude first) into a geohash."""
+    lat_bits, lng_bits = _bit_split(precision)
+    code = 0
+    for bit in range(5 * precision):
+        if bit % 2 == 0:
+            code = (code << 1) | ((col >> (lng_bits - 1 - bit // 2)) & 1)
+        else:
+            code = (code << 1) | ((row >> (lat_bits - 1 - bit // 2)) & 1)
+    return "".join(
+        _BASE32[(code >> 5 * (precision - 1 - i)) & 31] for i in range(precision)
+    )
+
+
+def encode(lat: float, lng: float, precision: int = 9) -> str:
+    """Encode a coordinate as a geohash string."""
+    return _encode_index(*_cell_index(lat, lng, precision), precision)
+
+
+@lru_cache(maxsize=65536)
+def decode(geohash: str) -> Tuple[float, float]:
+    """Decode a geohash to the (latitude, longitude) of its cell center.
+
+    Results are memoized: map requests keep revisiting the same cells.
+
+    Raises
+    ------
+    ValueError
+        If the string contains characters outside the geohash alphabet.
+    """
+    precision = len(geohash)
+    lat_bits, lng_bits = _bit_split(precision)
+    code = 0
+    for ch in geohash:
+        try:
+            code = (code << 5) | _DECODE[ch]
+        except KeyError:
+            raise ValueError(f"Invalid geohash character: {ch!r}") from None
+
+    row = col = 0
+    for bit in range(5 * precision):
+        value = (code >> (5 * precision - 1 - bit)) & 1
+        if bit % 2 == 0:
+            col = (col << 1) | value
+        else:
+            row = (row << 1) | value
+
+    lat_span, lng_span = cell_size(precision)
+    return -90.0 + (row + 0.5) * lat_span, -180.0 + (col + 0.5) * lng_span
+
+
+def covering(
+    min_lat: float,
+    min_lng: float,
+    max_lat: float,
+    max_lng: float,
+    precision: int,
+) -> List[str]:
+    """All geohashes of ``precision`` that intersect a bounding box.
+
+    Returned row by row from south-west to north-east.
+    """
+    if max_lat < min_lat or max_lng < min_lng:
+        return []
+    row_lo, col_lo = _cell_index(min_lat, min_lng, precision)
+    row_hi, col_hi = _cell_index(max_lat, max_lng, precision)
+    return [
+        _encode_index(row, col, precision)
+        for row in range(row_lo, row_hi + 1)
+        for col in range(col_lo, col_hi + 1)
+    ]
@@ -10,11 +10,25 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-from statistics import mean, stdev
+from math import sqrt
+from statistics import fmean
+from typing import Dict, List, Optional, Sequence
 
+import numpy as np
 
-@dataclass
+
+def _sample_stdev(values: Sequence[float]) -> float:
+    """Sample standard deviation (``ddof=1``) of two or more values.
+
+    Two-pass float version of ``statistics.stdev``, which converts every
+    value to a ``Fraction``; on windows of a dozen points this is faster
+    than both that and a NumPy round trip.
+    """
+    center = fmean(values)
+    return sqrt(sum((v - center) * (v - center) for v in values) / (len(values) - 1))
+
+
+@dataclass(slots=True, frozen=True)
 class SensorDataPoint:
     """A single sensor reading with timestamp."""
 
@@ -23,7 +37,7 @@ class SensorDataPoint:
     aqi: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ForecastDataPoint:
     """A forecasted AQI data point."""
 
@@ -35,7 +49,7 @@ class ForecastDataPoint:
     trend: str  # "IMPROVING", "STABLE", "WORSENING"
 
 
-@dataclass
+@dataclass(slots=True)
 class AQIForecast:
     """Complete AQI forecast result."""
 
@@ -50,7 +64,7 @@ class AQIForecast:
         """Calculate average predicted AQI."""
         if not self.data_points:
             return 0
-        return round(mean([dp.predicted_aqi for dp in self.data_points]))
+        return round(fmean([dp.predicted_aqi for dp in self.data_points]))
 
     @property
     def max_aqi(self) -> int:
@@ -65,8 +79,8 @@ class AQIForecast:
         if len(self.data_points) < 2:
             return "STABLE"
 
-        first_half = mean([dp.predicted_aqi for dp in self.data_points[:len(self.data_points)//2]])
-        second_half = mean([dp.predicted_aqi for dp in self.data_points[len(self.data_points)//2:]])
+        first_half = fmean([dp.predicted_aqi for dp in self.data_points[:len(self.data_points)//2]])
+        second_half = fmean([dp.predicted_aqi for dp in self.data_points[len(self.data_points)//2:]])
 
         diff = second_half - first_half
         if diff > 10:
@@ -131,47 +145,50 @@ class PredictionService:
         # Calculate variability for confidence intervals
         variability = self._calculate_variability(sensor_data)
 
-        # Generate forecast points
-        forecast_points: List[ForecastDataPoint] = []
+        # Generate forecast points, every step at once
         now = datetime.utcnow()
+        steps = np.arange(1, hours // interval_hours + 1)
+
+        # Apply trend factor (diminishes over time)
+        time_decay = np.maximum(0.3, 1.0 - (steps / (hours / interval_hours)) * 0.7)
+        adjusted_trend = trend_factor * time_decay
+
+        # Calculate predicted AQI (rint rounds half to even, like round())
+        predicted_aqi = np.clip(np.rint(current_aqi * (1 + adjusted_trend)), 0, 500)
 
-        for i in range(1, hours // interval_hours + 1):
-            forecast_time = now + timedelta(hours=i * interval_hours)
-
-            # Apply trend factor (diminishes over time)
-            time_decay = max(0.3, 1.0 - (i / (hours / interval_hours)) * 0.7)
-            adjusted_trend = trend_factor * time_decay
-
-            # Calculate predicted AQI
-            predicted_aqi = round(current_aqi * (1 + adjusted_trend))
-            predicted_aqi = max(0, min(500, predicted_aqi))  # Cap at 0-500
-
-            # Calculate confidence (decreases with forecast distance)
-            confidence = max(0.3, 1.0 - (i * 0.05))
-
-            # Calculate min/max range based on variability
-            range_margin = round(variability * (1 + i * 0.1))
-            min_aqi = max(0, predicted_aqi - range_margin)
-            max_aqi = min(500, predicted_aqi + range_margin)
-
-            # Determine trend direction
-            if adjusted_trend > 0.05:
-                trend = "WORSENING"
-            elif adjusted_trend < -0.05:
-                trend = "IMPROVING"
-            else:
-                trend = "STABLE"
-
-            forecast_points.append(
-                ForecastDataPoint(
-                    timestamp=forecast_time,
-                    predicted_aqi=predicted_aqi,
-                    confidence=round(confidence, 2),
-                    min_aqi=min_aqi,
-                    max_aqi=max_aqi,
-                    trend=trend,
-                )
+        # Calculate confidence (decreases with forecast distance)
+        confidence = np.maximum(0.3, 1.0 - (steps * 0.05))
+
+        # Calculate min/max range based on variability
+        range_margin = np.rint(variability * (1 + steps * 0.1))
+        min_aqi = np.maximum(0, predicted_aqi - range_margin)
+        max_aqi = np.minimum(500, predicted_aqi + range_margin)
+
+        # Determine trend direction
+        trend = np.select(
+            [adjusted_trend > 0.05, adjusted_trend < -0.05],
+            ["WORSENING", "IMPROVING"],
+            default="STABLE",
+        )
+
+        forecast_points = [
+            ForecastDataPoint(
+                timestamp=now + timedelta(hours=step * interval_hours),
+                predicted_aqi=int(point_aqi),
+                confidence=round(point_confidence, 2),
+                min_aqi=int(point_min),
+                max_aqi=int(point_max),
+                trend=point_trend,
             )
+            for step, point_aqi, point_confidence, point_min, point_max, point_trend in zip(
+                steps.tolist(),
+                predicted_aqi.tolist(),
+                confidence.tolist(),
+                min_aqi.tolist(),
+                max_aqi.tolist(),
+                trend.tolist(),
+            )
+        ]
 
         return AQIForecast(
             location_lat=latest.timestamp.timestamp(),  # Placeholder
@@ -273,12 +290,7 @@ class PredictionService:
         if len(recent_data) < 2:
             return 10.0
 
-        aqi_values = [dp.aqi for dp in recent_data]
-
-        try:
-            return stdev(aqi_values)
-        except:
-            return 10.0
+        return _sample_stdev([dp.aqi for dp in recent_data])
 
     def get_forecast_summary(self, forecast: AQIForecast) -> Dict:
         """Get a summary of the forecast.
@@ -320,5 +332,5 @@ class PredictionService:
             "overall_trend": forecast.overall_trend,
             "outlook": outlook,
             "recommendation": recommendation,
-            "confidence": round(mean([dp.confidence for dp in forecast.data_points]), 2),
+            "confidence": round(fmean([dp.confidence for dp in forecast.data_points]), 2),
         }
@@ -0,0 +1,64 @@
+"""Spatial index over sensor locations.
+
+Answers "which sensors lie within *r* km of these points" for a whole
+batch of query points with one tree traversal, so map generation does
+not need a radius query per grid cell.
+
+**Domain layer rule**: this module must NOT import from the application,
+infrastructure, or interface layers.
+"""
+from __future__ import annotations
+
+from typing import List, Union
+
+import numpy as np
+from sklearn.neighbors import BallTree
+
+_EARTH_RADIUS_KM = 6_371.0
+
+
+class SensorSpatialIndex:
+    """Ball tree over sensor coordinates using the haversine metric.
+
+    Parameters
+    ----------
+    latitudes, longitudes:
+        Sensor coordinates in degrees, one entry per sensor/reading.
+        Query results are positions into these arrays.
+    """
+
+    def __init__(self, latitudes: np.ndarray, longitudes: np.ndarray):
+        coords = np.column_stack([latitudes, longitudes]).astype(np.float64)
+        self.size = len(coords)
+        self._tree = (
+            BallTree(np.radians(coords), metric="haversine") if self.size else None
+        )
+
+    def query_radius(
+        self,
+        latitudes: np.ndarray,
+        longitudes: np.ndarray,
+        radius_km: Union[float, np.ndarray],
+    ) -> List[np.ndarray]:
+        """Find the sensors within ``radius_km`` of each query point.
+
+        Parameters
+        ----------
+        latitudes, longitudes:
+            Query points in degrees.
+        radius_km:
+            Search radius in kilometres, shared or one per query point.
+
+        Returns
+        -------
+        list of np.ndarray
+            For every query point, the positions of the sensors in range.
+        """
+        points = np.column_stack([latitudes, longitudes]).astype(np.float64)
+        if self._tree is None or len(points) == 0:
+            return [np.empty(0, dtype=np.intp) for _ in range(len(points))]
+        return list(
+            self._tree.query_radius(
+                np.radians(points), r=np.asarray(radius_km) / _EARTH_RADIUS_KM
+            )
+        )
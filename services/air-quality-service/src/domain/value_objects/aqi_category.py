@@ -9,12 +9,14 @@ infrastructure, or interface layers.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Tuple
+from typing import List, Tuple
+
+import numpy as np
 
 from .aqi_level import AQILevel
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class AQICategory:
     """Value object representing an AQI category.
 
@@ -120,6 +122,33 @@ AQI_CATEGORIES = {
 }
 
 
+def _find_category(aqi: float) -> AQICategory:
+    """Scan the category bands for an AQI value (HAZARDOUS if none match)."""
+    for category in AQI_CATEGORIES.values():
+        if category.contains(aqi):
+            return category
+    return AQI_CATEGORIES[AQILevel.HAZARDOUS]
+
+
+# Category for every integer AQI 0-500, so lookups are a tuple index
+_CATEGORY_TABLE: Tuple[AQICategory, ...] = tuple(
+    _find_category(aqi) for aqi in range(501)
+)
+
+
+# Level/color per table entry; the extra last slot (HAZARDOUS) is used
+# for negative values, which match no band
+_LEVEL_TABLE = np.array(
+    [c.level.value for c in _CATEGORY_TABLE] + [AQILevel.HAZARDOUS.value],
+    dtype=object,
+)
+_COLOR_TABLE = np.array(
+    [c.color_hex for c in _CATEGORY_TABLE]
+    + [AQI_CATEGORIES[AQILevel.HAZARDOUS].color_hex],
+    dtype=object,
+)
+
+
 def get_category_for_aqi(aqi: int) -> AQICategory:
     """Get the AQI category for a given AQI value.
 
@@ -135,12 +164,32 @@ def get_category_for_aqi(aqi: int) -> AQICategory:
     """
     aqi = min(aqi, 500)  # Cap at 500
 
-    for category in AQI_CATEGORIES.values():
-        if category.contains(aqi):
-            return category
+    if isinstance(aqi, int) and aqi >= 0:
+        return _CATEGORY_TABLE[aqi]
 
-    # Default to Hazardous
-    return AQI_CATEGORIES[AQILevel.HAZARDOUS]
+    # Non-integer or negative values keep the band-scan semantics
+    return _find_category(aqi)
+
+
+def get_levels_and_colors(aqi_values: np.ndarray) -> Tuple[List[str], List[str]]:
+    """Get category levels and colors for many integer AQI values at once.
+
+    Equivalent to calling :func:`get_category_for_aqi` per value, as a
+    single table gather.
+
+    Parameters
+    ----------
+    aqi_values:
+        Integer AQI values
+
+    Returns
+    -------
+    tuple of list
+        Level names and hex colors, one per value
+    """
+    aqi = np.asarray(aqi_values, dtype=np.int64)
+    idx = np.where(aqi < 0, len(_CATEGORY_TABLE), np.minimum(aqi, 500))
+    return _LEVEL_TABLE[idx].tolist(), _COLOR_TABLE[idx].tolist()
 
 
 def get_all_categories() -> list:
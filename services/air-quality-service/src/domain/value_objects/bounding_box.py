@@ -0,0 +1,18 @@
+"""Bounding box value object.
+
+A geographic rectangle given by its four edges.  A plain named tuple:
+edges are read on hot paths (fusion filtering), where attribute access
+on a tuple is cheaper than keyed lookups on a dict.
+"""
+from __future__ import annotations
+
+from typing import NamedTuple
+
+
+class BoundingBox(NamedTuple):
+    """Immutable bounding box in degrees (WGS-84), edges inclusive."""
+
+    north: float
+    south: float
+    east: float
+    west: float
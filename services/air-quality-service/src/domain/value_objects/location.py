@@ -12,7 +12,7 @@ from math import atan2, cos, radians, sin, sqrt
 _EARTH_RADIUS_KM = 6_371.0
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class Location:
     """Immutable geographic coordinate (WGS-84).
 
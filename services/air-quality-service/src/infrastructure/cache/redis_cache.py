@@ -9,17 +9,56 @@ Provides caching for:
 """
 from __future__ import annotations
 
-import json
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+import orjson
 import redis.asyncio as redis
 
 from ...config import settings
+from ...domain.services import geohash
 
 logger = logging.getLogger(__name__)
 
+# numpy scalars/arrays and non-string keys are accepted, as json.dumps did
+# for int keys and float subclasses
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+class _LocalCache:
+    """Bounded in-process LRU of cache payloads with per-entry expiry."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (monotonic expiry, payload), least recently used first
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: str, payload: bytes, ttl: float) -> None:
+        ttl = min(ttl, self.ttl)
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, payload)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
 
 class RedisCache:
     """Redis cache for AQI service data.
@@ -50,6 +89,14 @@ class RedisCache:
         """
         self.redis_url = redis_url or settings.REDIS_URL
         self._client: Optional[redis.Redis] = None
+        # Binary-safe client (no response decoding) for packed map cells
+        # and JSON payloads, which orjson parses straight from bytes
+        self._raw_client: Optional[redis.Redis] = None
+        # Current-AQI payloads this worker recently wrote or read, served
+        # without a Redis round-trip for AQI_LOCAL_CACHE_TTL seconds
+        self._local_aqi = _LocalCache(
+            settings.AQI_LOCAL_CACHE_SIZE, settings.AQI_LOCAL_CACHE_TTL
+        )
 
     async def connect(self) -> None:
         """Establish Redis connection."""
@@ -60,13 +107,17 @@ class RedisCache:
                 decode_responses=True,
             )
             await self._client.ping()
+            self._raw_client = redis.from_url(self.redis_url)
             logger.info("Connected to Redis cache")
         except Exception as e:
             logger.warning(f"Failed to connect to Redis: {e}")
             self._client = None
+            self._raw_client = None
 
     async def close(self) -> None:
         """Close Redis connection."""
+        if self._raw_client:
+            await self._raw_client.close()
         if self._client:
             await self._client.close()
             logger.info("Closed Redis connection")
@@ -114,24 +165,84 @@ class RedisCache:
         dict or None
             Cached AQI data or None if not found
         """
-        if not self._client:
+        if not self._raw_client:
             return None
 
         key = self._make_aqi_key(lat, lng, radius)
         try:
-            data = await self._client.get(key)
+            data = await self._read_aqi_payload(key)
             if data:
-                return json.loads(data)
+                return orjson.loads(data)
         except Exception as e:
             logger.warning(f"Error getting AQI from cache: {e}")
         return None
 
+    async def get_aqi_raw(
+        self,
+        lat: float,
+        lng: float,
+        radius: float,
+    ) -> Optional[bytes]:
+        """Get the cached AQI payload for a location without decoding it.
+
+        The payload is stored as JSON, so it can be sent to the client
+        as-is.
+
+        Parameters
+        ----------
+        lat:
+            Latitude
+        lng:
+            Longitude
+        radius:
+            Search radius in km
+
+        Returns
+        -------
+        bytes or None
+            Cached JSON payload or None if not found
+        """
+        if not self._raw_client:
+            return None
+
+        key = self._make_aqi_key(lat, lng, radius)
+        try:
+            data = await self._read_aqi_payload(key)
+            if data:
+                return data
+        except Exception as e:
+            logger.warning(f"Error getting raw AQI from cache: {e}")
+        return None
+
+    async def _read_aqi_payload(self, key: str) -> Optional[bytes]:
+        """AQI payload from the local copy, else from Redis.
+
+        A Redis hit is kept locally for no longer than the key has left
+        in Redis (and at most ``AQI_LOCAL_CACHE_TTL``).  Local hits never
+        extend an entry's expiry, so every worker rereads Redis at least
+        that often.
+        """
+        data = self._local_aqi.get(key)
+        if data is not None:
+            return data
+
+        pipe = self._raw_client.pipeline(transaction=False)
+        pipe.get(key)
+        pipe.pttl(key)
+        data, ttl_ms = await pipe.execute()
+        if data:
+            # PTTL is -1 for a key without expiry; -2 (key expired between
+            # the two commands) gives a negative TTL, which put() skips
+            ttl = self.TTL_AQI if ttl_ms == -1 else ttl_ms / 1000
+            self._local_aqi.put(key, data, ttl)
+        return data
+
     async def set_aqi(
         self,
         lat: float,
         lng: float,
         radius: float,
-        aqi_data: Dict,
+        aqi_data: Any,
         ttl: Optional[int] = None,
     ) -> bool:
         """Cache AQI data for a location.
@@ -145,7 +256,7 @@ class RedisCache:
         radius:
             Search radius in km
         aqi_data:
-            AQI data to cache
+            AQI data to cache: a dict or a result dataclass
         ttl:
             Custom TTL in seconds (uses default if not provided)
 
@@ -158,17 +269,90 @@ class RedisCache:
             return False
 
         key = self._make_aqi_key(lat, lng, radius)
+        ttl = ttl or self.TTL_AQI
         try:
-            await self._client.setex(
-                key,
-                ttl or self.TTL_AQI,
-                json.dumps(aqi_data),
-            )
+            payload = orjson.dumps(aqi_data, option=_ORJSON_OPTIONS)
+            await self._client.setex(key, ttl, payload)
+            self._local_aqi.put(key, payload, ttl)
             return True
         except Exception as e:
             logger.warning(f"Error setting AQI in cache: {e}")
             return False
 
+    async def get_aqi_many(
+        self,
+        locations: List[Tuple[float, float]],
+        radius: float,
+    ) -> List[Optional[Dict]]:
+        """Get cached AQI data for many locations in one round-trip.
+
+        Parameters
+        ----------
+        locations:
+            (latitude, longitude) pairs
+        radius:
+            Search radius in km
+
+        Returns
+        -------
+        list
+            Cached AQI data (or None) for each location, in order
+        """
+        if not self._raw_client or not locations:
+            return [None] * len(locations)
+
+        keys = [self._make_aqi_key(lat, lng, radius) for lat, lng in locations]
+        try:
+            values = await self._raw_client.mget(keys)
+            return [orjson.loads(v) if v else None for v in values]
+        except Exception as e:
+            logger.warning(f"Error getting AQI batch from cache: {e}")
+            return [None] * len(locations)
+
+    async def set_aqi_many(
+        self,
+        entries: List[Tuple[float, float, Dict]],
+        radius: float,
+        ttl: Optional[int] = None,
+    ) -> bool:
+        """Cache AQI data for many locations in one pipelined round-trip.
+
+        Parameters
+        ----------
+        entries:
+            (latitude, longitude, aqi_data) tuples
+        radius:
+            Search radius in km
+        ttl:
+            Custom TTL in seconds (uses default if not provided)
+
+        Returns
+        -------
+        bool
+            True if successfully cached
+        """
+        if not self._client or not entries:
+            return False
+
+        ttl = ttl or self.TTL_AQI
+        try:
+            payloads = {
+                self._make_aqi_key(lat, lng, radius): orjson.dumps(
+                    aqi_data, option=_ORJSON_OPTIONS
+                )
+                for lat, lng, aqi_data in entries
+            }
+            pipe = self._client.pipeline(transaction=False)
+            for key, payload in payloads.items():
+                pipe.setex(key, ttl, payload)
+            await pipe.execute()
+            for key, payload in payloads.items():
+                self._local_aqi.put(key, payload, ttl)
+            return True
+        except Exception as e:
+            logger.warning(f"Error setting AQI batch in cache: {e}")
+            return False
+
     # =====================================================================
     # Map Data Cache Operations
     # =====================================================================
@@ -206,14 +390,14 @@ class RedisCache:
         list or None
             Cached grid cells or None if not found
         """
-        if not self._client:
+        if not self._raw_client:
             return None
 
         key = self._make_map_key(min_lat, min_lng, max_lat, max_lng, zoom)
         try:
-            data = await self._client.get(key)
+            data = await self._raw_client.get(key)
             if data:
-                return json.loads(data)
+                return orjson.loads(data)
         except Exception as e:
             logger.warning(f"Error getting map data from cache: {e}")
         return None
@@ -254,13 +438,100 @@ class RedisCache:
             await self._client.setex(
                 key,
                 ttl or self.TTL_MAP,
-                json.dumps(grid_cells),
+                orjson.dumps(grid_cells, option=_ORJSON_OPTIONS),
             )
             return True
         except Exception as e:
             logger.warning(f"Error setting map data in cache: {e}")
             return False
 
+    def _make_map_cell_keys(self, geohashes: Iterable[str]) -> List[str]:
+        """Generate cache keys for geohash map cells, one per geohash."""
+        prefix = f"{self.PREFIX_MAP}:gh:"
+        return [prefix + gh for gh in geohashes]
+
+    async def get_map_cells(self, geohashes: List[str]) -> List[Optional[bytes]]:
+        """Get cached map cells by geohash in one round-trip.
+
+        Parameters
+        ----------
+        geohashes:
+            Geohash identifiers of the cells
+
+        Returns
+        -------
+        list
+            One entry per geohash: the packed cell bytes, ``b""`` for a
+            cell cached as empty, or None if not cached
+        """
+        if not self._raw_client or not geohashes:
+            return [None] * len(geohashes)
+
+        try:
+            return await self._raw_client.mget(self._make_map_cell_keys(geohashes))
+        except Exception as e:
+            logger.warning(f"Error getting map cells from cache: {e}")
+            return [None] * len(geohashes)
+
+    async def map_cells_missing(self, geohashes: List[str]) -> List[str]:
+        """Find which map cells are not cached, without fetching them.
+
+        Parameters
+        ----------
+        geohashes:
+            Geohash identifiers of the cells
+
+        Returns
+        -------
+        list
+            The geohashes that have no cache entry
+        """
+        if not self._raw_client or not geohashes:
+            return list(geohashes)
+
+        try:
+            pipe = self._raw_client.pipeline(transaction=False)
+            for key in self._make_map_cell_keys(geohashes):
+                pipe.exists(key)
+            flags = await pipe.execute()
+            return [gh for gh, exists in zip(geohashes, flags) if not exists]
+        except Exception as e:
+            logger.warning(f"Error checking map cells in cache: {e}")
+            return list(geohashes)
+
+    async def set_map_cells(
+        self,
+        cells: Dict[str, bytes],
+        ttl: Optional[int] = None,
+    ) -> bool:
+        """Cache packed map cells keyed by geohash in one pipelined round-trip.
+
+        Parameters
+        ----------
+        cells:
+            Packed cell bytes by geohash (``b""`` marks a cell without data)
+        ttl:
+            Custom TTL in seconds
+
+        Returns
+        -------
+        bool
+            True if successfully cached
+        """
+        if not self._raw_client or not cells:
+            return False
+
+        try:
+            pipe = self._raw_client.pipeline(transaction=False)
+            ttl = ttl or self.TTL_MAP
+            for key, packed in zip(self._make_map_cell_keys(cells), cells.values()):
+                pipe.setex(key, ttl, packed)
+            await pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning(f"Error setting map cells in cache: {e}")
+            return False
+
     # =====================================================================
     # Forecast Cache Operations
     # =====================================================================
@@ -271,8 +542,13 @@ class RedisCache:
         lng: float,
         hours: int,
     ) -> str:
-        """Generate cache key for forecast data."""
-        return f"{self.PREFIX_FORECAST}:{round(lat, 3)}:{round(lng, 3)}:{hours}"
+        """Generate cache key for forecast data.
+
+        Forecasts vary slowly in space, so nearby requests share the
+        geohash cell (``FORECAST_GEOHASH_PRECISION``) they fall in.
+        """
+        cell = geohash.encode(lat, lng, settings.FORECAST_GEOHASH_PRECISION)
+        return f"{self.PREFIX_FORECAST}:gh:{cell}:{hours}"
 
     async def get_forecast(
         self,
@@ -296,14 +572,14 @@ class RedisCache:
         dict or None
             Cached forecast data or None if not found
         """
-        if not self._client:
+        if not self._raw_client:
             return None
 
         key = self._make_forecast_key(lat, lng, hours)
         try:
-            data = await self._client.get(key)
+            data = await self._raw_client.get(key)
             if data:
-                return json.loads(data)
+                return orjson.loads(data)
         except Exception as e:
             logger.warning(f"Error getting forecast from cache: {e}")
         return None
@@ -313,7 +589,7 @@ class RedisCache:
         lat: float,
         lng: float,
         hours: int,
-        forecast_data: Dict,
+        forecast_data: Any,
         ttl: Optional[int] = None,
     ) -> bool:
         """Cache forecast data.
@@ -327,7 +603,8 @@ class RedisCache:
         hours:
             Forecast duration
         forecast_data:
-            Forecast data to cache
+            Forecast data to cache: a dict or a (nested) dataclass such
+            as ``GetForecastResult``; datetimes are stored as ISO strings
         ttl:
             Custom TTL in seconds
 
@@ -344,7 +621,7 @@ class RedisCache:
             await self._client.setex(
                 key,
                 ttl or self.TTL_FORECAST,
-                json.dumps(forecast_data),
+                orjson.dumps(forecast_data, option=_ORJSON_OPTIONS),
             )
             return True
         except Exception as e:
@@ -372,14 +649,14 @@ class RedisCache:
         dict or None
             Cached sensor data or None if not found
         """
-        if not self._client:
+        if not self._raw_client:
             return None
 
         key = self._make_sensor_key(sensor_id)
         try:
-            data = await self._client.get(key)
+            data = await self._raw_client.get(key)
             if data:
-                return json.loads(data)
+                return orjson.loads(data)
         except Exception as e:
             logger.warning(f"Error getting sensor data from cache: {e}")
         return None
@@ -414,7 +691,7 @@ class RedisCache:
             await self._client.setex(
                 key,
                 ttl,
-                json.dumps(sensor_data),
+                orjson.dumps(sensor_data, option=_ORJSON_OPTIONS),
             )
             return True
         except Exception as e:
@@ -441,6 +718,8 @@ class RedisCache:
         if not self._client:
             return 0
 
+        # Local copies are not matched against the pattern; drop them all
+        self._local_aqi.clear()
         try:
             keys = []
             async for key in self._client.scan_iter(match=pattern):
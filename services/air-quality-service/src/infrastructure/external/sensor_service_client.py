@@ -10,6 +10,7 @@ Provides integration with the Sensor Service for:
 from __future__ import annotations
 
 import logging
+import time
 import typing
 from dataclasses import dataclass
 from datetime import datetime
@@ -19,8 +20,11 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+# How long to skip the bbox endpoint after the Sensor Service lacked it (s)
+_BBOX_RETRY_INTERVAL = 300.0
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class SensorReading:
     """Sensor reading data from Sensor Service."""
 
@@ -63,6 +67,8 @@ class SensorServiceClient:
         self.base_url = base_url or "http://sensor-service:8002"
         self.timeout = timeout
         self._client: Optional[httpx.AsyncClient] = None
+        # Monotonic time before which the bbox endpoint is assumed missing
+        self._bbox_unsupported_until = 0.0
 
     async def connect(self) -> None:
         """Initialize HTTP client."""
@@ -184,6 +190,69 @@ class SensorServiceClient:
             logger.warning(f"Error fetching nearby readings: {e}")
             return []
 
+    async def get_readings_in_bbox(
+        self,
+        min_lat: float,
+        min_lng: float,
+        max_lat: float,
+        max_lng: float,
+        limit: int = 5000,
+    ) -> Optional[List[SensorReading]]:
+        """Get recent readings from all sensors inside a bounding box.
+
+        Used by map generation to fetch every reading for the viewport
+        in a single request instead of one radius query per grid cell.
+
+        Parameters
+        ----------
+        min_lat, min_lng, max_lat, max_lng:
+            Bounding box
+        limit:
+            Maximum readings to return
+
+        Returns
+        -------
+        list or None
+            List of recent sensor readings, or None if the Sensor Service
+            does not provide the bbox endpoint (remembered for a few
+            minutes, so callers fall back without a wasted request)
+        """
+        if time.monotonic() < self._bbox_unsupported_until:
+            return None
+        if not self._client:
+            await self.connect()
+
+        try:
+            params = {
+                "min_lat": min_lat,
+                "min_lng": min_lng,
+                "max_lat": max_lat,
+                "max_lng": max_lng,
+                "limit": limit,
+            }
+            response = await self._client.get(
+                "/api/v1/readings/recent/bbox",
+                params=params,
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            return [self._parse_reading(r) for r in data.get("data", [])]
+
+        except httpx.TimeoutException:
+            logger.warning("Sensor Service request timed out")
+            return []
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in (404, 405):
+                logger.info("Sensor Service has no bbox readings endpoint")
+                self._bbox_unsupported_until = time.monotonic() + _BBOX_RETRY_INTERVAL
+                return None
+            logger.warning(f"Sensor Service error: {e}")
+            return []
+        except Exception as e:
+            logger.warning(f"Error fetching bbox readings: {e}")
+            return []
+
     async def get_sensor_info(self, sensor_id: str) -> Optional[Dict]:
         """Get sensor metadata.
 
@@ -186,10 +186,15 @@ class SatelliteDataConsumer:
         rabbitmq_url: str,
         sensor_client: Any,
         cache: RedisCache,
+        calibration_model: Optional[Any] = None,
     ):
         self.rabbitmq_url = rabbitmq_url
         self.sensor_client = sensor_client
         self.cache = cache
+        # Shared with the API so retraining applies here too; loaded
+        # lazily on the first event otherwise
+        self.calibration_model = calibration_model
+        self._fusion_service: Optional[Any] = None
         self._connection: Optional[aio_pika.RobustConnection] = None
         self._channel: Optional[aio_pika.Channel] = None
         self._consumer_tag: Optional[str] = None
@@ -259,7 +264,12 @@ class SatelliteDataConsumer:
         5. Publish DataFusionCompleted event
         """
         from ...domain.services.calibration_model import CalibrationModel
-        from ...domain.services.data_fusion import DataFusionService
+        from ...domain.services.data_fusion import (
+            FUSION_CACHE_RADIUS_KM,
+            DataFusionService,
+            FusionInput,
+            fused_aqi_entries,
+        )
 
         source = event_data.get("source", "unknown")
         grid_cells = event_data.get("grid_cells", [])
@@ -282,7 +292,7 @@ class SatelliteDataConsumer:
         center_lon = sum(lons) / len(lons) if lons else 0
 
         # Fetch nearby sensor readings
-        sensor_readings: List[Dict] = []
+        sensor_readings: List[FusionInput] = []
         try:
             readings = await self.sensor_client.get_recent_readings(
                 latitude=center_lat,
@@ -290,15 +300,9 @@ class SatelliteDataConsumer:
                 radius_km=50.0,
                 limit=100,
             )
+            # Temperature/humidity keep the FusionInput defaults
             sensor_readings = [
-                {
-                    "latitude": r.latitude,
-                    "longitude": r.longitude,
-                    "pm25": r.pm25,
-                    "pm10": r.pm10,
-                    "temperature": 25.0,  # Default if not in reading
-                    "humidity": 50.0,  # Default if not in reading
-                }
+                FusionInput(r.latitude, r.longitude, r.pm25, r.pm10)
                 for r in readings
             ]
         except Exception as e:
@@ -311,36 +315,24 @@ class SatelliteDataConsumer:
             else datetime.utcnow()
         )
 
-        calibration_model = CalibrationModel()
-        fusion_service = DataFusionService(calibration_model)
+        if self._fusion_service is None:
+            self._fusion_service = DataFusionService(
+                self.calibration_model or CalibrationModel()
+            )
 
         satellite_data = {"grid_cells": grid_cells}
-        fused_points = fusion_service.fuse_data(
+        fused_points = self._fusion_service.fuse_data(
             sensor_readings=sensor_readings,
             satellite_data=satellite_data,
             timestamp=timestamp,
         )
 
-        # Cache fused results
+        # Cache fused results in one pipelined write
         if self.cache and fused_points:
-            for point in fused_points:
-                if point.fused_aqi is not None:
-                    aqi_data = {
-                        "location_lat": point.location.latitude,
-                        "location_lng": point.location.longitude,
-                        "aqi_value": point.fused_aqi,
-                        "fused_pm25": point.fused_pm25,
-                        "fused_pm10": point.fused_pm10,
-                        "confidence": point.confidence,
-                        "data_sources": point.data_sources,
-                        "timestamp": timestamp.isoformat(),
-                    }
-                    await self.cache.set_aqi(
-                        point.location.latitude,
-                        point.location.longitude,
-                        10.0,
-                        aqi_data,
-                    )
+            await self.cache.set_aqi_many(
+                fused_aqi_entries(fused_points, timestamp.isoformat()),
+                FUSION_CACHE_RADIUS_KM,
+            )
 
             logger.info(
                 "Fused %d data points from %s satellite data",
@@ -10,21 +10,23 @@ REST API endpoints for:
 """
 from __future__ import annotations
 
+import dataclasses
 import logging
 import struct
 import zlib
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Iterator, Optional
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 
 from ...application.services.air_quality_application_service import (
     AirQualityApplicationService,
-    get_air_quality_service,
 )
 from ...domain.value_objects.aqi_category import get_all_categories
-from ...infrastructure.external.sensor_service_client import SensorServiceClient, get_sensor_service_client
+from ...infrastructure.external.sensor_service_client import SensorServiceClient
+from .dependencies import get_air_quality_service, get_sensor_client
 from .schemas import (
     AQICategoriesResponse,
     AQICategoryInfo,
@@ -45,19 +47,35 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1", tags=["air-quality"])
 
 
-# =============================================================================
-# Dependency Injection
-# =============================================================================
+def _json_response(payload: Any) -> Response:
+    """Encode a query result (dataclasses included) as a JSON response.
 
+    orjson walks the result dataclasses directly, so large results are
+    not copied into response models and validated a second time.  The
+    route's ``response_model`` still documents the shape.
+    """
+    return Response(content=orjson.dumps(payload), media_type="application/json")
 
-def get_service() -> AirQualityApplicationService:
-    """Inject the air quality application service."""
-    return next(get_air_quality_service())
 
+def _forecast_payload(result: Any) -> Dict[str, Any]:
+    """Forecast result fields plus the computed summary, without copying points."""
+    payload = {f.name: getattr(result, f.name) for f in dataclasses.fields(result)}
+    payload["summary"] = result.summary
+    return payload
 
-def get_sensor_client() -> SensorServiceClient:
-    """Inject the sensor service client."""
-    return next(get_sensor_service_client())
+
+def _forecast_ndjson(result: Any) -> Iterator[bytes]:
+    """Encode a forecast as NDJSON, one line at a time.
+
+    The first line is the forecast without its points (summary
+    included); each following line is one data point, so the full
+    document is never built in memory.
+    """
+    header = _forecast_payload(result)
+    del header["data_points"]
+    yield orjson.dumps(header, option=orjson.OPT_APPEND_NEWLINE)
+    for point in result.data_points:
+        yield orjson.dumps(point, option=orjson.OPT_APPEND_NEWLINE)
 
 
 # =============================================================================
@@ -71,8 +89,8 @@ async def get_current_aqi(
     longitude: float = Query(..., ge=-180, le=180, description="Longitude"),
     radius_km: float = Query(10.0, ge=1, le=100, description="Search radius in km"),
     include_pollutants: bool = Query(True, description="Include individual pollutant AQIs"),
-    service: AirQualityApplicationService = Depends(get_service),
-) -> CurrentAQIResponse:
+    service: AirQualityApplicationService = Depends(get_air_quality_service),
+) -> Response:
     """Get current AQI for a location.
 
     Returns the current Air Quality Index and pollutant data for the
@@ -87,15 +105,16 @@ async def get_current_aqi(
         include_pollutants=include_pollutants,
     )
 
-    result = await service.get_current_aqi(query)
-    return CurrentAQIResponse.model_validate(result)
+    # Cached payloads are already JSON; send them without re-validation
+    payload = await service.get_current_aqi_raw(query)
+    return Response(content=payload, media_type="application/json")
 
 
 @router.post("/aqi/current", response_model=CurrentAQIResponse)
 async def get_current_aqi_post(
     request: CurrentAQIRequest,
-    service: AirQualityApplicationService = Depends(get_service),
-) -> CurrentAQIResponse:
+    service: AirQualityApplicationService = Depends(get_air_quality_service),
+) -> Response:
     """Get current AQI for a location (POST)."""
     from ...application.queries.get_current_aqi_query import GetCurrentAQIQuery
 
@@ -106,8 +125,9 @@ async def get_current_aqi_post(
         include_pollutants=request.include_pollutants,
     )
 
-    result = await service.get_current_aqi(query)
-    return CurrentAQIResponse.model_validate(result)
+    # Cached payloads are already JSON; send them without re-validation
+    payload = await service.get_current_aqi_raw(query)
+    return Response(content=payload, media_type="application/json")
 
 
 # =============================================================================
@@ -123,8 +143,8 @@ async def get_map_data(
     max_lng: float = Query(..., ge=-180, le=180, description="Bounds max longitude"),
     zoom_level: int = Query(10, ge=1, le=20, description="Map zoom level"),
     include_forecast: bool = Query(False, description="Include forecast data"),
-    service: AirQualityApplicationService = Depends(get_service),
-) -> MapDataResponse:
+    service: AirQualityApplicationService = Depends(get_air_quality_service),
+) -> Response:
     """Get aggregated AQI data for map visualization.
 
     Returns grid cells with AQI data suitable for rendering heatmaps.
@@ -141,14 +161,14 @@ async def get_map_data(
     )
 
     result = await service.get_map_data(query)
-    return MapDataResponse.model_validate(result)
+    return _json_response(result)
 
 
 @router.post("/aqi/map", response_model=MapDataResponse)
 async def get_map_data_post(
     request: MapDataRequest,
-    service: AirQualityApplicationService = Depends(get_service),
-) -> MapDataResponse:
+    service: AirQualityApplicationService = Depends(get_air_quality_service),
+) -> Response:
     """Get map data (POST)."""
     from ...application.queries.get_map_data_query import GetMapDataQuery
 
@@ -162,7 +182,7 @@ async def get_map_data_post(
     )
 
     result = await service.get_map_data(query)
-    return MapDataResponse.model_validate(result)
+    return _json_response(result)
 
 
 # =============================================================================
@@ -175,7 +195,7 @@ async def get_heatmap_tile(
     zoom: int = Path(..., ge=0, le=20, description="Zoom level"),
     x: int = Path(..., ge=0, description="Tile X coordinate"),
     y: int = Path(..., ge=0, description="Tile Y coordinate"),
-    service: AirQualityApplicationService = Depends(get_service),
+    service: AirQualityApplicationService = Depends(get_air_quality_service),
 ) -> Response:
     """Get air quality heatmap tile.
 
@@ -245,8 +265,8 @@ async def get_forecast(
     longitude: float = Query(..., ge=-180, le=180, description="Longitude"),
     hours: int = Query(24, ge=1, le=168, description="Forecast duration (hours)"),
     interval_hours: int = Query(1, ge=1, le=24, description="Data point interval"),
-    service: AirQualityApplicationService = Depends(get_service),
-) -> ForecastResponse:
+    service: AirQualityApplicationService = Depends(get_air_quality_service),
+) -> Response:
     """Get AQI forecast for a location."""
     from ...application.queries.get_forecast_query import GetForecastQuery
 
@@ -258,14 +278,14 @@ async def get_forecast(
     )
 
     result = await service.get_forecast(query)
-    return ForecastResponse.model_validate(result)
+    return _json_response(_forecast_payload(result))
 
 
 @router.post("/aqi/forecast", response_model=ForecastResponse)
 async def get_forecast_post(
     request: ForecastRequest,
-    service: AirQualityApplicationService = Depends(get_service),
-) -> ForecastResponse:
+    service: AirQualityApplicationService = Depends(get_air_quality_service),
+) -> Response:
     """Get forecast (POST)."""
     from ...application.queries.get_forecast_query import GetForecastQuery
 
@@ -277,7 +297,29 @@ async def get_forecast_post(
     )
 
     result = await service.get_forecast(query)
-    return ForecastResponse.model_validate(result)
+    return _json_response(_forecast_payload(result))
+
+
+@router.get("/aqi/forecast/stream")
+async def get_forecast_stream(
+    latitude: float = Query(..., ge=-90, le=90, description="Latitude"),
+    longitude: float = Query(..., ge=-180, le=180, description="Longitude"),
+    hours: int = Query(24, ge=1, le=168, description="Forecast duration (hours)"),
+    interval_hours: int = Query(1, ge=1, le=24, description="Data point interval"),
+    service: AirQualityApplicationService = Depends(get_air_quality_service),
+) -> StreamingResponse:
+    """Get AQI forecast as NDJSON: a summary line, then one line per data point."""
+    from ...application.queries.get_forecast_query import GetForecastQuery
+
+    query = GetForecastQuery(
+        latitude=latitude,
+        longitude=longitude,
+        hours=hours,
+        interval_hours=interval_hours,
+    )
+
+    result = await service.get_forecast(query)
+    return StreamingResponse(_forecast_ndjson(result), media_type="application/x-ndjson")
 
 
 # =============================================================================
@@ -292,7 +334,7 @@ async def get_history(
     end: datetime = Query(..., description="End timestamp (ISO format)"),
     limit: int = Query(1000, ge=1, le=10000, description="Max readings to return"),
     sensor_client: SensorServiceClient = Depends(get_sensor_client),
-    service: AirQualityApplicationService = Depends(get_service),
+    service: AirQualityApplicationService = Depends(get_air_quality_service),
 ) -> HistoryResponse:
     """Get historical AQI data for a sensor.
 
@@ -352,7 +394,7 @@ async def get_history(
 async def get_history_post(
     request: HistoryRequest,
     sensor_client: SensorServiceClient = Depends(get_sensor_client),
-    service: AirQualityApplicationService = Depends(get_service),
+    service: AirQualityApplicationService = Depends(get_air_quality_service),
 ) -> HistoryResponse:
     """Get historical data (POST)."""
     return await get_history(
@@ -6,8 +6,9 @@ Uses module-level singletons initialized during the application lifespan.
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
+from ...config import settings
 from ...domain.services.aqi_calculator import AQICalculator
 from ...domain.services.calibration_model import CalibrationModel
 from ...domain.services.cross_validator import CrossValidationService
@@ -17,6 +18,11 @@ from ...infrastructure.cache.redis_cache import RedisCache
 from ...infrastructure.external.google_maps_client import GoogleMapsClient
 from ...infrastructure.external.sensor_service_client import SensorServiceClient
 
+if TYPE_CHECKING:
+    from ...application.services.air_quality_application_service import (
+        AirQualityApplicationService,
+    )
+
 logger = logging.getLogger(__name__)
 
 # Module-level singletons — set by lifespan startup in routes.py.
@@ -24,6 +30,14 @@ _cache: Optional[RedisCache] = None
 _google_client: Optional[GoogleMapsClient] = None
 _sensor_client: Optional[SensorServiceClient] = None
 _calibration_model: Optional[CalibrationModel] = None
+_service: Optional["AirQualityApplicationService"] = None
+
+
+def _new_calibration_model() -> CalibrationModel:
+    """Calibration model configured from settings."""
+    return CalibrationModel(
+        prediction_cache_size=settings.CALIBRATION_PREDICTION_CACHE_SIZE
+    )
 
 
 def init_dependencies(
@@ -32,30 +46,51 @@ def init_dependencies(
     sensor_client: SensorServiceClient,
 ) -> None:
     """Initialize shared singletons during lifespan startup."""
-    global _cache, _google_client, _sensor_client, _calibration_model
+    global _cache, _google_client, _sensor_client, _calibration_model, _service
     _cache = cache
     _google_client = google_client
     _sensor_client = sensor_client
-    _calibration_model = CalibrationModel()
+    _calibration_model = _new_calibration_model()
+    _service = None
 
 
-def get_air_quality_service():
-    """Provide an AirQualityApplicationService instance.
+def get_air_quality_service() -> "AirQualityApplicationService":
+    """Provide the shared AirQualityApplicationService instance.
 
-    The service is constructed from the shared singletons that were
-    initialized at startup. This avoids creating new Redis/HTTP
-    connections per request.
+    The service holds no per-request state, so one instance built from
+    the singletons initialized at startup is reused for every request.
+    This avoids creating new Redis/HTTP connections (and new domain
+    services) per request.
     """
-    from ...application.services.air_quality_application_service import (
-        AirQualityApplicationService,
-    )
+    global _service
+    if _service is None:
+        from ...application.services.air_quality_application_service import (
+            AirQualityApplicationService,
+        )
 
-    return AirQualityApplicationService(
-        aqi_calculator=AQICalculator(),
-        prediction_service=PredictionService(),
-        cache=_cache or RedisCache(),
-        google_client=_google_client or GoogleMapsClient(),
-        sensor_client=_sensor_client,
-        calibration_model=_calibration_model or CalibrationModel(),
-        cross_validator=CrossValidationService(),
-    )
+        _service = AirQualityApplicationService(
+            aqi_calculator=AQICalculator(),
+            prediction_service=PredictionService(),
+            cache=_cache or RedisCache(),
+            google_client=_google_client or GoogleMapsClient(),
+            sensor_client=_sensor_client,
+            calibration_model=_calibration_model or _new_calibration_model(),
+            cross_validator=CrossValidationService(),
+        )
+    return _service
+
+
+def get_calibration_model() -> CalibrationModel:
+    """Provide the shared calibration model."""
+    global _calibration_model
+    if _calibration_model is None:
+        _calibration_model = _new_calibration_model()
+    return _calibration_model
+
+
+def get_sensor_client() -> SensorServiceClient:
+    """Provide the shared Sensor Service client."""
+    global _sensor_client
+    if _sensor_client is None:
+        _sensor_client = SensorServiceClient()
+    return _sensor_client
@@ -17,6 +17,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from ...application.services.air_quality_application_service import (
     AirQualityApplicationService,
 )
+from ...domain.value_objects.bounding_box import BoundingBox
 from .dependencies import get_air_quality_service
 from .schemas import (
     CalibrationMetricsResponse,
@@ -53,12 +54,7 @@ async def get_fused_data(
     Returns sensor + satellite fused data points with calibrated PM2.5/PM10,
     AQI values, and confidence scores.
     """
-    bbox = {
-        "north": lat_max,
-        "south": lat_min,
-        "east": lon_max,
-        "west": lon_min,
-    }
+    bbox = BoundingBox(north=lat_max, south=lat_min, east=lon_max, west=lon_min)
     data = await service.get_fused_data(bbox, timestamp)
     return FusedDataListResponse(data=data, total=len(data))
 
@@ -89,12 +85,7 @@ async def get_fused_map_data(
     Returns grid cells with fused AQI, confidence, and contributing sources,
     suitable for rendering heatmaps on the frontend.
     """
-    bbox = {
-        "north": lat_max,
-        "south": lat_min,
-        "east": lon_max,
-        "west": lon_min,
-    }
+    bbox = BoundingBox(north=lat_max, south=lat_min, east=lon_max, west=lon_min)
     return await service.get_fused_map_data(bbox)
 
 
@@ -18,6 +18,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from ...config import settings
+from ...domain.services.aqi_calculator import warm_up_batch_kernel
 from ...infrastructure.cache.redis_cache import RedisCache
 from ...infrastructure.external.google_maps_client import GoogleMapsClient
 from ...infrastructure.external.sensor_service_client import SensorServiceClient
@@ -62,8 +63,13 @@ async def lifespan(app: FastAPI):
     _sensor_client = SensorServiceClient()
     await _sensor_client.connect()
 
+    # Shared clients for dependencies that read them from the app state
+    app.state.cache = _cache
+    app.state.google_client = _google_client
+    app.state.sensor_client = _sensor_client
+
     # 3b. Initialize DI singletons for controllers
-    from .dependencies import init_dependencies
+    from .dependencies import get_calibration_model, init_dependencies
 
     init_dependencies(
         cache=_cache,
@@ -108,6 +114,7 @@ async def lifespan(app: FastAPI):
             rabbitmq_url=settings.RABBITMQ_URL,
             sensor_client=_sensor_client,
             cache=_cache,
+            calibration_model=get_calibration_model(),
         )
         await _satellite_consumer.start()
         logger.info("Satellite data consumer started")
@@ -125,6 +132,13 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning("Could not start sensor reading consumer: %s", e)
 
+    # 7. Compile the batch AQI kernel off the event loop
+    try:
+        if await asyncio.to_thread(warm_up_batch_kernel):
+            logger.info("Batch AQI kernel compiled")
+    except Exception as e:
+        logger.warning("Could not compile batch AQI kernel: %s", e)
+
     logger.info("Air Quality Service started successfully")
 
     yield
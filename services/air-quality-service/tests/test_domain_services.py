@@ -15,7 +15,7 @@ from uuid import uuid4
 from src.domain.services.aqi_calculator import AQICalculator, AQIResult
 from src.domain.services.calibration_model import CalibrationModel, TrainingResult, EvaluationMetrics
 from src.domain.services.cross_validator import CrossValidationService, ValidationResult
-from src.domain.services.data_fusion import DataFusionService, FusedDataPoint
+from src.domain.services.data_fusion import DataFusionService, FusedDataPoint, FusionInput
 from src.domain.value_objects.location import Location
 from src.domain.value_objects.aqi_category import get_category_for_aqi, get_all_categories
 
@@ -131,6 +131,229 @@ class TestCalibrationModel:
         assert result.training_samples == 100
         assert model.is_trained
 
+    def test_feature_matrix_fills_defaults(self):
+        """Test missing features take their defaults, in FEATURE_NAMES order."""
+        X, y = CalibrationModel.feature_matrix([
+            ({"raw_pm25": 40.0, "humidity": 80}, 35.0),
+            ({}, 12.5),
+        ])
+
+        assert X.dtype == np.float32 and y.dtype == np.float64
+        np.testing.assert_array_equal(X, [[40, 25, 80, 0.5, 12, 0], [0, 25, 50, 0.5, 12, 0]])
+        np.testing.assert_array_equal(y, [35.0, 12.5])
+        assert CalibrationModel.feature_matrix([])[0].shape == (0, 6)
+
+    def test_train_array_matches_train(self, model, tmp_path):
+        """Test training on a prebuilt matrix matches training on dicts."""
+        rng = np.random.default_rng(0)
+        training_data = [
+            ({"raw_pm25": v, "hour": 12, "day_of_week": 0}, v * 1.05)
+            for v in rng.uniform(10, 100, 60)
+        ]
+        X, y = CalibrationModel.feature_matrix(training_data)
+        other = CalibrationModel(model_path=str(tmp_path / "other.joblib"))
+
+        from_dicts = model.train(training_data)
+        from_array = other.train_array(X, y)
+
+        assert X.shape == (60, len(CalibrationModel.FEATURE_NAMES))
+        assert from_array.training_samples == from_dicts.training_samples
+        assert from_array.rmse == pytest.approx(from_dicts.rmse)
+
+    def test_fast_predictor_matches_sklearn(self, model, tmp_path):
+        """Test the flattened trees reproduce the sklearn prediction."""
+        rng = np.random.default_rng(1)
+        X = rng.uniform([0, 10, 20, 0, 0, 0], [200, 40, 100, 2, 23, 6], (200, 6))
+        y = X[:, 0] * 1.1 + X[:, 1] - X[:, 3] * 10 + rng.normal(0, 3, 200)
+        model.train_array(X.astype(np.float32), y)
+        reloaded = CalibrationModel(model_path=model.model_path)
+
+        rows = np.vstack([X[:20], rng.uniform(0, 200, (20, 6))])
+        expected = model.model.predict(rows)
+        for row, value in zip(rows, expected):
+            features = dict(zip(CalibrationModel.FEATURE_NAMES, row))
+            assert model.calibrate(features)["pm25"] == pytest.approx(value)
+            assert reloaded.calibrate(features)["pm25"] == pytest.approx(value)
+
+    def test_one_pass_metrics_match_numpy(self):
+        """Test the fused metric kernel agrees with the NumPy reductions."""
+        from src.domain.services import calibration_model
+
+        rng = np.random.default_rng(9)
+        y_true = rng.uniform(1e3, 1e3 + 80, 10_000)
+        y_pred = y_true + rng.normal(0.5, 3.0, 10_000)
+
+        reference = calibration_model._regression_metrics_numpy(y_true, y_pred)
+
+        np.testing.assert_allclose(
+            calibration_model._regression_metrics_kernel(y_true, y_pred), reference, rtol=1e-9
+        )
+        np.testing.assert_allclose(
+            calibration_model._regression_metrics(y_true, y_pred), reference, rtol=1e-9
+        )
+        assert calibration_model._regression_metrics_kernel(np.ones(3), np.ones(3))[0] == 0.0
+
+    def test_numba_row_kernel_matches_numpy(self, model, monkeypatch):
+        """Test the compiled row walk and the level-by-level NumPy walk agree."""
+        from src.domain.services import calibration_model
+
+        if calibration_model.njit is None:
+            pytest.skip("numba not installed")
+
+        rng = np.random.default_rng(3)
+        X = rng.uniform(0, 100, (120, 6))
+        model.train_array(X.astype(np.float32), X[:, 0] * 1.2 + X[:, 1])
+        rows = rng.uniform(0, 100, (30, 6))
+        rows[0, 2] = np.nan
+
+        compiled = model._fast_predictor.predict(rows)
+        monkeypatch.setattr(calibration_model, "njit", None)
+        interpreted = model._fast_predictor.predict(rows)
+
+        np.testing.assert_allclose(compiled, interpreted)
+        np.testing.assert_allclose(compiled, model.model.predict(rows))
+
+    def test_calibrate_columns_matches_calibrate_batch(self, model):
+        """Test column input calibrates like the equivalent feature dicts."""
+        rng = np.random.default_rng(6)
+        X = rng.uniform(1, 100, (120, 6))
+        model.train_array(X.astype(np.float32), X[:, 0] * 0.8)
+        raw_pm25 = [30.0, 0.0, 55.5]
+        raw_pm10 = [60.0, 40.0, None]
+
+        pm25, pm10 = model.calibrate_columns(
+            raw_pm25, raw_pm10, temperature=28.0, humidity=[60, None, 70],
+            satellite_aod=0.4, hour=9,
+        )
+
+        expected = model.calibrate_batch([
+            {"raw_pm25": a, "raw_pm10": b, "temperature": 28.0, "humidity": h,
+             "satellite_aod": 0.4, "hour": 9}
+            for a, b, h in zip(raw_pm25, raw_pm10, [60, None, 70])
+        ])
+        assert pm25.tolist() == [row["pm25"] for row in expected]
+        assert [None if np.isnan(v) else v for v in pm10] == [row["pm10"] for row in expected]
+
+    def test_calibrate_batch_matches_calibrate(self, model):
+        """Test batch calibration equals calibrating each reading alone."""
+        rng = np.random.default_rng(4)
+        X = rng.uniform(0, 100, (120, 6))
+        model.train_array(X.astype(np.float32), X[:, 0] * 0.9)
+        features_list = [
+            {"raw_pm25": 40.0, "raw_pm10": 80.0, "temperature": 30.0, "hour": 8},
+            {"raw_pm25": 0.0, "raw_pm10": 80.0},
+            {"raw_pm25": 25.0, "raw_pm10": None, "satellite_aod": 0.2},
+            {"raw_pm25": 60.0},
+        ]
+
+        batch = model.calibrate_batch(features_list)
+
+        assert batch == [model.calibrate(features) for features in features_list]
+        assert [r["pm10"] is None for r in batch] == [False, True, True, True]
+        assert batch[0]["pm10"] == pytest.approx(80.0 * batch[0]["pm25"] / 40.0)
+
+    def test_legacy_gradient_boosting_model(self, tmp_path):
+        """Test a saved classic GradientBoostingRegressor still calibrates."""
+        import joblib
+        from sklearn.ensemble import GradientBoostingRegressor
+
+        rng = np.random.default_rng(2)
+        X = rng.uniform(0, 100, (100, 6))
+        legacy = GradientBoostingRegressor(n_estimators=20, max_depth=3, random_state=0)
+        legacy.fit(X, X[:, 0] * 1.1)
+        model_path = tmp_path / "legacy.joblib"
+        joblib.dump(legacy, model_path)
+
+        model = CalibrationModel(model_path=str(model_path))
+
+        for row, value in zip(X[:10], legacy.predict(X[:10])):
+            features = dict(zip(CalibrationModel.FEATURE_NAMES, row))
+            assert model.calibrate(features)["pm25"] == pytest.approx(value)
+
+    def test_saved_model_loaded_once_per_file_version(self, model):
+        """Test instances share a loaded model until the file is rewritten."""
+        rng = np.random.default_rng(13)
+        X = rng.uniform(0, 100, (80, 6))
+        model.train_array(X.astype(np.float32), X[:, 0] * 0.9)
+
+        first = CalibrationModel(model_path=model.model_path)
+        second = CalibrationModel(model_path=model.model_path)
+        assert first.model is second.model
+        assert first._fast_predictor is second._fast_predictor
+        before = first.calibrate_batch([dict(zip(CalibrationModel.FEATURE_NAMES, X[0]))])
+
+        second.train_array(X.astype(np.float32), X[:, 0] * 2.0)
+
+        assert second.model is not first.model
+        assert first.calibrate_batch([dict(zip(CalibrationModel.FEATURE_NAMES, X[0]))]) == before
+        assert CalibrationModel(model_path=model.model_path).model is not first.model
+
+    def test_saved_tree_arrays_skip_unpickling(self, model, monkeypatch):
+        """Test a cold start maps the saved trees instead of loading the model."""
+        from src.domain.services import calibration_model
+
+        rng = np.random.default_rng(15)
+        X = rng.uniform(0, 100, (80, 6))
+        model.train_array(X.astype(np.float32), X[:, 0] * 1.3)
+        expected = model.model.predict(X[:5])
+        calibration_model._load_model.cache_clear()
+        calibration_model._load_predictor.cache_clear()
+        monkeypatch.setattr(
+            calibration_model.joblib, "load", lambda path: pytest.fail("unpickled")
+        )
+
+        cold = CalibrationModel(model_path=model.model_path)
+
+        assert isinstance(cold._fast_predictor.value, np.memmap)
+        np.testing.assert_allclose(cold._fast_predictor.predict(X[:5]), expected)
+        assert cold._model is None
+
+    def test_stale_tree_arrays_are_ignored(self, model, tmp_path):
+        """Test arrays saved for an older model file fall back to the model."""
+        import joblib
+        from src.domain.services import calibration_model
+
+        rng = np.random.default_rng(16)
+        X = rng.uniform(0, 100, (80, 6))
+        model.train_array(X.astype(np.float32), X[:, 0] * 1.3)
+        other = CalibrationModel(model_path=str(tmp_path / "other.joblib"))
+        other.train_array(X.astype(np.float32), X[:, 0] * 0.5)
+        joblib.dump(other.model, model.model_path)  # replaced without its trees
+
+        replaced = CalibrationModel(model_path=model.model_path)
+
+        assert calibration_model._TreeEnsemble.load(
+            calibration_model._tree_dir(model.model_path),
+            (0, 0),
+        ) is None
+        np.testing.assert_allclose(
+            replaced._fast_predictor.predict(X[:5]), other.model.predict(X[:5])
+        )
+
+    def test_prediction_cache_uses_quantized_features(self, tmp_path):
+        """Test memoized calibrate() predicts from rounded features."""
+        model = CalibrationModel(
+            model_path=str(tmp_path / "cached.joblib"), prediction_cache_size=16
+        )
+        rng = np.random.default_rng(14)
+        X = rng.uniform(0, 100, (80, 6))
+        model.train_array(X.astype(np.float32), X[:, 0] * 0.9)
+        features = {"raw_pm25": 42.04, "raw_pm10": 84.0, "temperature": 27.4,
+                    "humidity": 61.0, "satellite_aod": 0.433, "hour": 9}
+
+        result = model.calibrate(features)
+        model.calibrate(dict(features, raw_pm25=41.96, temperature=26.6))
+
+        rounded = {"raw_pm25": 42.0, "temperature": 27.0, "humidity": 60.0,
+                   "satellite_aod": 0.43, "hour": 9}
+        expected = model.calibrate_batch([rounded])[0]["pm25"]
+        assert result["pm25"] == pytest.approx(expected)
+        assert result["pm10"] == pytest.approx(84.0 * result["pm25"] / 42.04)
+        assert model._cached_predict.cache_info().hits == 1
+
+        model.train_array(X.astype(np.float32), X[:, 0] * 2.0)
+        assert model._cached_predict.cache_info().currsize == 0
+
     def test_calibrate_trained(self, model, tmp_path):
         """Test calibration with trained model."""
         # Train first
@@ -257,6 +480,24 @@ class TestCrossValidationService:
         assert result.sample_count == 50
         assert result.correlation < 0.5  # Should have low correlation
 
+    def test_single_pass_stats_match_numpy(self):
+        """Test the one-pass statistics kernel agrees with the NumPy path."""
+        from src.domain.services import cross_validator
+
+        rng = np.random.default_rng(8)
+        satellite = rng.uniform(1e4, 1e4 + 60, 5_000)
+        sensor = satellite * rng.uniform(0.9, 1.1, 5_000)
+
+        kernel = cross_validator._validation_stats_kernel(sensor, satellite)
+        reference = cross_validator._validation_stats_numpy(sensor, satellite)
+
+        np.testing.assert_allclose(kernel, reference, rtol=1e-9)
+        np.testing.assert_allclose(
+            cross_validator._validation_stats(sensor, satellite), reference, rtol=1e-9
+        )
+        constant = cross_validator._validation_stats_kernel(np.full(4, 5.0), satellite[:4])
+        assert np.isnan(constant[0])
+
     def test_validate_insufficient_data(self, validator):
         """Test validation with insufficient data."""
         sensor_id = uuid4()
@@ -335,6 +576,41 @@ class TestDataFusionService:
         assert "sensor" in point.data_sources
         assert "satellite" in point.data_sources
 
+    def test_fuse_data_calibrates_in_one_batch(self, calibration_model, monkeypatch):
+        """Test dual-source readings share one call, matching dict calibration."""
+        rng = np.random.default_rng(5)
+        X = rng.uniform(0, 100, (120, 6))
+        calibration_model.train_array(X.astype(np.float32), X[:, 0] * 0.9)
+        calls = []
+        real_columns = calibration_model.calibrate_columns
+        monkeypatch.setattr(
+            calibration_model,
+            "calibrate_columns",
+            lambda **columns: calls.append(columns) or real_columns(**columns),
+        )
+        readings = [
+            {"latitude": 10.77, "longitude": 106.70, "pm25": 50.0, "pm10": 90.0},
+            {"latitude": 10.78, "longitude": 106.71, "pm25": None},
+            {"latitude": 10.79, "longitude": 106.72, "pm25": 20.0, "pm10": None},
+        ]
+        satellite_data = {"grid_cells": [{"lat": 10.78, "lon": 106.70, "value": 0.5}]}
+
+        points = DataFusionService(calibration_model).fuse_data(
+            readings, satellite_data, datetime(2024, 1, 1, 8)
+        )
+
+        assert len(calls) == 1 and len(calls[0]["raw_pm25"]) == 2
+        assert [p.confidence for p in points] == [0.9, 0.5, 0.9]
+        expected = calibration_model.calibrate_batch([
+            {"raw_pm25": r["pm25"], "raw_pm10": r["pm10"], "temperature": None,
+             "humidity": None, "satellite_aod": 0.5, "hour": 8}
+            for r in (readings[0], readings[2])
+        ])
+        assert [
+            {"pm25": p.fused_pm25, "pm10": p.fused_pm10} for p in (points[0], points[2])
+        ] == expected
+        assert points[2].fused_pm10 is None
+
     def test_fuse_data_sensor_only(self, fusion_service):
         """Test fusion with sensor data only."""
         sensor_readings = [
@@ -365,6 +641,26 @@ class TestDataFusionService:
         assert point.satellite_aod is None
         assert point.confidence < 0.9  # Lower confidence without satellite
 
+    def test_fuse_data_accepts_fusion_inputs(self, fusion_service):
+        """Test FusionInput records fuse exactly like the equivalent dicts."""
+        reading = {
+            "latitude": 10.7769,
+            "longitude": 106.7009,
+            "pm25": 50.0,
+            "pm10": 100.0,
+            "temperature": 25.0,
+            "humidity": 60.0,
+        }
+        satellite_data = {"grid_cells": [{"lat": 10.78, "lon": 106.70, "value": 0.5}]}
+        timestamp = datetime(2024, 1, 1, 12, 0)
+
+        from_dicts = fusion_service.fuse_data([reading], satellite_data, timestamp)
+        from_inputs = fusion_service.fuse_data(
+            [FusionInput(**reading)], satellite_data, timestamp
+        )
+
+        assert from_inputs == from_dicts
+
     def test_fuse_data_satellite_only(self, fusion_service):
         """Test fusion with satellite data only (gap filling)."""
         sensor_readings = []  # No sensor data
@@ -386,6 +682,58 @@ class TestDataFusionService:
         # Should return empty or satellite-only points
         assert len(fused_points) == 0  # No sensors to fuse with
 
+    def test_aqi_batch_matches_breakpoint_chain(self, fusion_service):
+        """Test the vectorized AQI lookup matches the scalar breakpoint rules."""
+        def reference(pm25):
+            if pm25 <= 12:
+                return int(pm25 * 50 / 12)
+            if pm25 <= 35.4:
+                return int(50 + (pm25 - 12) * 50 / 23.4)
+            if pm25 <= 55.4:
+                return int(100 + (pm25 - 35.4) * 50 / 20)
+            if pm25 <= 150.4:
+                return int(150 + (pm25 - 55.4) * 50 / 95)
+            return int(200 + (pm25 - 150.4) * 100 / 100)
+
+        values = [0.0, 12.0, 12.1, 35.4, 35.5, 55.4, 150.4, 150.5, 600.0, -3.0]
+        values += np.random.default_rng(12).uniform(0, 300, 500).tolist()
+
+        aqis = fusion_service._calculate_aqi_batch(values + [None, float("nan")])
+
+        assert aqis == [reference(v) for v in values] + [None, None]
+        assert fusion_service._calculate_aqi(35.4) == reference(35.4)
+
+    @pytest.mark.parametrize("brute_force_pairs", [0, 65_536])
+    def test_satellite_values_match_nearest_cell_scan(
+        self, fusion_service, monkeypatch, brute_force_pairs
+    ):
+        """Test both lookup paths pick the same cell as a linear scan."""
+        from src.domain.services import data_fusion
+
+        monkeypatch.setattr(data_fusion, "_BRUTE_FORCE_PAIRS", brute_force_pairs)
+        rng = np.random.default_rng(11)
+        grid_cells = [
+            {"lat": lat, "lon": lon, "value": value}
+            for lat, lon, value in zip(
+                rng.uniform(10, 11, 200), rng.uniform(106, 107, 200), rng.uniform(0, 1, 200)
+            )
+        ]
+        readings = [
+            FusionInput(latitude=lat, longitude=lon)
+            for lat, lon in zip(rng.uniform(10, 11, 50), rng.uniform(106, 107, 50))
+        ]
+
+        values = fusion_service._get_satellite_values({"grid_cells": grid_cells}, readings)
+
+        expected = [
+            min(
+                grid_cells,
+                key=lambda c: (c["lat"] - r.latitude) ** 2 + (c["lon"] - r.longitude) ** 2,
+            )["value"]
+            for r in readings
+        ]
+        assert values == expected
+
 
 # =============================================================================
 # Prediction Service Tests
@@ -0,0 +1,393 @@
+"""Unit tests for AirQualityApplicationService result helpers."""
+import asyncio
+import dataclasses
+import uuid
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from src.application.queries.get_current_aqi_query import GetCurrentAQIQuery
+from src.application.queries.get_forecast_query import GetForecastQuery
+from src.application.services.air_quality_application_service import (
+    AirQualityApplicationService,
+)
+from src.domain.services.aqi_calculator import AQICalculator
+from src.domain.services.calibration_model import CalibrationModel
+from src.domain.services.prediction_service import PredictionService
+from src.domain.value_objects.aqi_category import get_category_for_aqi
+from src.infrastructure.external.sensor_service_client import SensorReading
+
+
+def make_service() -> AirQualityApplicationService:
+    return AirQualityApplicationService(
+        aqi_calculator=AQICalculator(),
+        prediction_service=PredictionService(),
+        cache=None,
+        google_client=None,
+    )
+
+
+class TestEmptyResult:
+    """Tests for _empty_result()."""
+
+    def test_location_and_defaults(self):
+        """Test the empty result carries the location and no-data defaults."""
+        result = make_service()._empty_result(21.0285, 105.8542)
+
+        assert (result.location_lat, result.location_lng) == (21.0285, 105.8542)
+        assert result.aqi_value == 0
+        assert result.level == "GOOD"
+        assert result.data_source == "none"
+        assert result.timestamp
+
+    def test_results_do_not_share_state(self):
+        """Test copies from the template do not share mutable fields."""
+        service = make_service()
+        first = service._empty_result(21.0, 105.0)
+        second = service._empty_result(10.0, 106.0)
+
+        first.pollutants["pm25"] = 1.0
+
+        assert second.pollutants == {}
+        assert second.location_lat == 10.0
+
+    def test_result_is_frozen(self):
+        """Test results are immutable slotted dataclasses."""
+        result = make_service()._empty_result(21.0, 105.0)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.aqi_value = 10
+        assert not hasattr(result, "__dict__")
+
+
+class TestIsoAt:
+    """Tests for the epoch-second ISO formatter."""
+
+    def test_matches_datetime_isoformat(self):
+        """Test output equals the naive UTC datetime's isoformat()."""
+        from src.application.services.air_quality_application_service import _iso_at
+
+        for second in (0, 951782400, 1700000000, 4102444799):
+            expected = datetime.fromtimestamp(second, timezone.utc).replace(tzinfo=None)
+            assert _iso_at(second) == expected.isoformat()
+
+
+class SlowSensorClient:
+    """Sensor client that records how many reading requests overlap."""
+
+    def __init__(self, sensors):
+        self.sensors = sensors
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_all_active_sensors(self):
+        return self.sensors
+
+    async def get_sensor_readings(self, sensor_id, start, end, limit=1000):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return []
+
+
+class EmptyCache:
+    async def get_aqi_many(self, locations, radius):
+        return [None] * len(locations)
+
+
+class TestValidationFanOut:
+    """Tests for concurrent sensor validation."""
+
+    def make_service(self, sensors):
+        service = make_service()
+        service.sensor_client = SlowSensorClient(sensors)
+        service.cache = EmptyCache()
+        return service
+
+    async def test_report_validates_sensors_concurrently(self):
+        """Test sensors are validated in parallel and bad ids are skipped."""
+        sensors = [{"sensor_id": str(uuid.uuid4())} for _ in range(5)]
+        service = self.make_service(sensors + [{"sensor_id": "not-a-uuid"}, {}])
+
+        report = await service.get_validation_report()
+
+        assert report["total_sensors"] == 5
+        assert (report["average_correlation"], report["average_bias"]) == (0.0, 0.0)
+        assert [s["sensor_id"] for s in report["sensors"]] == [
+            s["sensor_id"] for s in sensors
+        ]
+        assert service.sensor_client.max_in_flight == 5
+
+    async def test_run_validation_counts_successes(self):
+        """Test only sensors that validated without error are counted."""
+        sensors = [{"id": str(uuid.uuid4())}, {"sensor_id": "not-a-uuid"}]
+
+        assert await self.make_service(sensors).run_validation() == 1
+
+
+class CountingSensorClient:
+    """Sensor client that counts nearby-reading queries."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def get_recent_readings(self, latitude, longitude, radius_km=10.0, limit=50):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return []
+
+
+class DictCache:
+    def __init__(self, entries=None):
+        self.entries = dict(entries or {})
+
+    async def get_aqi(self, lat, lng, radius):
+        return self.entries.get((lat, lng))
+
+    async def set_aqi(self, lat, lng, radius, data, ttl=None):
+        return True
+
+
+class TestSpeculativeSensorFetch:
+    """Tests for starting the sensor query alongside the cache lookup."""
+
+    @pytest.fixture(autouse=True)
+    def enable(self, monkeypatch):
+        from src.config import settings
+
+        monkeypatch.setattr(settings, "SPECULATIVE_SENSOR_FETCH", True)
+
+    async def test_miss_reuses_started_query(self):
+        """Test a cache miss awaits the speculative query instead of a new one."""
+        service = make_service()
+        service.sensor_client = CountingSensorClient()
+        service.cache = DictCache()
+
+        result = await service.get_current_aqi(GetCurrentAQIQuery(21.0, 105.8))
+
+        assert service.sensor_client.calls == 1
+        assert result.data_source == "none"
+
+    async def test_hit_cancels_query(self):
+        """Test a cache hit cancels the speculative sensor query."""
+        cached = dataclasses.asdict(make_service()._empty_result(21.0, 105.8))
+        service = make_service()
+        service.sensor_client = CountingSensorClient()
+        service.cache = DictCache({(21.0, 105.8): cached})
+
+        await service.get_current_aqi(GetCurrentAQIQuery(21.0, 105.8))
+        await asyncio.sleep(0)
+
+        assert service.sensor_client.calls == 0
+
+    async def test_no_speculation_while_hit_rate_high(self):
+        """Test speculation stops once most lookups are cache hits."""
+        cached = dataclasses.asdict(make_service()._empty_result(21.0, 105.8))
+        service = make_service()
+        service.sensor_client = CountingSensorClient()
+        service.cache = DictCache({(21.0, 105.8): cached})
+        query = GetCurrentAQIQuery(21.0, 105.8)
+
+        for _ in range(50):
+            await service.get_current_aqi(query)
+
+        assert service._aqi_hit_rate > 0.5
+        assert service._speculative_pollutants(query) is None
+
+
+class TestCalibrationStatus:
+    """Tests for the cached calibration model stat."""
+
+    async def test_stat_reused_within_ttl(self, tmp_path, monkeypatch):
+        """Test the model file is stat'ed once per TTL window."""
+        from src.application.services import air_quality_application_service as module
+
+        service = make_service()
+        model_path = tmp_path / "model.joblib"
+        model_path.write_bytes(b"")
+        service.calibration_model.model_path = str(model_path)
+        stats = []
+        real_getmtime = module.os.path.getmtime
+        monkeypatch.setattr(
+            module.os.path,
+            "getmtime",
+            lambda path: stats.append(path) or real_getmtime(path),
+        )
+
+        first = await service.get_calibration_status()
+        second = await service.get_calibration_status()
+
+        assert first["last_trained"] is not None
+        assert second["last_trained"] == first["last_trained"]
+        assert len(stats) == 1
+
+    async def test_missing_model_file(self, tmp_path):
+        """Test a missing model file reports no training time."""
+        service = make_service()
+        service.calibration_model.model_path = str(tmp_path / "missing.joblib")
+
+        assert (await service.get_calibration_status())["last_trained"] is None
+
+
+class TrainingSensorClient:
+    """Sensor client with fixed per-sensor readings."""
+
+    def __init__(self, readings_by_sensor):
+        self.readings_by_sensor = readings_by_sensor
+
+    async def get_all_active_sensors(self):
+        return [{"sensor_id": sid} for sid in self.readings_by_sensor]
+
+    async def get_sensor_readings(self, sensor_id, start, end, limit=1000):
+        return self.readings_by_sensor[sensor_id]
+
+
+class ReferenceCache:
+    """Cache answering AQI batch lookups and recording them."""
+
+    def __init__(self, references):
+        self.references = references
+        self.batches = []
+
+    async def get_aqi_many(self, locations, radius):
+        self.batches.append(list(locations))
+        return [self.references.get(loc) for loc in locations]
+
+
+def make_reading(lat, lng, pm25):
+    return SensorReading(
+        sensor_id="s", factory_id="f", latitude=lat, longitude=lng,
+        pm25=pm25, pm10=0.0, co=0.0, no2=0.0, so2=0.0, o3=0.0, aqi=0,
+        timestamp=datetime(2024, 1, 1, 8, 0),
+    )
+
+
+class TestTrainingPairs:
+    """Tests for _get_training_pairs() batching."""
+
+    async def test_one_deduplicated_cache_lookup(self):
+        """Test all sensors share a single lookup of distinct locations."""
+        service = make_service()
+        service.sensor_client = TrainingSensorClient({
+            "a": [make_reading(21.0, 105.8, 10.0), make_reading(21.0, 105.8, 12.0)],
+            "b": [make_reading(21.0, 105.8, 14.0), make_reading(21.1, 105.9, 0.0)],
+            "c": [make_reading(21.2, 106.0, 20.0)],
+        })
+        service.cache = ReferenceCache({(21.0, 105.8): {"fused_pm25": 11.0}})
+
+        X, y = await service._get_training_pairs()
+
+        assert service.cache.batches == [[(21.0, 105.8), (21.2, 106.0)]]
+        assert X.shape == (3, len(CalibrationModel.FEATURE_NAMES))
+        assert X[:, 0].tolist() == [10.0, 12.0, 14.0]
+        assert y.tolist() == [11.0, 11.0, 11.0]
+
+    async def test_features_match_dict_conversion(self):
+        """Test the filled matrix equals converting feature dicts."""
+        service = make_service()
+        service.sensor_client = TrainingSensorClient({"a": [make_reading(21.0, 105.8, 10.0)]})
+        service.cache = ReferenceCache({(21.0, 105.8): {"fused_pm25": 11.0}})
+
+        X, y = await service._get_training_pairs()
+
+        features = {"raw_pm25": 10.0, "hour": 8, "day_of_week": 0}
+        expected_X, expected_y = CalibrationModel.feature_matrix([(features, 11.0)])
+        np.testing.assert_array_equal(X, expected_X)
+        np.testing.assert_array_equal(y, expected_y)
+
+
+class NoForecastCache:
+    async def get_forecast(self, lat, lng, hours):
+        return None
+
+    async def set_forecast(self, lat, lng, hours, forecast_data, ttl=None):
+        return True
+
+
+class TestForecastPoints:
+    """Tests for forecast data point construction."""
+
+    async def test_levels_match_predicted_aqi(self):
+        """Test batch-assigned levels match each point's own category."""
+        service = make_service()
+        service.cache = NoForecastCache()
+
+        result = await service.get_forecast(GetForecastQuery(21.0, 105.8, hours=12))
+
+        assert len(result.data_points) == 12
+        assert [p.level for p in result.data_points] == [
+            get_category_for_aqi(p.predicted_aqi).level.value for p in result.data_points
+        ]
+
+
+class TestSensorValidationPairs:
+    """Tests for get_sensor_validation() reference matching."""
+
+    async def test_aligned_values_from_one_lookup(self):
+        """Test readings are paired with references from a single batch."""
+        sensor_id = uuid.uuid4()
+        service = make_service()
+        service.sensor_client = TrainingSensorClient({
+            str(sensor_id): [
+                make_reading(21.0, 105.8, 10.0),
+                make_reading(21.0, 105.8, 0.0),
+                make_reading(21.5, 105.5, 30.0),
+                make_reading(21.0, 105.8, 12.0),
+                make_reading(21.0, 105.8, 14.0),
+            ]
+        })
+        service.cache = ReferenceCache({(21.0, 105.8): {"fused_pm25": 11.0}})
+
+        result = await service.get_sensor_validation(sensor_id)
+
+        assert service.cache.batches == [[(21.0, 105.8), (21.5, 105.5)]]
+        assert result["sample_count"] == 3
+
+
+class TestCurrentAQICoalescing:
+    """Tests for sharing one computation between concurrent cache misses."""
+
+    async def test_concurrent_misses_share_one_computation(self):
+        """Test nearby concurrent misses query sensors once at their own location."""
+        service = make_service()
+        service.sensor_client = CountingSensorClient()
+        service.cache = DictCache()
+
+        first, second = await asyncio.gather(
+            service.get_current_aqi(GetCurrentAQIQuery(21.0001, 105.8001)),
+            service.get_current_aqi(GetCurrentAQIQuery(21.0002, 105.8002)),
+        )
+
+        assert service.sensor_client.calls == 1
+        assert (first.location_lat, first.location_lng) == (21.0001, 105.8001)
+        assert (second.location_lat, second.location_lng) == (21.0002, 105.8002)
+        assert service._inflight_aqi == {}
+
+
+class TestDeprecatedServiceFactory:
+    """Tests for the module-level get_air_quality_service() dependency."""
+
+    async def test_reuses_lifespan_clients(self):
+        """Test clients stored on the app state are used and left open."""
+        from types import SimpleNamespace
+
+        from src.application.services.air_quality_application_service import (
+            get_air_quality_service,
+        )
+
+        cache, google, sensors = EmptyCache(), object(), CountingSensorClient()
+        state = SimpleNamespace(cache=cache, google_client=google, sensor_client=sensors)
+        request = SimpleNamespace(app=SimpleNamespace(state=state))
+
+        dependency = get_air_quality_service(request)
+        service = await dependency.__anext__()
+
+        assert (service.cache, service.google_client, service.sensor_client) == (
+            cache,
+            google,
+            sensors,
+        )
+        with pytest.raises(StopAsyncIteration):
+            await dependency.__anext__()
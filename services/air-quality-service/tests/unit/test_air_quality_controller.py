@@ -0,0 +1,48 @@
+"""Unit tests for the Air Quality API controller helpers."""
+from datetime import datetime
+
+import orjson
+
+from src.application.queries.get_forecast_query import ForecastDataPoint, GetForecastResult
+from src.interfaces.api.air_quality_controller import _forecast_ndjson, _forecast_payload
+
+
+def make_forecast() -> GetForecastResult:
+    return GetForecastResult(
+        location_lat=21.0,
+        location_lng=105.8,
+        generated_at=datetime(2024, 1, 1, 8, 0),
+        forecast_hours=2,
+        current_aqi=60,
+        data_points=[
+            ForecastDataPoint(
+                timestamp=datetime(2024, 1, 1, 9 + i, 0),
+                predicted_aqi=60 + i,
+                min_aqi=50 + i,
+                max_aqi=70 + i,
+                confidence=0.9,
+                trend="STABLE",
+                level="MODERATE",
+            )
+            for i in range(2)
+        ],
+        average_aqi=60,
+        max_aqi=61,
+    )
+
+
+class TestForecastNdjson:
+    """Tests for _forecast_ndjson()."""
+
+    def test_lines_reassemble_to_json_payload(self):
+        """Test the header plus point lines carry the same data as the JSON body."""
+        result = make_forecast()
+
+        lines = list(_forecast_ndjson(result))
+
+        assert len(lines) == 3
+        assert all(line.endswith(b"\n") and line.count(b"\n") == 1 for line in lines)
+        header, *points = map(orjson.loads, lines)
+        expected = orjson.loads(orjson.dumps(_forecast_payload(result)))
+        assert header == {k: v for k, v in expected.items() if k != "data_points"}
+        assert points == expected["data_points"]
@@ -0,0 +1,51 @@
+"""Unit tests for AirQualityDTO."""
+from datetime import datetime
+
+import orjson
+import pytest
+
+from src.application.dto.air_quality_dto import AirQualityDTO
+from src.domain.entities.air_quality_index import AirQualityIndex
+
+
+@pytest.fixture
+def entity():
+    return AirQualityIndex(
+        location_lat=10.7769,
+        location_lng=106.7009,
+        aqi_value=87,
+        level="MODERATE",
+        pollutants={"pm25": 28.4, "pm10": 45.0},
+        timestamp=datetime(2024, 1, 1, 12, 0, 0),
+    )
+
+
+class TestAirQualityDTO:
+    """Tests for AirQualityDTO mapping and encoding."""
+
+    def test_from_entity(self, entity):
+        """Test entity fields are mapped onto the DTO."""
+        dto = AirQualityDTO.from_entity(entity)
+
+        assert dto.aqi_value == 87
+        assert dto.level == "MODERATE"
+        assert dto.pollutants == {"pm25": 28.4, "pm10": 45.0}
+        assert dto.latitude == 10.7769
+        assert dto.longitude == 106.7009
+        assert dto.timestamp == datetime(2024, 1, 1, 12, 0, 0)
+
+    def test_dto_is_frozen(self, entity):
+        """Test DTOs cannot be mutated after creation."""
+        dto = AirQualityDTO.from_entity(entity)
+
+        with pytest.raises(AttributeError):
+            dto.aqi_value = 10
+
+    def test_orjson_encodes_dto(self, entity):
+        """Test the DTO serializes directly with orjson, as API responses do."""
+        dto = AirQualityDTO.from_entity(entity)
+
+        body = orjson.loads(orjson.dumps(dto))
+        assert body["aqi_value"] == 87
+        assert body["latitude"] == 10.7769
+        assert body["timestamp"] == "2024-01-01T12:00:00"
@@ -1,7 +1,13 @@
 """Unit tests for AQI Calculator domain service."""
+import numpy as np
 import pytest
 
 from src.domain.services.aqi_calculator import AQICalculator, AQIResult
+from src.domain.value_objects.aqi_category import (
+    get_all_categories,
+    get_category_for_aqi,
+    get_levels_and_colors,
+)
 from src.domain.value_objects.aqi_level import AQILevel
 
 
@@ -15,6 +21,15 @@ class TestAQICalculatorSinglePollutant:
         
         assert 0 <= aqi <= 50
 
+    def test_breakpoint_edges_and_gaps(self):
+        """Test range endpoints interpolate and gaps between ranges cap at 500."""
+        calc = AQICalculator()
+
+        assert calc.calculate_aqi("pm25", 12.0) == 50
+        assert calc.calculate_aqi("pm25", 12.1) == 51
+        assert calc.calculate_aqi("pm25", 12.05) == 500
+        assert calc.calculate_aqi("pm25", 600.0) == 500
+
     def test_calculate_pm25_moderate(self):
         """Test PM2.5 AQI in Moderate range."""
         calc = AQICalculator()
@@ -146,6 +161,20 @@ class TestAQICalculatorComposite:
         assert result.caution_message
 
 
+    def test_composite_fields_match_category_lookups(self):
+        """Test shared composite results carry the per-AQI category details."""
+        calc = AQICalculator()
+
+        for pm25 in (5.0, 20.0, 40.0, 100.0, 200.0, 400.0, 600.0):
+            result = calc.calculate_composite_aqi({"pm25": pm25})
+
+            assert result.category == calc.get_aqi_category(result.aqi_value)
+            assert result.color == calc.get_aqi_color(result.aqi_value)
+            assert result.health_message == calc.get_health_message(result.aqi_value)
+            assert result.caution_message == calc.get_caution_message(result.aqi_value)
+            assert calc.calculate_composite_aqi({"pm25": pm25}) is result
+
+
 class TestAQICalculatorCategory:
     """Tests for AQI category methods."""
 
@@ -177,6 +206,17 @@ class TestAQICalculatorCategory:
         
         assert "HAZARDOUS" in category
 
+    def test_category_boundaries_and_out_of_range(self):
+        """Test table lookups at range edges and outside 0-500."""
+        calc = AQICalculator()
+
+        assert calc.get_aqi_category(50) == "GOOD"
+        assert calc.get_aqi_category(51) == "MODERATE"
+        assert calc.get_aqi_category(300) == "VERY UNHEALTHY"
+        assert calc.get_aqi_category(301) == "HAZARDOUS"
+        assert calc.get_aqi_category(650) == "HAZARDOUS"
+        assert calc.get_aqi_category(-1) == "HAZARDOUS"
+
     def test_get_aqi_color(self):
         """Test color code retrieval."""
         calc = AQICalculator()
@@ -186,6 +226,18 @@ class TestAQICalculatorCategory:
         # Red for Unhealthy
         assert calc.get_aqi_color(175).startswith("#")
 
+    def test_non_integer_aqi_uses_band_scan(self):
+        """Test float and NumPy AQI values are categorized like the band scan."""
+        calc = AQICalculator()
+
+        assert calc.get_aqi_color(75.5) == calc.get_aqi_color(75)
+        assert calc.get_aqi_category(float(120)) == calc.get_aqi_category(120)
+        assert calc.get_aqi_category(np.float64(42.0)) == "GOOD"
+        assert calc.get_aqi_category(np.int64(175)) == calc.get_aqi_category(175)
+        # Between bands and above the table, the scan falls back to Hazardous
+        assert calc.get_aqi_category(50.5) == "HAZARDOUS"
+        assert calc.get_aqi_category(650.0) == "HAZARDOUS"
+
     def test_get_health_message(self):
         """Test health message retrieval."""
         calc = AQICalculator()
@@ -200,3 +252,101 @@ class TestAQICalculatorCategory:
         
         message = calc.get_caution_message(150)
         assert isinstance(message, str)
+
+
+class TestAQICalculatorBatch:
+    """Tests for calculate_composite_aqi_batch()."""
+
+    POLLUTANTS = ("pm25", "pm10", "co", "no2", "so2", "o3")
+
+    def test_matches_scalar(self):
+        """Test batch results equal the per-location composite AQI."""
+        calc = AQICalculator()
+        rng = np.random.default_rng(42)
+        conc = rng.uniform(0, 700, (500, len(self.POLLUTANTS)))
+        conc[:, 2] /= 10  # CO is in ppm
+        conc[rng.random(conc.shape) < 0.3] = np.nan
+
+        batch = calc.calculate_composite_aqi_batch(conc, self.POLLUTANTS)
+
+        for row, aqi in zip(conc, batch):
+            pollutants = {
+                p: float(c) for p, c in zip(self.POLLUTANTS, row) if not np.isnan(c)
+            }
+            assert aqi == calc.calculate_composite_aqi(pollutants).aqi_value
+
+    def test_breakpoint_edges(self):
+        """Test breakpoint boundaries and gap values follow calculate_aqi."""
+        calc = AQICalculator()
+        values = [0.0, 12.0, 12.05, 12.1, 35.4, 500.4, 600.0]
+
+        batch = calc.calculate_composite_aqi_batch(np.array(values)[:, None], ["pm25"])
+
+        assert batch.tolist() == [calc.calculate_aqi("pm25", v) for v in values]
+
+    def test_missing_rows_are_zero(self):
+        """Test rows without valid data get AQI 0."""
+        calc = AQICalculator()
+        conc = np.array([[np.nan, np.nan], [-1.0, np.nan]])
+
+        assert calc.calculate_composite_aqi_batch(conc, ["pm25", "pm10"]).tolist() == [0, 0]
+
+    def test_numba_kernel_matches_numpy(self, monkeypatch):
+        """Test the compiled kernel and the NumPy path agree."""
+        from src.domain.services import aqi_calculator
+
+        if aqi_calculator.njit is None:
+            pytest.skip("numba not installed")
+
+        calc = AQICalculator()
+        rng = np.random.default_rng(7)
+        conc = rng.uniform(0, 700, (300, len(self.POLLUTANTS)))
+        conc[rng.random(conc.shape) < 0.3] = np.nan
+        conc[0] = np.nan
+        conc[1, 0] = 12.05
+
+        monkeypatch.setattr(aqi_calculator, "NUMBA_MIN_ROWS", 10**9)
+        expected = calc.calculate_composite_aqi_batch(conc, self.POLLUTANTS)
+        monkeypatch.setattr(aqi_calculator, "NUMBA_MIN_ROWS", 0)
+        compiled = calc.calculate_composite_aqi_batch(conc, self.POLLUTANTS)
+
+        assert compiled.tolist() == expected.tolist()
+
+    def test_warm_up_reports_kernel_availability(self):
+        """Test warm-up compiles the kernel only when numba is installed."""
+        from src.domain.services import aqi_calculator
+
+        assert aqi_calculator.warm_up_batch_kernel() is (aqi_calculator.njit is not None)
+
+    def test_unknown_pollutant(self):
+        """Test unknown pollutant columns are rejected."""
+        calc = AQICalculator()
+
+        with pytest.raises(ValueError):
+            calc.calculate_composite_aqi_batch(np.zeros((1, 1)), ["xyz"])
+
+
+class TestCategoryLookup:
+    """Tests for the table-based get_category_for_aqi()."""
+
+    def test_table_matches_band_scan(self):
+        """Test every integer AQI maps to the band that contains it."""
+        for aqi in range(0, 501):
+            category = get_category_for_aqi(aqi)
+            assert category.contains(aqi)
+            assert category in get_all_categories()
+
+    def test_out_of_range_values(self):
+        """Test values above 500 and float AQIs are still categorized."""
+        assert get_category_for_aqi(900).level == AQILevel.HAZARDOUS
+        assert get_category_for_aqi(42.0).level == AQILevel.GOOD
+
+    def test_vectorized_lookup_matches_scalar(self):
+        """Test batch levels/colors match per-value lookups."""
+        values = np.arange(-5, 600)
+
+        levels, colors = get_levels_and_colors(values)
+
+        categories = [get_category_for_aqi(int(v)) for v in values]
+        assert levels == [c.level.value for c in categories]
+        assert colors == [c.color_hex for c in categories]
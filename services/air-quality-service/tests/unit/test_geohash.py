@@ -0,0 +1,40 @@
+"""Unit tests for geohash map cell helpers."""
+import pytest
+
+from src.domain.services import geohash
+
+
+class TestGeohash:
+    """Tests for geohash encoding, decoding and coverage."""
+
+    def test_encode_known_value(self):
+        """Test encoding matches the reference geohash."""
+        assert geohash.encode(57.64911, 10.40744, 11) == "u4pruydqqvj"
+
+    def test_decode_round_trip(self):
+        """Test decoding returns the center of the encoded cell."""
+        lat, lng = geohash.decode("u4pruydqqvj")
+
+        assert lat == pytest.approx(57.64911, abs=1e-5)
+        assert lng == pytest.approx(10.40744, abs=1e-5)
+        assert geohash.encode(lat, lng, 11) == "u4pruydqqvj"
+
+    def test_decode_invalid(self):
+        """Test characters outside the alphabet are rejected."""
+        with pytest.raises(ValueError):
+            geohash.decode("u4a")
+
+    def test_covering_bbox(self):
+        """Test every point in the bbox falls in a covering cell."""
+        cells = geohash.covering(21.0, 105.8, 21.1, 105.9, 5)
+
+        assert len(cells) == len(set(cells))
+        for lat in (21.0, 21.05, 21.1):
+            for lng in (105.8, 105.85, 105.9):
+                assert geohash.encode(lat, lng, 5) in cells
+
+    def test_precision_for_zoom(self):
+        """Test precision grows with zoom and stays in range."""
+        assert geohash.precision_for_zoom(10) == 5
+        assert geohash.precision_for_zoom(0) == geohash.MIN_PRECISION
+        assert geohash.precision_for_zoom(40) == geohash.MAX_PRECISION
@@ -0,0 +1,378 @@
+"""Unit tests for map grid generation in the application service."""
+import asyncio
+from datetime import datetime
+from typing import List
+
+import pytest
+
+from src.application.queries.get_map_data_query import GetMapDataQuery
+from src.application.services.air_quality_application_service import (
+    AirQualityApplicationService,
+)
+from src.config import settings
+from src.domain.services import geohash
+from src.domain.services.aqi_calculator import AQICalculator
+from src.domain.services.prediction_service import PredictionService
+from src.domain.value_objects.aqi_category import get_category_for_aqi
+from src.domain.value_objects.bounding_box import BoundingBox
+from src.infrastructure.external.sensor_service_client import SensorReading
+
+
+def make_reading(lat: float, lng: float, pm25: float = 0.0, pm10: float = 0.0) -> SensorReading:
+    return SensorReading(
+        sensor_id=f"s-{lat}-{lng}",
+        factory_id="f-1",
+        latitude=lat,
+        longitude=lng,
+        pm25=pm25,
+        pm10=pm10,
+        co=0.0,
+        no2=0.0,
+        so2=0.0,
+        o3=0.0,
+        aqi=0,
+        timestamp=datetime(2024, 1, 1, 12, 0, 0),
+    )
+
+
+class NoBboxSensorClient:
+    """Sensor client whose service lacks the bbox endpoint."""
+
+    def __init__(self, readings: List[SensorReading]):
+        self.readings = readings
+        self.nearby_calls = 0
+
+    async def get_readings_in_bbox(self, min_lat, min_lng, max_lat, max_lng, limit=5000):
+        return None
+
+    async def get_recent_readings(self, latitude, longitude, radius_km=10.0, limit=50):
+        self.nearby_calls += 1
+        return [
+            r for r in self.readings
+            if abs(r.latitude - latitude) < 0.01 and abs(r.longitude - longitude) < 0.01
+        ]
+
+
+class SlowNoBboxSensorClient(NoBboxSensorClient):
+    """Per-cell-only sensor client that records peak concurrency."""
+
+    def __init__(self, readings: List[SensorReading]):
+        super().__init__(readings)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_recent_readings(self, latitude, longitude, radius_km=10.0, limit=50):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        return await super().get_recent_readings(latitude, longitude, radius_km, limit)
+
+
+class FakeSensorClient:
+    """Sensor client returning a fixed set of readings for any bbox."""
+
+    def __init__(self, readings: List[SensorReading]):
+        self.readings = readings
+        self.bbox_calls = []
+
+    async def get_readings_in_bbox(self, min_lat, min_lng, max_lat, max_lng, limit=5000):
+        self.bbox_calls.append((min_lat, min_lng, max_lat, max_lng))
+        return self.readings
+
+    async def get_recent_readings(self, latitude, longitude, radius_km=10.0, limit=50):
+        return self.readings
+
+
+def make_service(sensor_client=None) -> AirQualityApplicationService:
+    return AirQualityApplicationService(
+        aqi_calculator=AQICalculator(),
+        prediction_service=PredictionService(),
+        cache=None,
+        google_client=None,
+        sensor_client=sensor_client,
+    )
+
+
+@pytest.fixture
+def query():
+    return GetMapDataQuery(
+        min_lat=21.0, min_lng=105.8, max_lat=21.1, max_lng=105.9, zoom_level=10
+    )
+
+
+class TestGenerateGridCells:
+    """Tests for _generate_grid_cells()."""
+
+    async def test_single_bulk_query(self, query):
+        """Test the whole viewport is fetched with one sensor request."""
+        client = FakeSensorClient([make_reading(21.05, 105.85, pm25=10.0)])
+        await make_service(client)._generate_grid_cells(query)
+
+        assert len(client.bbox_calls) == 1
+
+    async def test_readings_averaged_within_radius(self, query):
+        """Test readings within the search radius of a cell are averaged."""
+        precision = geohash.precision_for_zoom(query.zoom_level)
+        home = geohash.encode(21.03, 105.85, precision)
+        lat, lng = geohash.decode(home)
+        client = FakeSensorClient([
+            make_reading(lat + 0.002, lng, pm25=10.0),
+            make_reading(lat, lng - 0.002, pm25=30.0, pm10=40.0),
+        ])
+        calc = AQICalculator()
+        cells = await make_service(client)._generate_grid_cells(query)
+
+        by_hash = {c.geohash: c for c in cells}
+        expected = calc.calculate_composite_aqi({"pm25": 20.0, "pm10": 40.0})
+        assert set(by_hash) == {home}
+        assert by_hash[home].sensor_count == 2
+        assert by_hash[home].aqi_value == expected.aqi_value
+        assert (by_hash[home].lat, by_hash[home].lng) == (lat, lng)
+
+    async def test_reading_in_cell_corner_counts(self, query):
+        """Test a reading anywhere inside a cell reaches that cell."""
+        precision = geohash.precision_for_zoom(query.zoom_level)
+        home = geohash.encode(21.03, 105.85, precision)
+        lat, lng = geohash.decode(home)
+        lat_span, lng_span = geohash.cell_size(precision)
+        corner = make_reading(lat + 0.45 * lat_span, lng + 0.45 * lng_span, pm25=10.0)
+
+        cells = await make_service(FakeSensorClient([corner]))._generate_grid_cells(query)
+
+        assert home in {c.geohash for c in cells}
+
+    async def test_levels_and_colors_match_aqi(self, query):
+        """Test batch-assigned categories match each cell's own AQI."""
+        precision = geohash.precision_for_zoom(query.zoom_level)
+        home = geohash.decode(geohash.encode(21.03, 105.85, precision))
+        client = FakeSensorClient([make_reading(*home, pm25=80.0)])
+        cells = await make_service(client)._generate_grid_cells(query)
+
+        assert cells
+        for cell in cells:
+            category = get_category_for_aqi(cell.aqi_value)
+            assert (cell.level, cell.color) == (category.level.value, category.color_hex)
+
+    async def test_only_requested_geohashes(self, query):
+        """Test cells are generated only for the requested geohashes."""
+        precision = geohash.precision_for_zoom(query.zoom_level)
+        wanted = geohash.encode(21.03, 105.85, precision)
+        readings = [
+            make_reading(*geohash.decode(gh), pm25=10.0)
+            for gh in geohash.covering(21.0, 105.8, 21.1, 105.9, precision)
+        ]
+        cells = await make_service(FakeSensorClient(readings))._generate_grid_cells(
+            query, [wanted]
+        )
+
+        assert [c.geohash for c in cells] == [wanted]
+
+    async def test_readings_outside_grid_ignored(self, query):
+        """Test readings beyond the search radius produce no cells."""
+        client = FakeSensorClient([make_reading(22.0, 106.0, pm25=10.0)])
+        cells = await make_service(client)._generate_grid_cells(query)
+
+        assert cells == []
+
+    async def test_per_cell_fallback(self, query):
+        """Test per-cell radius queries are used without bbox support."""
+        precision = geohash.precision_for_zoom(query.zoom_level)
+        covering = geohash.covering(21.0, 105.8, 21.1, 105.9, precision)
+        home = geohash.encode(21.03, 105.85, precision)
+        client = NoBboxSensorClient([make_reading(*geohash.decode(home), pm25=10.0)])
+
+        cells = await make_service(client)._generate_grid_cells(query)
+
+        assert client.nearby_calls == len(covering)
+        assert [(c.geohash, c.sensor_count) for c in cells] == [(home, 1)]
+        assert cells[0].aqi_value == AQICalculator().calculate_aqi("pm25", 10.0)
+
+    async def test_fallback_concurrency_shared_across_requests(self, query, monkeypatch):
+        """Test concurrent map requests share one per-cell query budget."""
+        monkeypatch.setattr(settings, "MAP_FALLBACK_CONCURRENCY", 3)
+        client = SlowNoBboxSensorClient([])
+        service = make_service(client)
+
+        await asyncio.gather(
+            service._generate_grid_cells(query), service._generate_grid_cells(query)
+        )
+
+        assert client.max_in_flight == 3
+
+    async def test_sample_data_without_sensor_client(self, query):
+        """Test every grid cell is filled with sample data in development."""
+        precision = geohash.precision_for_zoom(query.zoom_level)
+        cells = await make_service()._generate_grid_cells(query)
+
+        assert [c.geohash for c in cells] == geohash.covering(
+            21.0, 105.8, 21.1, 105.9, precision
+        )
+        assert len({c.aqi_value for c in cells}) == 1
+
+    async def test_cells_share_timestamp(self, query):
+        """Test every cell carries the same whole-second UTC timestamp."""
+        cells = await make_service()._generate_grid_cells(query)
+
+        stamps = {c.last_updated for c in cells}
+        assert len(stamps) == 1
+        assert datetime.fromisoformat(stamps.pop()).microsecond == 0
+
+
+class FakeMapCache:
+    """In-memory stand-in for the per-cell map cache."""
+
+    def __init__(self, cells=None):
+        self.cells = dict(cells or {})
+        self.stored = {}
+
+    async def get_map_cells(self, geohashes):
+        return [self.cells.get(gh) for gh in geohashes]
+
+    async def map_cells_missing(self, geohashes):
+        return [gh for gh in geohashes if gh not in self.cells]
+
+    async def set_map_cells(self, cells, ttl=None):
+        self.stored.update(cells)
+        self.cells.update(cells)
+        return True
+
+
+class TestGetMapData:
+    """Tests for get_map_data() per-cell caching."""
+
+    async def test_packed_cell_round_trip(self, query):
+        """Test cells survive packing into fixed-size cache records."""
+        service = make_service(FakeSensorClient([make_reading(21.03, 105.85, pm25=10.0)]))
+        cells = await service._generate_grid_cells(query)
+
+        packed = [(c.geohash, service._pack_cell(c)) for c in cells]
+        unpacked = service._unpack_cells(packed)
+
+        assert {len(blob) for _, blob in packed} == {14}
+        assert [unpacked[c.geohash] for c in cells] == cells
+
+    async def test_caches_every_cell(self, query):
+        """Test generated and empty cells are all written to the cache."""
+        service = make_service(FakeSensorClient([make_reading(21.03, 105.85, pm25=10.0)]))
+        service.cache = FakeMapCache()
+        result = await service.get_map_data(query)
+
+        precision = geohash.precision_for_zoom(query.zoom_level)
+        covering = geohash.covering(21.0, 105.8, 21.1, 105.9, precision)
+        assert set(service.cache.stored) == set(covering)
+        assert [c.geohash for c in result.grid_cells] == [
+            gh for gh in covering if service.cache.stored[gh]
+        ]
+
+    async def test_only_missing_cells_generated(self, query):
+        """Test cached cells are reused and only misses are generated."""
+        first = make_service(FakeSensorClient([make_reading(21.03, 105.85, pm25=10.0)]))
+        first.cache = FakeMapCache()
+        await first.get_map_data(query)
+
+        cached = dict(first.cache.cells)
+        dropped = next(gh for gh, cell in cached.items() if not cell)
+        del cached[dropped]
+
+        second = make_service(FakeSensorClient([]))
+        second.cache = FakeMapCache(cached)
+        result = await second.get_map_data(query)
+
+        assert set(second.cache.stored) == {dropped}
+        assert len(result.grid_cells) == len([c for c in cached.values() if c])
+
+
+class TestGetPollutantsForLocation:
+    """Tests for _get_pollutants_for_location() aggregation."""
+
+    async def test_averages_positive_values(self):
+        """Test each pollutant is averaged over readings that reported it."""
+        client = FakeSensorClient([
+            make_reading(21.0, 105.8, pm25=10.0, pm10=0.0),
+            make_reading(21.0, 105.8, pm25=30.0, pm10=60.0),
+        ])
+
+        pollutants = await make_service(client)._get_pollutants_for_location(21.0, 105.8, 5.0)
+
+        assert pollutants == {"pm25": 20.0, "pm10": 60.0}
+        assert all(type(v) is float for v in pollutants.values())
+
+    async def test_no_readings(self):
+        """Test no readings yields no pollutants."""
+        pollutants = await make_service(FakeSensorClient([]))._get_pollutants_for_location(
+            21.0, 105.8, 5.0
+        )
+
+        assert pollutants == {}
+
+
+    async def test_full_hit_prefetches_neighbors(self, query):
+        """Test a fully cached viewport warms the surrounding cells."""
+        client = FakeSensorClient([make_reading(21.03, 105.85, pm25=10.0)])
+        first = make_service(client)
+        first.cache = FakeMapCache()
+        await first.get_map_data(query)
+        viewport = set(first.cache.cells)
+
+        second = make_service(client)
+        second.cache = FakeMapCache(first.cache.cells)
+        await second.get_map_data(query)
+        await asyncio.gather(*AirQualityApplicationService._prefetch_tasks)
+
+        precision = geohash.precision_for_zoom(query.zoom_level)
+        ring = set(geohash.covering(20.9, 105.7, 21.2, 106.0, precision)) - viewport
+        assert set(second.cache.stored) == ring
+
+
+class TestFusedData:
+    """Tests for get_fused_data() bounding-box filtering."""
+
+    async def test_points_outside_bbox_dropped(self):
+        """Test only fused points inside the bbox (edges included) are kept."""
+        client = FakeSensorClient([
+            make_reading(21.05, 105.85, pm25=10.0),
+            make_reading(21.1, 105.8, pm25=20.0),
+            make_reading(21.2, 105.85, pm25=30.0),
+            make_reading(21.05, 105.7, pm25=40.0),
+        ])
+        bbox = BoundingBox(north=21.1, south=21.0, east=105.9, west=105.8)
+
+        points = await make_service(client).get_fused_data(bbox)
+
+        assert [(p["latitude"], p["longitude"]) for p in points] == [
+            (21.05, 105.85),
+            (21.1, 105.8),
+        ]
+        assert len({p["timestamp"] for p in points}) == 1
+
+    async def test_no_points(self):
+        """Test an empty fusion result yields no points."""
+        bbox = BoundingBox(north=21.1, south=21.0, east=105.9, west=105.8)
+
+        assert await make_service(FakeSensorClient([])).get_fused_data(bbox) == []
+
+    async def test_map_data_reports_bbox_as_mapping(self):
+        """Test the fused map payload echoes the bbox as named edges."""
+        bbox = BoundingBox(north=21.1, south=21.0, east=105.9, west=105.8)
+        client = FakeSensorClient([make_reading(21.05, 105.85, pm25=10.0)])
+
+        data = await make_service(client).get_fused_map_data(bbox)
+
+        assert data["bbox"] == {"north": 21.1, "south": 21.0, "east": 105.9, "west": 105.8}
+        assert data["total"] == 1
+
+    async def test_map_cells_match_fused_points(self):
+        """Test map cells carry the same values as the fused data points."""
+        bbox = BoundingBox(north=21.1, south=21.0, east=105.9, west=105.8)
+        client = FakeSensorClient([make_reading(21.05, 105.85, pm25=10.0)])
+        service = make_service(client)
+
+        (point,) = await service.get_fused_data(bbox)
+        (cell,) = (await service.get_fused_map_data(bbox))["grid_cells"]
+
+        assert (cell["lat"], cell["lng"]) == (point["latitude"], point["longitude"])
+        assert cell["aqi_value"] == point["fused_aqi"]
+        assert cell["fused_pm25"] == point["fused_pm25"]
+        assert cell["data_sources"] == point["data_sources"]
+        assert cell["level"] == get_category_for_aqi(point["fused_aqi"]).level.value
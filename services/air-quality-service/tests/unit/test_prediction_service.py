@@ -146,6 +146,51 @@ class TestPredictionServicePredict:
         trends = [dp.trend for dp in forecast.data_points]
         assert any(t in ["IMPROVING", "STABLE", "WORSENING"] for t in trends)
 
+    def test_forecast_steps_follow_scalar_rules(self):
+        """Test each vectorized step matches the per-step forecast formulas."""
+        service = PredictionService()
+        now = datetime.utcnow()
+        sensor_data = [
+            SensorDataPoint(timestamp=now - timedelta(hours=6 - i), pollutants={}, aqi=aqi)
+            for i, aqi in enumerate([80, 90, 100, 115, 130, 150])
+        ]
+        trend_factor = service._calculate_trend(sensor_data)
+        variability = service._calculate_variability(sensor_data)
+
+        forecast = service.predict_next_hours(sensor_data, hours=48, interval_hours=2)
+
+        assert len(forecast.data_points) == 24
+        for i, point in enumerate(forecast.data_points, start=1):
+            adjusted = trend_factor * max(0.3, 1.0 - (i / 24) * 0.7)
+            predicted = max(0, min(500, round(150 * (1 + adjusted))))
+            margin = round(variability * (1 + i * 0.1))
+            assert point.predicted_aqi == predicted and type(point.predicted_aqi) is int
+            assert point.confidence == round(max(0.3, 1.0 - i * 0.05), 2)
+            assert (point.min_aqi, point.max_aqi) == (max(0, predicted - margin), min(500, predicted + margin))
+            assert point.trend == ("WORSENING" if adjusted > 0.05 else "STABLE")
+            assert point.timestamp - forecast.generated_at == timedelta(hours=2 * i)
+
+    def test_variability_matches_statistics_stdev(self):
+        """Test variability equals the sample stdev of the last 12 AQI values."""
+        import statistics
+
+        service = PredictionService()
+        now = datetime.utcnow()
+        aqis = [50, 52, 48, 51, 70, 65, 60, 58, 62, 61, 59, 57, 90, 40]
+        sensor_data = [
+            SensorDataPoint(
+                timestamp=now - timedelta(hours=len(aqis) - i),
+                pollutants={},
+                aqi=aqi,
+            )
+            for i, aqi in enumerate(aqis)
+        ]
+
+        assert service._calculate_variability(sensor_data) == pytest.approx(
+            statistics.stdev(aqis[-12:]), rel=1e-12
+        )
+        assert service._calculate_variability(sensor_data[:1]) == 10.0
+
 
 class TestPredictionServiceForecastProperties:
     """Tests for AQIForecast properties."""
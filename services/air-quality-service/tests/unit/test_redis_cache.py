@@ -0,0 +1,456 @@
+"""Unit tests for batched Redis cache operations."""
+import json
+from datetime import datetime
+
+from types import SimpleNamespace
+
+import numpy as np
+import orjson
+import pytest
+
+from src.application.queries.get_current_aqi_query import GetCurrentAQIQuery
+from src.application.queries.get_forecast_query import (
+    ForecastDataPoint,
+    GetForecastQuery,
+    GetForecastResult,
+)
+from src.application.services.air_quality_application_service import (
+    AirQualityApplicationService,
+)
+from src.domain.services.aqi_calculator import AQICalculator
+from src.domain.services.data_fusion import (
+    FUSION_CACHE_RADIUS_KM,
+    FusedDataPoint,
+    fused_aqi_entries,
+)
+from src.domain.services.prediction_service import PredictionService
+from src.domain.value_objects.location import Location
+from src.infrastructure.cache.redis_cache import RedisCache
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def setex(self, key, ttl, value):
+        self.commands.append(("setex", key, (ttl, value)))
+
+    def exists(self, key):
+        self.commands.append(("exists", key, None))
+
+    def get(self, key):
+        self.commands.append(("get", key, None))
+
+    def pttl(self, key):
+        self.commands.append(("pttl", key, None))
+
+    async def execute(self):
+        self.client.round_trips += 1
+        results = []
+        for op, key, value in self.commands:
+            if op == "setex":
+                self.client.ttls[key], self.client.store[key] = value
+                results.append(True)
+            elif op == "get":
+                results.append(self.client.store.get(key))
+            elif op == "pttl":
+                if key not in self.client.store:
+                    results.append(-2)
+                else:
+                    ttl = self.client.ttls.get(key)
+                    results.append(-1 if ttl is None else ttl * 1000)
+            else:
+                results.append(int(key in self.client.store))
+        return results
+
+
+class FakeRedis:
+    """Minimal async Redis double that counts round-trips."""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}  # seconds left per key; keys without one never expire
+        self.round_trips = 0
+
+    async def get(self, key):
+        self.round_trips += 1
+        return self.store.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.round_trips += 1
+        self.store[key] = value
+        self.ttls[key] = ttl
+
+    async def mget(self, keys):
+        self.round_trips += 1
+        return [self.store.get(k) for k in keys]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+def make_cache() -> RedisCache:
+    cache = RedisCache("redis://unused")
+    cache._client = FakeRedis()
+    # Both clients talk to the same Redis server
+    cache._raw_client = FakeRedis()
+    cache._raw_client.store = cache._client.store
+    cache._raw_client.ttls = cache._client.ttls
+    return cache
+
+
+class TestAQIBatch:
+    """Tests for get_aqi_many() / set_aqi_many()."""
+
+    async def test_round_trip(self):
+        """Test a batch write is readable with one batch read."""
+        cache = make_cache()
+        await cache.set_aqi_many(
+            [(21.0, 105.8, {"fused_pm25": 12.0}), (21.1, 105.9, {"fused_pm25": 20.0})],
+            10.0,
+        )
+
+        values = await cache.get_aqi_many([(21.0, 105.8), (22.0, 106.0), (21.1, 105.9)], 10.0)
+
+        assert values == [{"fused_pm25": 12.0}, None, {"fused_pm25": 20.0}]
+        assert (cache._client.round_trips, cache._raw_client.round_trips) == (1, 1)
+
+    async def test_keys_match_single_lookup(self):
+        """Test batch keys match the keys used by set_aqi()."""
+        cache = make_cache()
+        key = cache._make_aqi_key(21.0285, 105.8542, 10.0)
+        cache._raw_client.store[key] = json.dumps({"aqi_value": 80}).encode()
+
+        assert await cache.get_aqi_many([(21.0285, 105.8542)], 10.0) == [{"aqi_value": 80}]
+
+    async def test_without_connection(self):
+        """Test batch reads degrade to misses without Redis."""
+        cache = RedisCache("redis://unused")
+
+        assert await cache.get_aqi_many([(21.0, 105.8)], 10.0) == [None]
+        assert await cache.set_aqi_many([(21.0, 105.8, {})], 10.0) is False
+
+
+class TestLocalAQICache:
+    """Tests for the in-process copy of current-AQI entries."""
+
+    async def test_written_entry_served_without_redis(self):
+        """Test reads after a write skip Redis until the local copy expires."""
+        cache = make_cache()
+        await cache.set_aqi(21.0, 105.8, 10.0, {"aqi_value": 80})
+
+        assert await cache.get_aqi(21.0, 105.8, 10.0) == {"aqi_value": 80}
+        assert await cache.get_aqi_raw(21.0, 105.8, 10.0) == b'{"aqi_value":80}'
+        assert cache._raw_client.round_trips == 0
+
+        key = cache._make_aqi_key(21.0, 105.8, 10.0)
+        cache._local_aqi._entries[key] = (0.0, b'{"aqi_value":80}')
+        cache._raw_client.store[key] = b'{"aqi_value":90}'
+
+        assert await cache.get_aqi(21.0, 105.8, 10.0) == {"aqi_value": 90}
+        assert cache._raw_client.round_trips == 1
+
+    async def test_redis_hit_kept_locally(self):
+        """Test a Redis hit is copied locally for the next read."""
+        cache = make_cache()
+        cache._raw_client.store[cache._make_aqi_key(21.0, 105.8, 10.0)] = b'{"aqi_value":80}'
+
+        assert await cache.get_aqi_raw(21.0, 105.8, 10.0) == b'{"aqi_value":80}'
+        assert await cache.get_aqi_raw(21.0, 105.8, 10.0) == b'{"aqi_value":80}'
+        assert cache._raw_client.round_trips == 1
+
+    async def test_repeated_reads_do_not_extend_local_copy(self, monkeypatch):
+        """Test a location polled faster than the local TTL still rereads Redis."""
+        from src.infrastructure.cache import redis_cache
+
+        clock = [1000.0]
+        monkeypatch.setattr(redis_cache.time, "monotonic", lambda: clock[0])
+        cache = make_cache()
+        key = cache._make_aqi_key(21.0, 105.8, 10.0)
+        cache._raw_client.store[key] = b'{"aqi_value":1}'
+        local_ttl = cache._local_aqi.ttl
+
+        assert await cache.get_aqi(21.0, 105.8, 10.0) == {"aqi_value": 1}
+        cache._raw_client.store[key] = b'{"aqi_value":2}'  # written by another worker
+        while clock[0] + 20.0 < 1000.0 + local_ttl:
+            clock[0] += 20.0
+            assert await cache.get_aqi(21.0, 105.8, 10.0) == {"aqi_value": 1}
+        clock[0] += 20.0
+
+        assert await cache.get_aqi(21.0, 105.8, 10.0) == {"aqi_value": 2}
+        assert cache._raw_client.round_trips == 2
+
+    async def test_local_copy_capped_at_redis_ttl(self, monkeypatch):
+        """Test a Redis hit is not kept locally past the key's remaining TTL."""
+        from src.infrastructure.cache import redis_cache
+
+        clock = [1000.0]
+        monkeypatch.setattr(redis_cache.time, "monotonic", lambda: clock[0])
+        cache = make_cache()
+        key = cache._make_aqi_key(21.0, 105.8, 10.0)
+        cache._raw_client.store[key] = b'{"aqi_value":1}'
+        cache._raw_client.ttls[key] = 5
+
+        assert await cache.get_aqi_raw(21.0, 105.8, 10.0) == b'{"aqi_value":1}'
+        clock[0] += 6.0
+        del cache._raw_client.store[key]  # expired in Redis
+
+        assert await cache.get_aqi_raw(21.0, 105.8, 10.0) is None
+
+    def test_least_recently_used_evicted(self):
+        """Test the local copy stays within its size bound, oldest out first."""
+        from src.infrastructure.cache.redis_cache import _LocalCache
+
+        local = _LocalCache(maxsize=2, ttl=60.0)
+        local.put("a", b"1", 60)
+        local.put("b", b"2", 60)
+        local.get("a")
+        local.put("c", b"3", 60)
+
+        assert (local.get("a"), local.get("b"), local.get("c")) == (b"1", None, b"3")
+
+
+class TestMapCellBatch:
+    """Tests for get_map_cells() / set_map_cells()."""
+
+    async def test_empty_cells_distinct_from_misses(self):
+        """Test cells cached as empty come back as b"" rather than None."""
+        cache = make_cache()
+        await cache.set_map_cells({"w7er8": b"\x32\x00", "w7er9": b""})
+
+        values = await cache.get_map_cells(["w7er8", "w7er9", "w7erb"])
+
+        assert values == [b"\x32\x00", b"", None]
+
+    async def test_missing_cells(self):
+        """Test existence checks report only uncached cells."""
+        cache = make_cache()
+        await cache.set_map_cells({"w7er8": b"\x32\x00", "w7er9": b""})
+
+        assert await cache.map_cells_missing(["w7er8", "w7erb", "w7er9"]) == ["w7erb"]
+
+    async def test_numpy_values_and_int_keys(self):
+        """Test writes accept what json.dumps did: numpy scalars, int keys."""
+        cache = make_cache()
+        await cache.set_aqi(21.0, 105.8, 10.0, {"aqi_value": np.int64(80), 1: np.float64(2.5)})
+
+        assert await cache.get_aqi(21.0, 105.8, 10.0) == {"aqi_value": 80, "1": 2.5}
+
+
+class TestCurrentAQIRaw:
+    """Tests for serving cached current AQI payloads without decoding."""
+
+    def make_service(self):
+        return AirQualityApplicationService(
+            aqi_calculator=AQICalculator(),
+            prediction_service=PredictionService(),
+            cache=make_cache(),
+            google_client=None,
+        )
+
+    async def test_miss_then_hit(self):
+        """Test a computed result is cached and served back byte for byte."""
+        service = self.make_service()
+        query = GetCurrentAQIQuery(latitude=21.0285, longitude=105.8542)
+
+        first = await service.get_current_aqi_raw(query)
+        second = await service.get_current_aqi_raw(query)
+
+        assert second == first
+        assert orjson.loads(first)["aqi_value"] > 0
+
+    async def test_matches_decoded_result(self):
+        """Test the raw payload decodes to the same result as get_current_aqi()."""
+        service = self.make_service()
+        query = GetCurrentAQIQuery(latitude=21.0285, longitude=105.8542)
+
+        payload = await service.get_current_aqi_raw(query)
+        result = await service.get_current_aqi(query)
+
+        assert orjson.loads(payload) == orjson.loads(orjson.dumps(result))
+
+    async def test_partial_entry_is_a_miss(self):
+        """Test cached entries without a category are recomputed, not served."""
+        service = self.make_service()
+        await service.cache.set_aqi(21.0285, 105.8542, 10.0, {"aqi_value": 999, "confidence": 0.5})
+        query = GetCurrentAQIQuery(latitude=21.0285, longitude=105.8542)
+
+        payload = orjson.loads(await service.get_current_aqi_raw(query))
+        result = await service.get_current_aqi(query)
+
+        assert payload["aqi_value"] != 999 and "level" in payload
+        assert result.aqi_value == payload["aqi_value"]
+
+    async def test_fused_entry_is_a_full_result(self):
+        """Test entries written by fusion decode as current AQI results."""
+        service = self.make_service()
+        point = FusedDataPoint(
+            location=Location(latitude=21.0285, longitude=105.8542),
+            timestamp=datetime(2024, 1, 1, 12, 0),
+            fused_pm25=40.0,
+            fused_aqi=112,
+            confidence=0.8,
+            data_sources=["sensor", "satellite"],
+        )
+        await service.cache.set_aqi_many(
+            fused_aqi_entries([point], point.timestamp.isoformat()), FUSION_CACHE_RADIUS_KM
+        )
+        query = GetCurrentAQIQuery(latitude=21.0285, longitude=105.8542)
+
+        result = await service.get_current_aqi(query)
+        payload = orjson.loads(await service.get_current_aqi_raw(query))
+
+        assert (result.aqi_value, result.level) == (112, "UNHEALTHY_SENSITIVE")
+        assert result.data_source == "fusion"
+        assert payload["pollutants"] == {"concentrations": {"pm25": 40.0}}
+
+    async def test_fused_entries_local_copy_is_full(self):
+        """Test the local copy of a fused write is a full entry; AQI-less points are skipped."""
+        cache = make_cache()
+        location = Location(latitude=21.0285, longitude=105.8542)
+        points = [
+            FusedDataPoint(location=location, timestamp=datetime(2024, 1, 1), fused_pm25=40.0, fused_aqi=112),
+            FusedDataPoint(location=Location(latitude=10.0, longitude=106.0), timestamp=datetime(2024, 1, 1)),
+        ]
+
+        entries = fused_aqi_entries(points, "2024-01-01T00:00:00")
+        await cache.set_aqi_many(entries, FUSION_CACHE_RADIUS_KM)
+        local = cache._local_aqi.get(cache._make_aqi_key(21.0285, 105.8542, FUSION_CACHE_RADIUS_KM))
+
+        assert len(entries) == 1
+        assert orjson.loads(local)["level"] == "UNHEALTHY_SENSITIVE"
+
+    async def test_consumer_entry_is_a_full_result(self):
+        """Test entries cached by the satellite consumer serve /aqi/current."""
+        pytest.importorskip("aio_pika")
+        from src.infrastructure.messaging.event_consumers import SatelliteDataConsumer
+
+        class SensorClient:
+            async def get_recent_readings(self, **kwargs):
+                return [SimpleNamespace(latitude=21.0285, longitude=105.8542, pm25=40.0, pm10=60.0)]
+
+        service = self.make_service()
+        consumer = SatelliteDataConsumer("amqp://unused", SensorClient(), service.cache)
+        await consumer._process_satellite_data(
+            {
+                "source": "sentinel5p",
+                "grid_cells": [{"lat": 21.03, "lon": 105.85}],
+                "observation_time": "2024-01-01T12:00:00",
+            }
+        )
+        query = GetCurrentAQIQuery(latitude=21.0285, longitude=105.8542)
+
+        result = await service.get_current_aqi(query)
+        payload = orjson.loads(await service.get_current_aqi_raw(query))
+
+        assert (result.aqi_value, result.level) == (111, "UNHEALTHY_SENSITIVE")
+        assert result.data_source == "fusion"
+        assert payload["pollutants"] == {"concentrations": {"pm25": 40.0, "pm10": 60.0}}
+
+
+class TestForecastCache:
+    """Tests for forecast caching in columnar form."""
+
+    async def test_dataclass_round_trip(self):
+        """Test a cached forecast rebuilds into an equal result."""
+        cache = make_cache()
+        service = AirQualityApplicationService(
+            aqi_calculator=AQICalculator(),
+            prediction_service=PredictionService(),
+            cache=cache,
+            google_client=None,
+        )
+        result = GetForecastResult(
+            location_lat=21.0285,
+            location_lng=105.8542,
+            generated_at=datetime(2024, 1, 1, 12, 0, 0, 123456),
+            forecast_hours=2,
+            current_aqi=80,
+            data_points=[
+                ForecastDataPoint(
+                    timestamp=datetime(2024, 1, 1, 13, 0),
+                    predicted_aqi=85,
+                    min_aqi=70,
+                    max_aqi=100,
+                    confidence=0.9,
+                    trend="WORSENING",
+                    level="MODERATE",
+                )
+            ],
+            average_aqi=85,
+            max_aqi=85,
+        )
+
+        await cache.set_forecast(21.0285, 105.8542, 2, service._forecast_to_cache(result))
+        cached = await cache.get_forecast(21.0285, 105.8542, 2)
+
+        assert "summary" not in cached
+        assert cached["points"]["ts"] == [1_704_114_000_000_000]
+        assert service._forecast_result_from_cache(cached) == result
+
+    async def test_legacy_entry_is_a_miss(self):
+        """Test entries cached with per-point dicts are recomputed."""
+        cache = make_cache()
+        service = AirQualityApplicationService(
+            aqi_calculator=AQICalculator(),
+            prediction_service=PredictionService(),
+            cache=cache,
+            google_client=None,
+        )
+        await cache.set_forecast(
+            21.0285, 105.8542, 12, {"forecast_hours": 12, "data_points": [], "current_aqi": -1}
+        )
+
+        result = await service.get_forecast(
+            GetForecastQuery(latitude=21.0285, longitude=105.8542, hours=12)
+        )
+
+        assert result.current_aqi != -1
+        assert "points" in await cache.get_forecast(21.0285, 105.8542, 12)
+
+    async def test_reads_parse_undecoded_bytes(self):
+        """Test JSON entries are read through the binary client."""
+        cache = make_cache()
+        await cache.set_forecast(21.0285, 105.8542, 24, {"forecast_hours": 24})
+        await cache.set_aqi(21.0285, 105.8542, 10.0, {"aqi_value": 80})
+        cache._local_aqi.clear()
+        writes = cache._client.round_trips
+
+        assert await cache.get_forecast(21.0285, 105.8542, 24) == {"forecast_hours": 24}
+        assert await cache.get_aqi(21.0285, 105.8542, 10.0) == {"aqi_value": 80}
+        assert (cache._client.round_trips, cache._raw_client.round_trips) == (writes, 2)
+
+    async def test_nearby_locations_share_entry(self):
+        """Test requests within the same ~5 km cell hit the same entry."""
+        cache = make_cache()
+        await cache.set_forecast(21.0285, 105.8542, 24, {"forecast_hours": 24})
+
+        assert await cache.get_forecast(21.0290, 105.8550, 24) == {"forecast_hours": 24}
+        assert await cache.get_forecast(21.0290, 105.8550, 12) is None
+        assert await cache.get_forecast(21.5, 105.8542, 24) is None
+
+    async def test_hit_reports_requested_location(self):
+        """Test a shared forecast entry is returned at the caller's location."""
+        cache = make_cache()
+        service = AirQualityApplicationService(
+            aqi_calculator=AQICalculator(),
+            prediction_service=PredictionService(),
+            cache=cache,
+            google_client=None,
+        )
+        stored = GetForecastResult(
+            location_lat=21.0285,
+            location_lng=105.8542,
+            generated_at=datetime(2024, 1, 1, 12, 0),
+            forecast_hours=24,
+            current_aqi=80,
+        )
+        await cache.set_forecast(21.0285, 105.8542, 24, service._forecast_to_cache(stored))
+
+        result = await service.get_forecast(
+            GetForecastQuery(latitude=21.0290, longitude=105.8550, hours=24)
+        )
+
+        assert (result.location_lat, result.location_lng) == (21.0290, 105.8550)
+        assert result.current_aqi == 80
@@ -0,0 +1,45 @@
+"""Unit tests for the sensor spatial index."""
+import numpy as np
+
+from src.domain.services.sensor_index import SensorSpatialIndex
+
+
+class TestSensorSpatialIndex:
+    """Tests for SensorSpatialIndex.query_radius()."""
+
+    def test_query_radius_per_point(self):
+        """Test each query point gets only the sensors in range."""
+        index = SensorSpatialIndex(
+            np.array([21.0, 21.01, 21.5]),
+            np.array([105.0, 105.0, 105.5]),
+        )
+
+        hits = index.query_radius(np.array([21.0, 21.5]), np.array([105.0, 105.5]), 5.0)
+
+        assert sorted(hits[0].tolist()) == [0, 1]
+        assert hits[1].tolist() == [2]
+
+    def test_radius_is_in_kilometres(self):
+        """Test a sensor ~11 km away is excluded at 10 km and found at 12 km."""
+        index = SensorSpatialIndex(np.array([21.1]), np.array([105.0]))
+
+        assert index.query_radius(np.array([21.0]), np.array([105.0]), 10.0)[0].size == 0
+        assert index.query_radius(np.array([21.0]), np.array([105.0]), 12.0)[0].size == 1
+
+    def test_radius_per_query_point(self):
+        """Test each query point can search with its own radius."""
+        index = SensorSpatialIndex(np.array([21.1, 22.1]), np.array([105.0, 105.0]))
+
+        hits = index.query_radius(
+            np.array([21.0, 22.0]), np.array([105.0, 105.0]), np.array([12.0, 10.0])
+        )
+
+        assert [h.tolist() for h in hits] == [[0], []]
+
+    def test_empty_index(self):
+        """Test an empty index returns an empty hit list per point."""
+        index = SensorSpatialIndex(np.empty(0), np.empty(0))
+
+        hits = index.query_radius(np.array([21.0, 22.0]), np.array([105.0, 106.0]), 5.0)
+
+        assert [h.size for h in hits] == [0, 0]
@@ -0,0 +1,48 @@
+"""Unit tests for the Sensor Service client."""
+import httpx
+
+from src.infrastructure.external.sensor_service_client import SensorServiceClient
+
+
+def make_client(handler) -> SensorServiceClient:
+    client = SensorServiceClient(base_url="http://sensor-service")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+class TestReadingsInBbox:
+    """Tests for get_readings_in_bbox() endpoint detection."""
+
+    async def test_missing_endpoint_remembered(self):
+        """Test a 404 is not re-requested until the retry interval passes."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(404)
+
+        client = make_client(handler)
+
+        assert await client.get_readings_in_bbox(21.0, 105.8, 21.1, 105.9) is None
+        assert await client.get_readings_in_bbox(21.0, 105.8, 21.1, 105.9) is None
+        assert len(requests) == 1
+
+        client._bbox_unsupported_until = 0.0
+        assert await client.get_readings_in_bbox(21.0, 105.8, 21.1, 105.9) is None
+        assert len(requests) == 2
+
+    async def test_server_errors_not_remembered(self):
+        """Test other failures return no readings and are retried."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(503)
+
+        client = make_client(handler)
+
+        assert await client.get_readings_in_bbox(21.0, 105.8, 21.1, 105.9) == []
+        assert await client.get_readings_in_bbox(21.0, 105.8, 21.1, 105.9) == []
+        assert len(requests) == 2
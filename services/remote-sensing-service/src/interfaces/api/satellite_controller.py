@@ -10,6 +10,7 @@ from datetime import date, datetime
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from openpyxl.utils import get_column_letter
 
 from ...application.services.satellite_data_service import SatelliteDataService
 from ...domain.value_objects.geo_polygon import GeoPolygon
@@ -398,8 +399,8 @@ async def download_excel_template(template_id: str):
         
         # Add instructions row at the top
         worksheet.insert_rows(1)
-        worksheet.merge_cells(f"A1:{chr(64 + len(template['columns']))}1")
-        cell = worksheet["A1"]
+        worksheet.merge_cells(f"A1:{get_column_letter(len(template['columns']))}1")
+        cell = worksheet.cell(row=1, column=1)
         cell.value = f"Template: {template['name']} - Fill in your data below. Keep column names unchanged."
         cell.font = cell.font.copy(bold=True, color="FF0066CC")
     